@@ -17,126 +17,2089 @@ License: MIT
 """
 
 import requests
-from bs4 import BeautifulSoup
-import pandas as pd
+import soupsieve
+from bs4 import BeautifulSoup, SoupStrainer
 import sqlite3
 import json
+import csv
+import hashlib
+import zlib
 import logging
-import schedule
 import time
 import smtplib
-from email.mime.text import MimeText
-from email.mime.multipart import MimeMultipart
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, WebDriverException
+from email.mime.text import MIMEText
+from email.mime.multipart import MIMEMultipart
 import os
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any
+import sys
+import argparse
+import socket
+import uuid
+import bisect
+import heapq
+import multiprocessing
+import http.server
+import queue
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from collections import OrderedDict
+from functools import lru_cache
+from datetime import datetime, timedelta, timezone
+from contextlib import contextmanager
+from typing import Dict, List, Optional, Any, Callable, Iterator, Tuple, TYPE_CHECKING
+from urllib.parse import urlparse, urljoin, urlencode, parse_qsl, urlunparse
+import re
 import warnings
+
+# selenium은 시작 시간을 줄이기 위해 실제로 사용할 때 가져옴
+if TYPE_CHECKING:
+    from selenium import webdriver
 warnings.filterwarnings('ignore')
 
+# 기본 파서는 기존 추출 결과와 같도록 html.parser (lxml은 general_settings.parser로 선택,
+# 더 빠르지만 잘못된 HTML에서는 추출 값이 달라질 수 있음)
+DEFAULT_PARSER = 'html.parser'
+
+try:
+    from lxml import etree as lxml_etree
+except ImportError:
+    lxml_etree = None
+
+# 스트리밍 다운로드 기본값
+DEFAULT_MAX_DOWNLOAD_BYTES = 10 * 1024 * 1024
+DEFAULT_CONTENT_TYPES = ('text/html', 'application/xhtml+xml', 'application/xml', 'text/xml', 'text/plain')
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+# 지문(hash_value) 계산에서 제외하는 메타 필드
+RECORD_META_FIELDS = ('website_name', 'url', 'scraped_at', 'hash_value', 'status', 'is_new', 'changes', 'items', 'new_items',
+                      'row_id', 'fetched_at')
+
+# scraping_results에 컬럼으로 저장되는 필드 (나머지는 extra 컬럼에 JSON으로 저장)
+RESULT_FIELDS = ('title', 'content', 'price')
+
+def compute_fingerprint(website_name: str, fields: Dict[str, Any]) -> str:
+    """추출 필드의 안정적인 지문 생성 (blake2b, 프로세스 재시작과 무관)
+
+    공백을 정규화하고 빈 필드는 건너뛰므로 필드 순서나 누락된 선택자에 영향받지 않습니다.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(website_name.encode('utf-8'))
+    for name in sorted(fields):
+        if name in RECORD_META_FIELDS:
+            continue
+        value = ' '.join(str(fields[name] or '').split())
+        if value:
+            digest.update(b'\x00' + name.encode('utf-8') + b'\x01' + value.encode('utf-8'))
+    return digest.hexdigest()
+
+@lru_cache(maxsize=1024)
+def compile_selector(selector: str):
+    """CSS 선택자 컴파일 (선택자 문자열별로 캐시)"""
+    return soupsieve.compile(selector)
+
+# 부분 파싱에 쓸 수 있는 선택자: 태그/클래스/ID 조합을 공백 또는 '>'로 연결한 형태
+_SIMPLE_COMPOUND = r'(?:[a-zA-Z][\w-]*)?(?:[.#][\w-]+)*'
+_SIMPLE_SELECTOR_RE = re.compile(rf'^\s*({_SIMPLE_COMPOUND})(?:\s*>\s*{_SIMPLE_COMPOUND}|\s+{_SIMPLE_COMPOUND})*\s*$')
+_COMPOUND_PART_RE = re.compile(r'([.#]?)([\w-]+)')
+
+def _parse_compound(compound: str) -> Optional[Dict[str, Any]]:
+    """'div.item#main' 형태의 단순 선택자를 태그/클래스/ID 조건으로 분해"""
+    if not compound:
+        return None
+    rule: Dict[str, Any] = {'name': None, 'classes': set(), 'id': None}
+    for prefix, value in _COMPOUND_PART_RE.findall(compound):
+        if prefix == '.':
+            rule['classes'].add(value)
+        elif prefix == '#':
+            rule['id'] = value
+        else:
+            rule['name'] = value.lower()
+    return rule
+
+class SelectorStrainer(SoupStrainer):
+    """선택자 첫 단계(태그/클래스/ID)와 일치하는 최상위 요소만 남기는 SoupStrainer
+
+    bs4 4.12(search_tag)와 4.13 이상(allow_tag_creation)의 파싱 훅을 모두 구현합니다.
+    """
+
+    def __init__(self, rules: List[Dict[str, Any]]):
+        super().__init__()
+        self.rules = rules
+
+    def matches_start_tag(self, name: str, attrs: Any) -> bool:
+        attrs = dict(attrs or {})
+        classes = attrs.get('class') or []
+        if isinstance(classes, str):
+            classes = classes.split()
+        for rule in self.rules:
+            if rule['name'] and rule['name'] != name:
+                continue
+            if rule['id'] and attrs.get('id') != rule['id']:
+                continue
+            if rule['classes'] and not rule['classes'].issubset(classes):
+                continue
+            return True
+        return False
+
+    def search_tag(self, markup_name=None, markup_attrs={}):
+        if hasattr(markup_name, 'attrs'):
+            return markup_name if self.matches_start_tag(markup_name.name, markup_name.attrs) else None
+        return markup_name if self.matches_start_tag(markup_name, markup_attrs) else None
+
+    def allow_tag_creation(self, nsprefix, name, attrs) -> bool:
+        return self.matches_start_tag(name, attrs)
+
+    def allow_string_creation(self, string) -> bool:
+        return False
+
+    def search(self, markup):
+        # bs4 4.12: 최상위 문자열은 버림
+        if isinstance(markup, str):
+            return None
+        return super().search(markup)
+
+class DownloadRejected(Exception):
+    """다운로드 거부 (허용되지 않는 Content-Type, 크기 제한 초과) - 재시도하지 않음"""
+
+class EarlyStopDetector:
+    """스트리밍 다운로드 중 모든 선택자의 첫 일치 요소가 닫혔는지 확인하는 클래스
+
+    lxml 증분 파서에 받은 조각을 바로 넣어 검사하므로, 필요한 요소가 모두 나온 뒤의
+    나머지 본문은 받지 않아도 됩니다. select_one 결과가 같음을 보장할 수 있도록
+    결합자 없는 단순 선택자(태그/클래스/ID, 쉼표 목록)일 때만 사용합니다.
+    """
+
+    def __init__(self, rule_groups: List[List[Dict[str, Any]]]):
+        self.rule_groups = rule_groups
+        self.first_matches: List[Any] = [None] * len(rule_groups)
+        self.closed = [False] * len(rule_groups)
+        self.parser = lxml_etree.HTMLPullParser(events=('start', 'end'))
+
+    @classmethod
+    def for_selectors(cls, selectors: Dict[str, str]) -> Optional['EarlyStopDetector']:
+        """조기 종료가 가능한 선택자이면 검사기 생성 (아니면 None)"""
+        if lxml_etree is None or not selectors:
+            return None
+        rule_groups = []
+        for selector_list in selectors.values():
+            rules = []
+            for selector in str(selector_list).split(','):
+                selector = selector.strip()
+                if not selector or not re.fullmatch(_SIMPLE_COMPOUND, selector):
+                    return None
+                rules.append(_parse_compound(selector))
+            rule_groups.append(rules)
+        return cls(rule_groups)
+
+    @staticmethod
+    def _matches(rule: Dict[str, Any], element: Any) -> bool:
+        if rule['name'] and rule['name'] != element.tag:
+            return False
+        if rule['id'] and element.get('id') != rule['id']:
+            return False
+        if rule['classes'] and not rule['classes'].issubset((element.get('class') or '').split()):
+            return False
+        return True
+
+    def feed(self, chunk: bytes) -> bool:
+        """조각 하나를 파싱하고, 모든 선택자의 첫 일치 요소가 닫혔으면 True"""
+        self.parser.feed(chunk)
+        for event, element in self.parser.read_events():
+            if event == 'start':
+                for index, rules in enumerate(self.rule_groups):
+                    if self.first_matches[index] is None and any(self._matches(rule, element) for rule in rules):
+                        self.first_matches[index] = element
+                continue
+            
+            for index, first in enumerate(self.first_matches):
+                if first is element:
+                    self.closed[index] = True
+            if all(self.closed):
+                return True
+            # 검사가 끝난 요소의 하위 트리는 버려 메모리를 일정하게 유지
+            if not any(first is element for first in self.first_matches):
+                element.clear(keep_tail=True)
+        return False
+
+@lru_cache(maxsize=256)
+def build_parse_strainer(selectors: tuple) -> Optional[SoupStrainer]:
+    """선택자의 첫 단계와 일치하는 요소의 하위 트리만 파싱하는 SoupStrainer 생성
+
+    결과가 전체 파싱과 달라질 수 있는 선택자(형제 결합자, 의사 클래스, 속성 선택자 등)가
+    하나라도 있으면 None을 반환합니다 (전체 파싱).
+    """
+    rules = []
+    for selector_list in selectors:
+        for selector in str(selector_list).split(','):
+            match = _SIMPLE_SELECTOR_RE.match(selector)
+            rule = _parse_compound(match.group(1)) if match else None
+            if rule is None:
+                return None
+            rules.append(rule)
+    if not rules:
+        return None
+
+    return SelectorStrainer(rules)
+
+def parse_html(markup: Any, parser: str = DEFAULT_PARSER, parse_mode: str = 'full',
+               selectors: Optional[Dict[str, str]] = None) -> BeautifulSoup:
+    """HTML 파싱 (parse_mode='partial'이면 선택자에 필요한 하위 트리만 파싱)
+
+    html.parser는 조상 요소가 걸러지면 닫히지 않은 태그를 다르게 닫아 결과가 전체 파싱과
+    달라질 수 있으므로, 부분 파싱은 lxml에서만 적용하고 그 외 파서는 전체 파싱합니다.
+    """
+    parse_only = None
+    if parse_mode == 'partial' and selectors and parser == 'lxml':
+        parse_only = build_parse_strainer(tuple(selectors.values()))
+    return BeautifulSoup(markup, parser, parse_only=parse_only)
+
+def select_items(soup: BeautifulSoup, item_selector: str, selectors: Dict[str, str],
+                 max_items: Optional[int] = None) -> List[Dict[str, str]]:
+    """item_selector와 일치하는 항목마다 상대 선택자로 필드 추출 (빈 항목 제외)"""
+    items = []
+    for container in compile_selector(item_selector).select(soup, limit=max_items or 0):
+        fields = select_fields(container, selectors)
+        if any(fields.values()):
+            items.append(fields)
+    return items
+
+def select_fields(soup: BeautifulSoup, selectors: Dict[str, str]) -> Dict[str, str]:
+    """컴파일된 선택자로 필드별 텍스트 추출"""
+    fields = {}
+    for field, selector in selectors.items():
+        try:
+            element = compile_selector(selector).select_one(soup)
+            if element:
+                fields[field] = element.get_text(strip=True)
+            else:
+                fields[field] = ""
+        except Exception as e:
+            logging.warning(f"요소 추출 실패 {field}: {e}")
+            fields[field] = ""
+    return fields
+
+def extract_record(soup: BeautifulSoup, website_config: Dict[str, Any]) -> Dict[str, Any]:
+    """파싱된 페이지에서 레코드 추출 (목록 모드는 항목별 레코드를 'items'에 담아 반환)"""
+    selectors = website_config['selectors']
+    data = {
+        'website_name': website_config['name'],
+        'url': website_config['url'],
+        'scraped_at': datetime.now().isoformat()
+    }
+    
+    if website_config.get('mode') == 'list':
+        data['items'] = []
+        for fields in select_items(soup, website_config['item_selector'], selectors, website_config.get('max_items')):
+            item = dict(data, **fields)
+            item['hash_value'] = compute_fingerprint(data['website_name'], fields)
+            data['items'].append(item)
+        return data
+    
+    data.update(select_fields(soup, selectors))
+    
+    # 데이터 지문 생성 (중복 검사용)
+    data['hash_value'] = compute_fingerprint(data['website_name'], {field: data[field] for field in selectors})
+    
+    return data
+
+def parse_and_extract(markup: Any, website_config: Dict[str, Any], parser: str = DEFAULT_PARSER,
+                      parse_mode: str = 'full', parse_selectors: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+    """HTML 파싱 + 레코드 추출 (ParsePool 작업 프로세스에서 실행)"""
+    soup = parse_html(markup, parser, parse_mode, parse_selectors)
+    return extract_record(soup, website_config)
+
+def parse_chunk(tasks: List[tuple]) -> List[Any]:
+    """여러 페이지를 한 번에 처리 (실패한 페이지는 예외 객체로 반환)"""
+    results = []
+    for args in tasks:
+        try:
+            results.append(parse_and_extract(*args))
+        except Exception as e:
+            results.append(e)
+    return results
+
+class MetricsRegistry:
+    """카운터/히스토그램/게이지 수집 클래스 (Prometheus 텍스트 형식 및 JSON 스냅샷 제공)
+
+    기록은 잠금 한 번과 딕셔너리 갱신뿐이라 운영 중 항상 켜 두어도 부담이 적습니다.
+    """
+
+    LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+    SIZE_BUCKETS = (1, 5, 10, 25, 50, 100, 250, 500, 1000)
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.counters: Dict[tuple, float] = {}
+        self.histograms: Dict[tuple, List[float]] = {}
+        self.buckets: Dict[str, tuple] = {}
+        self.gauges: Dict[tuple, Callable[[], float]] = {}
+
+    @staticmethod
+    def _key(name: str, labels: Dict[str, Any]) -> tuple:
+        return name, tuple(sorted((key, str(value)) for key, value in labels.items()))
+
+    def inc(self, name: str, value: float = 1.0, **labels):
+        """카운터 증가"""
+        key = self._key(name, labels)
+        with self._lock:
+            self.counters[key] = self.counters.get(key, 0.0) + value
+
+    def observe(self, name: str, value: float, buckets: tuple = LATENCY_BUCKETS, **labels):
+        """히스토그램에 값 기록 (버킷은 지표 이름별로 처음 기록할 때 고정)"""
+        key = self._key(name, labels)
+        with self._lock:
+            bounds = self.buckets.setdefault(name, buckets)
+            values = self.histograms.get(key)
+            if values is None:
+                # 버킷별 개수 + (+Inf, 합계, 개수)
+                values = self.histograms[key] = [0.0] * (len(bounds) + 3)
+            values[bisect.bisect_left(bounds, value)] += 1
+            values[-2] += value
+            values[-1] += 1
+
+    @contextmanager
+    def timer(self, name: str, **labels):
+        """블록 실행 시간을 히스토그램에 기록"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - started, **labels)
+
+    def register_gauge(self, name: str, func: Callable[[], float], **labels):
+        """조회 시점에 값을 계산하는 게이지 등록 (대기열 길이 등)"""
+        with self._lock:
+            self.gauges[self._key(name, labels)] = func
+
+    def _read_gauges(self, gauges: Dict[tuple, Callable[[], float]]) -> Dict[tuple, float]:
+        values = {}
+        for key, func in gauges.items():
+            try:
+                values[key] = float(func())
+            except Exception:
+                continue
+        return values
+
+    def snapshot(self) -> Dict[str, Any]:
+        """현재 지표를 JSON 직렬화 가능한 딕셔너리로 반환"""
+        with self._lock:
+            counters = dict(self.counters)
+            histograms = {key: list(values) for key, values in self.histograms.items()}
+            gauges = dict(self.gauges)
+        
+        snapshot = {'timestamp': datetime.now().isoformat(), 'counters': [], 'histograms': [], 'gauges': []}
+        for (name, labels), value in sorted(counters.items()):
+            snapshot['counters'].append({'name': name, 'labels': dict(labels), 'value': value})
+        for (name, labels), values in sorted(histograms.items()):
+            bounds = self.buckets[name]
+            snapshot['histograms'].append({
+                'name': name,
+                'labels': dict(labels),
+                'count': values[-1],
+                'sum': values[-2],
+                'buckets': {str(bound): count for bound, count in zip(bounds + ('+Inf',), values[:-2])}
+            })
+        for (name, labels), value in sorted(self._read_gauges(gauges).items()):
+            snapshot['gauges'].append({'name': name, 'labels': dict(labels), 'value': value})
+        return snapshot
+
+    @staticmethod
+    def _format_labels(labels: tuple, extra: Optional[tuple] = None) -> str:
+        items = list(labels) + ([extra] if extra else [])
+        if not items:
+            return ''
+        escaped = (
+            key + '="' + value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n') + '"'
+            for key, value in items
+        )
+        return '{' + ','.join(escaped) + '}'
+
+    def render_prometheus(self) -> str:
+        """Prometheus 텍스트 형식으로 출력"""
+        with self._lock:
+            counters = dict(self.counters)
+            histograms = {key: list(values) for key, values in self.histograms.items()}
+            gauges = dict(self.gauges)
+        
+        lines = []
+        typed = set()
+        for (name, labels), value in sorted(counters.items()):
+            if name not in typed:
+                lines.append(f'# TYPE {name} counter')
+                typed.add(name)
+            lines.append(f'{name}{self._format_labels(labels)} {value}')
+        for (name, labels), values in sorted(histograms.items()):
+            if name not in typed:
+                lines.append(f'# TYPE {name} histogram')
+                typed.add(name)
+            cumulative = 0.0
+            for bound, count in zip(self.buckets[name] + ('+Inf',), values[:-2]):
+                cumulative += count
+                lines.append(f'{name}_bucket{self._format_labels(labels, ("le", str(bound)))} {cumulative}')
+            lines.append(f'{name}_sum{self._format_labels(labels)} {values[-2]}')
+            lines.append(f'{name}_count{self._format_labels(labels)} {values[-1]}')
+        for (name, labels), value in sorted(self._read_gauges(gauges).items()):
+            if name not in typed:
+                lines.append(f'# TYPE {name} gauge')
+                typed.add(name)
+            lines.append(f'{name}{self._format_labels(labels)} {value}')
+        return '\n'.join(lines) + '\n'
+
+# 프로세스 전역 지표 (모든 단계에서 공유)
+METRICS = MetricsRegistry()
+
+class FingerprintCache:
+    """웹사이트별 최근 지문 LRU 캐시 클래스 (DB 조회 없이 중복 거부)"""
+
+    def __init__(self, max_per_site: int = 256):
+        self.max_per_site = max(1, max_per_site)
+        self._sites: Dict[str, OrderedDict] = {}
+        self._lock = threading.Lock()
+
+    def contains(self, website_name: str, fingerprint: str) -> bool:
+        """최근 지문 여부 확인"""
+        if not fingerprint:
+            return False
+        with self._lock:
+            recent = self._sites.get(website_name)
+            if recent is None or fingerprint not in recent:
+                return False
+            recent.move_to_end(fingerprint)
+            return True
+
+    def add(self, website_name: str, fingerprint: str):
+        """지문 추가 (사이트별 최대 개수 초과 시 오래된 것부터 제거)"""
+        if not fingerprint:
+            return
+        with self._lock:
+            recent = self._sites.setdefault(website_name, OrderedDict())
+            recent[fingerprint] = True
+            recent.move_to_end(fingerprint)
+            while len(recent) > self.max_per_site:
+                recent.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._sites.clear()
+
+class ContentCodec:
+    """큰 텍스트 필드(content/extra)의 투명 압축
+
+    min_bytes 이상인 값만 zlib으로 압축해 BLOB으로 저장하고, 읽을 때 자동으로 풀어 줍니다.
+    사이트마다 처음 저장되는 dictionary_samples개의 값으로 사전(zdict)을 만들어
+    compression_dicts 테이블에 두고 이후 값은 그 사전으로 압축합니다. 같은 틀의 페이지가
+    반복되는 사이트에서는 짧은 본문도 잘 줄어듭니다. 압축 값은 MAGIC 1바이트와 사전 번호
+    4바이트(0은 사전 없음)로 시작합니다.
+    """
+    
+    MAGIC = b'Z'
+    HEADER_SIZE = 5
+    
+    def __init__(self, settings: Dict[str, Any]):
+        self.enabled = settings.get('compress', True)
+        self.min_bytes = settings.get('compress_min_bytes', 256)
+        self.level = settings.get('compress_level', 6)
+        self.dictionary_size = settings.get('dictionary_size', 32768)
+        self.dictionary_samples = settings.get('dictionary_samples', 20)
+        self._lock = threading.Lock()
+        self._dictionaries: Dict[int, bytes] = {}
+        self._site_dictionaries: Dict[str, int] = {}
+        self._samples: Dict[str, List[bytes]] = {}
+    
+    def load(self, conn: sqlite3.Connection):
+        """저장된 사이트별 최신 사전 불러오기 (롤백된 쓰기에서 만든 사전은 버림)"""
+        rows = conn.execute('SELECT id, website_name, dictionary FROM compression_dicts ORDER BY id').fetchall()
+        with self._lock:
+            self._dictionaries.clear()
+            self._site_dictionaries.clear()
+            for dict_id, website_name, dictionary in rows:
+                self._dictionaries[dict_id] = dictionary
+                self._site_dictionaries[website_name] = dict_id
+    
+    def encode(self, cursor: sqlite3.Cursor, website_name: str, value: Any) -> Any:
+        """값 압축 (압축 대상이 아니거나 줄어들지 않으면 원래 값 반환)"""
+        if not self.enabled or not isinstance(value, str):
+            return value
+        raw = value.encode('utf-8')
+        if len(raw) < self.min_bytes:
+            return value
+        
+        dict_id = self._dictionary_for(cursor, website_name, raw)
+        compressor = zlib.compressobj(self.level, zdict=self._dictionaries[dict_id]) if dict_id else zlib.compressobj(self.level)
+        compressed = compressor.compress(raw) + compressor.flush()
+        if len(compressed) + self.HEADER_SIZE >= len(raw):
+            return value
+        return self.MAGIC + dict_id.to_bytes(4, 'big') + compressed
+    
+    def decode(self, value: Any, conn: sqlite3.Connection) -> Any:
+        """압축 값이면 풀어서 문자열로 반환 (conn: 모르는 사전을 읽어 올 연결)"""
+        if not isinstance(value, bytes) or value[:1] != self.MAGIC:
+            return value
+        dict_id = int.from_bytes(value[1:self.HEADER_SIZE], 'big')
+        if dict_id:
+            zdict = self._dictionaries.get(dict_id)
+            if zdict is None:
+                # 다른 프로세스가 만든 사전
+                row = conn.execute('SELECT dictionary FROM compression_dicts WHERE id = ?', (dict_id,)).fetchone()
+                if row is None:
+                    raise ValueError(f"압축 사전을 찾을 수 없습니다: {dict_id}")
+                zdict = self._dictionaries[dict_id] = row[0]
+            decompressor = zlib.decompressobj(zdict=zdict)
+        else:
+            decompressor = zlib.decompressobj()
+        return (decompressor.decompress(value[self.HEADER_SIZE:]) + decompressor.flush()).decode('utf-8')
+    
+    def _dictionary_for(self, cursor: sqlite3.Cursor, website_name: str, raw: bytes) -> int:
+        """사이트 사전 번호 (표본이 모이기 전에는 0, 모이면 사전을 만들어 저장)"""
+        with self._lock:
+            dict_id = self._site_dictionaries.get(website_name)
+            if dict_id is not None or self.dictionary_samples <= 0:
+                return dict_id or 0
+            
+            # 다른 프로세스가 이미 만든 사전이 있으면 공유
+            row = cursor.execute(
+                'SELECT id, dictionary FROM compression_dicts WHERE website_name = ? ORDER BY id DESC LIMIT 1',
+                (website_name,)
+            ).fetchone()
+            if row is None:
+                samples = self._samples.setdefault(website_name, [])
+                samples.append(raw[:self.dictionary_size])
+                if len(samples) < self.dictionary_samples:
+                    return 0
+                # zlib은 사전 뒤쪽 문자열을 더 짧게 참조하므로 최근 표본을 뒤에 둠
+                dictionary = b''.join(samples)[-self.dictionary_size:]
+                cursor.execute('INSERT INTO compression_dicts (website_name, dictionary) VALUES (?, ?)',
+                               (website_name, dictionary))
+                row = (cursor.lastrowid, dictionary)
+                del self._samples[website_name]
+                logging.info(f"압축 사전 생성: {website_name} ({len(dictionary)}바이트)")
+            
+            self._dictionaries[row[0]] = row[1]
+            self._site_dictionaries[website_name] = row[0]
+            return row[0]
+
+# FTS5 검색식의 연산자 (스니펫 위치를 찾을 때 제외)
+SEARCH_OPERATORS = ('AND', 'OR', 'NOT', 'NEAR')
+
+def make_snippet(text: Optional[str], query: str, width: int = 120) -> str:
+    """검색어가 처음 나오는 위치 주변의 본문 일부"""
+    if not text:
+        return ''
+    terms = [t.rstrip('*').lower() for t in re.findall(r'[\w*]+', query) if t not in SEARCH_OPERATORS]
+    lowered = text.lower()
+    positions = [p for p in (lowered.find(term) for term in terms if term) if p >= 0]
+    start = max(0, min(positions) - width // 4) if positions else 0
+    snippet = ' '.join(text[start:start + width].split())
+    return ('…' if start else '') + snippet + ('…' if start + width < len(text) else '')
+
 class DatabaseManager:
-    """데이터베이스 관리 클래스"""
+    """데이터베이스 관리 클래스
+
+    하나의 연결(WAL 모드)을 유지하고, 쓰기 요청은 백그라운드 쓰기 스레드가
+    batch_size 또는 flush_interval 기준으로 묶어서 하나의 트랜잭션으로 저장합니다.
+    """
     
-    def __init__(self, db_path: str = "scraping_data.db"):
+    RESULT_COLUMNS = ('id', 'website_name', 'url', 'title', 'content', 'price', 'scraped_at', 'hash_value', 'extra')
+    
+    # ContentCodec으로 압축해 저장하는 컬럼
+    COMPRESSED_COLUMNS = ('content', 'extra')
+    
+    # 데이터 정리 단계 사이에 쓰기 스레드에 양보하는 시간 (초)
+    COMPACTION_PAUSE = 0.01
+    
+    # 검색 순위에서 제목 일치의 가중치 (본문 1 기준)
+    SEARCH_TITLE_WEIGHT = 5.0
+    
+    # results_fts는 내용을 저장하지 않는 색인이라(본문은 압축 저장) 삭제할 때 원래 값을 넘겨야 함
+    INSERT_SEARCH_SQL = 'INSERT INTO results_fts (rowid, title, content) VALUES (?, ?, ?)'
+    DELETE_SEARCH_SQL = "INSERT INTO results_fts (results_fts, rowid, title, content) VALUES ('delete', ?, ?, ?)"
+    
+    # fetched_at이 있으면(보관 응답 재추출) 원래 수집 시각으로 저장
+    INSERT_RESULT_SQL = '''
+        INSERT OR IGNORE INTO scraping_results 
+        (website_name, url, title, content, price, hash_value, extra, scraped_at)
+        VALUES (?, ?, ?, ?, ?, ?, ?, COALESCE(?, CURRENT_TIMESTAMP))
+    '''
+    
+    INSERT_CHANGE_SQL = '''
+        INSERT INTO change_log 
+        (website_name, url, field_name, change_type, old_value, new_value)
+        VALUES (?, ?, ?, ?, ?, ?)
+    '''
+    
+    UPSERT_SNAPSHOT_SQL = '''
+        INSERT INTO latest_snapshots (website_name, url, fields, hash_value, updated_at)
+        VALUES (?, ?, ?, ?, CURRENT_TIMESTAMP)
+        ON CONFLICT(website_name) DO UPDATE SET
+            url = excluded.url, fields = excluded.fields,
+            hash_value = excluded.hash_value, updated_at = excluded.updated_at
+    '''
+    
+    def __init__(self, db_path: str = "scraping_data.db", batch_size: int = 100, flush_interval: float = 0.5,
+                 fingerprint_cache_size: int = 256, compression: Optional[Dict[str, Any]] = None):
         self.db_path = db_path
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = max(0.0, flush_interval)
+        self.recent_fingerprints = FingerprintCache(fingerprint_cache_size)
+        self.recent_archive_hashes = FingerprintCache(fingerprint_cache_size)
+        self.codec = ContentCodec(compression or {})
+        self._compressed_through = 0
+        self._lock = threading.RLock()
+        self.conn = self.connect()
         self.init_database()
+        self.codec.load(self.conn)
+        self.search_enabled = self.conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'results_fts'"
+        ).fetchone() is not None
+        
+        self._write_queue: queue.Queue = queue.Queue()
+        self._writer_thread: Optional[threading.Thread] = None
+        self._writer_lock = threading.Lock()
+        METRICS.register_gauge('scraper_queue_depth', self._write_queue.qsize, queue='db_write')
+    
+    def connect(self) -> sqlite3.Connection:
+        """튜닝된 SQLite 연결 생성"""
+        conn = sqlite3.connect(self.db_path, timeout=30, check_same_thread=False, cached_statements=256)
+        # 새 DB는 점진적 VACUUM 모드로 생성 (기존 DB는 vacuum()으로 한 번 변환해야 적용됨)
+        conn.execute('PRAGMA auto_vacuum=INCREMENTAL')
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA synchronous=NORMAL')
+        conn.execute('PRAGMA busy_timeout=30000')
+        conn.execute('PRAGMA temp_store=MEMORY')
+        return conn
     
     def init_database(self):
         """데이터베이스 초기화"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        with self._lock:
+            cursor = self.conn.cursor()
+            
+            # 스크래핑 결과 테이블
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS scraping_results (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    website_name TEXT NOT NULL,
+                    url TEXT NOT NULL,
+                    title TEXT,
+                    content TEXT,
+                    price TEXT,
+                    scraped_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    hash_value TEXT UNIQUE
+                )
+            ''')
+            
+            # 변경 로그 테이블
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS change_log (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    website_name TEXT NOT NULL,
+                    change_type TEXT NOT NULL,
+                    old_value TEXT,
+                    new_value TEXT,
+                    changed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            ''')
+            
+            self.conn.commit()
+        
+        self.migrate()
+    
+    def migrate(self):
+        """스키마 마이그레이션 (PRAGMA user_version 기준으로 순서대로 적용)"""
+        migrations = [
+            self._migration_add_result_indexes,
+            self._migration_stable_fingerprints,
+            self._migration_change_tracking,
+            self._migration_extra_fields,
+            self._migration_crawl_frontier,
+            self._migration_adaptive_state,
+            self._migration_scrape_jobs,
+            self._migration_compression_dicts,
+            self._migration_search_index,
+            self._migration_raw_archive,
+            self._migration_http_validators,
+        ]
+        
+        with self._lock:
+            version = self.conn.execute('PRAGMA user_version').fetchone()[0]
+            for number, migration in enumerate(migrations[version:], start=version + 1):
+                with self.conn:
+                    # 여러 프로세스가 동시에 시작해도 한 번만 적용되도록 쓰기 잠금 후 버전 재확인
+                    self.conn.execute('BEGIN IMMEDIATE')
+                    if self.conn.execute('PRAGMA user_version').fetchone()[0] >= number:
+                        continue
+                    logging.info(f"데이터베이스 마이그레이션 {number}: {migration.__doc__}")
+                    migration(self.conn)
+                    self.conn.execute(f'PRAGMA user_version = {number}')
+    
+    def _migration_add_result_indexes(self, conn: sqlite3.Connection):
+        """scraping_results 조회용 인덱스 추가"""
+        conn.execute('CREATE INDEX IF NOT EXISTS idx_results_scraped_at ON scraping_results (scraped_at)')
+        conn.execute('CREATE INDEX IF NOT EXISTS idx_results_site_scraped_at ON scraping_results (website_name, scraped_at)')
+    
+    def _migration_stable_fingerprints(self, conn: sqlite3.Connection):
+        """hash_value를 안정적인 blake2b 지문으로 재계산 (중복 행 제거)"""
+        last_id = 0
+        updated = 0
+        removed = 0
+        while True:
+            rows = conn.execute(
+                'SELECT id, website_name, title, content, price FROM scraping_results WHERE id > ? ORDER BY id LIMIT 1000',
+                (last_id,)
+            ).fetchall()
+            if not rows:
+                break
+            
+            for row_id, website_name, title, content, price in rows:
+                fingerprint = compute_fingerprint(website_name, {'title': title, 'content': content, 'price': price})
+                try:
+                    conn.execute('UPDATE scraping_results SET hash_value = ? WHERE id = ?', (fingerprint, row_id))
+                    updated += 1
+                except sqlite3.IntegrityError:
+                    # 프로세스마다 달랐던 hash()로 중복 저장된 행
+                    conn.execute('DELETE FROM scraping_results WHERE id = ?', (row_id,))
+                    removed += 1
+            last_id = rows[-1][0]
+        
+        logging.info(f"지문 재계산 완료: {updated}건 갱신, 중복 {removed}건 삭제")
+    
+    def _migration_change_tracking(self, conn: sqlite3.Connection):
+        """필드 단위 변경 추적 (latest_snapshots 테이블, change_log 컬럼/인덱스)"""
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS latest_snapshots (
+                website_name TEXT PRIMARY KEY,
+                url TEXT NOT NULL,
+                fields TEXT NOT NULL,
+                hash_value TEXT,
+                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        ''')
+        conn.execute('ALTER TABLE change_log ADD COLUMN url TEXT')
+        conn.execute('ALTER TABLE change_log ADD COLUMN field_name TEXT')
+        conn.execute('CREATE INDEX IF NOT EXISTS idx_change_log_site_changed_at ON change_log (website_name, changed_at)')
         
-        # 스크래핑 결과 테이블
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS scraping_results (
+        # 사이트별 마지막 결과로 초기 스냅샷 생성
+        rows = conn.execute('''
+            SELECT website_name, url, title, content, price, hash_value FROM scraping_results
+            WHERE id IN (SELECT MAX(id) FROM scraping_results GROUP BY website_name)
+        ''').fetchall()
+        for website_name, url, title, content, price, hash_value in rows:
+            fields = {name: value for name, value in (('title', title), ('content', content), ('price', price)) if value}
+            conn.execute(self.UPSERT_SNAPSHOT_SQL, (website_name, url, json.dumps(fields, ensure_ascii=False), hash_value))
+    
+    def _migration_extra_fields(self, conn: sqlite3.Connection):
+        """title/content/price 이외의 추출 필드를 저장할 extra(JSON) 컬럼 추가"""
+        conn.execute('ALTER TABLE scraping_results ADD COLUMN extra TEXT')
+    
+    def _migration_crawl_frontier(self, conn: sqlite3.Connection):
+        """크롤링 모드용 URL 프론티어 테이블 (정규화 URL 기준 중복 제거)"""
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS crawl_frontier (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                 website_name TEXT NOT NULL,
                 url TEXT NOT NULL,
-                title TEXT,
-                content TEXT,
-                price TEXT,
-                scraped_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                hash_value TEXT UNIQUE
+                normalized_url TEXT NOT NULL,
+                depth INTEGER NOT NULL DEFAULT 0,
+                status TEXT NOT NULL DEFAULT 'pending',
+                discovered_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                fetched_at TIMESTAMP,
+                UNIQUE (website_name, normalized_url)
             )
         ''')
-        
-        # 변경 로그 테이블
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS change_log (
+        conn.execute('CREATE INDEX IF NOT EXISTS idx_frontier_site_status ON crawl_frontier (website_name, status, id)')
+    
+    def _migration_adaptive_state(self, conn: sqlite3.Connection):
+        """적응형 수집 주기 학습 상태 테이블"""
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS adaptive_state (
+                website_name TEXT PRIMARY KEY,
+                interval_seconds REAL NOT NULL,
+                changes REAL NOT NULL DEFAULT 0,
+                observed_seconds REAL NOT NULL DEFAULT 0,
+                checks INTEGER NOT NULL DEFAULT 0,
+                last_checked REAL,
+                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        ''')
+    
+    def _migration_scrape_jobs(self, conn: sqlite3.Connection):
+        """여러 워커가 작업을 나눠 가지는 임대(lease) 기반 작업 테이블"""
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS scrape_jobs (
+                job_name TEXT PRIMARY KEY,
+                next_due REAL NOT NULL,
+                lease_owner TEXT,
+                lease_expires REAL,
+                heartbeat_at REAL,
+                last_started REAL,
+                last_finished REAL,
+                last_status TEXT,
+                runs INTEGER NOT NULL DEFAULT 0
+            )
+        ''')
+        conn.execute('CREATE INDEX IF NOT EXISTS idx_scrape_jobs_due ON scrape_jobs (next_due)')
+    
+    def _migration_compression_dicts(self, conn: sqlite3.Connection):
+        """사이트별 압축 사전 테이블"""
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS compression_dicts (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                 website_name TEXT NOT NULL,
-                change_type TEXT NOT NULL,
-                old_value TEXT,
-                new_value TEXT,
-                changed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                dictionary BLOB NOT NULL,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
             )
         ''')
+        conn.execute('CREATE INDEX IF NOT EXISTS idx_compression_dicts_site ON compression_dicts (website_name, id)')
+    
+    def _migration_search_index(self, conn: sqlite3.Connection):
+        """제목/본문 전문 검색 색인 (FTS5, 기존 행도 색인)"""
+        try:
+            conn.execute('''
+                CREATE VIRTUAL TABLE IF NOT EXISTS results_fts USING fts5(
+                    title, content, content='', prefix='2 3', tokenize='unicode61 remove_diacritics 2'
+                )
+            ''')
+        except sqlite3.OperationalError as e:
+            logging.warning(f"전문 검색을 사용할 수 없습니다 (SQLite FTS5 미지원): {e}")
+            return
         
-        conn.commit()
-        conn.close()
+        last_id = 0
+        indexed = 0
+        while True:
+            rows = conn.execute(
+                'SELECT id, title, content FROM scraping_results WHERE id > ? ORDER BY id LIMIT 1000', (last_id,)
+            ).fetchall()
+            if not rows:
+                break
+            conn.executemany(self.INSERT_SEARCH_SQL, [
+                (row_id, title or '', self.codec.decode(content, conn) or '') for row_id, title, content in rows
+            ])
+            indexed += len(rows)
+            last_id = rows[-1][0]
+        logging.info(f"검색 색인 완료: {indexed}건")
+    
+    def _migration_raw_archive(self, conn: sqlite3.Connection):
+        """원본 응답 보관 테이블 (본문은 해시로 중복 제거해 압축 저장)"""
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS raw_bodies (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                body_hash TEXT NOT NULL UNIQUE,
+                body BLOB NOT NULL,
+                size INTEGER NOT NULL,
+                stored_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        ''')
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS raw_fetches (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                website_name TEXT NOT NULL,
+                url TEXT NOT NULL,
+                body_hash TEXT NOT NULL,
+                fetched_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        ''')
+        conn.execute('CREATE INDEX IF NOT EXISTS idx_raw_fetches_site_fetched_at ON raw_fetches (website_name, fetched_at)')
+        conn.execute('CREATE INDEX IF NOT EXISTS idx_raw_fetches_body_hash ON raw_fetches (body_hash)')
+    
+    def _migration_http_validators(self, conn: sqlite3.Connection):
+        """URL별 HTTP 검증자(ETag/Last-Modified) 테이블 (워커 프로세스 간 공유)"""
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS http_validators (
+                url TEXT PRIMARY KEY,
+                etag TEXT,
+                last_modified TEXT,
+                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        ''')
+    
+    def load_latest_snapshots(self, website_name: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
+        """사이트별 마지막 스냅샷 조회 (website_name 지정 시 해당 사이트만)"""
+        sql = 'SELECT website_name, url, fields, hash_value FROM latest_snapshots'
+        params: tuple = ()
+        if website_name is not None:
+            sql += ' WHERE website_name = ?'
+            params = (website_name,)
+        with self._lock:
+            rows = self.conn.execute(sql, params).fetchall()
+        return {
+            website_name: {'url': url, 'fields': json.loads(fields), 'hash_value': hash_value}
+            for website_name, url, fields, hash_value in rows
+        }
     
     def insert_data(self, data: Dict[str, Any]) -> bool:
-        """데이터 삽입"""
+        """데이터 삽입 (즉시 저장)"""
+        return self.insert_many([data])[0]
+    
+    def insert_many(self, rows: List[Dict[str, Any]]) -> List[bool]:
+        """여러 행을 하나의 트랜잭션으로 삽입 (행별 신규 여부 반환)"""
+        if not rows:
+            return []
+        
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            cursor.execute('''
-                INSERT OR IGNORE INTO scraping_results 
-                (website_name, url, title, content, price, hash_value)
-                VALUES (?, ?, ?, ?, ?, ?)
-            ''', (
-                data['website_name'],
-                data['url'],
-                data.get('title', ''),
-                data.get('content', ''),
-                data.get('price', ''),
-                data.get('hash_value', '')
-            ))
+            with self._lock, self.conn:
+                cursor = self.conn.cursor()
+                results = self._insert_results(cursor, rows)
             
-            conn.commit()
-            success = cursor.rowcount > 0
-            conn.close()
-            return success
+            for data in rows:
+                self.recent_fingerprints.add(data['website_name'], data.get('hash_value', ''))
+            return results
             
         except Exception as e:
             logging.error(f"데이터베이스 삽입 오류: {e}")
+            self._reload_codec()
+            return [False] * len(rows)
+    
+    def _insert_result(self, cursor: sqlite3.Cursor, data: Dict[str, Any]) -> bool:
+        """scraping_results 한 행 삽입 (신규 여부 반환)"""
+        if self.recent_fingerprints.contains(data['website_name'], data.get('hash_value', '')):
             return False
+        extra = {k: v for k, v in data.items() if k not in RECORD_META_FIELDS and k not in RESULT_FIELDS}
+        website_name = data['website_name']
+        cursor.execute(self.INSERT_RESULT_SQL, (
+            website_name,
+            data['url'],
+            data.get('title', ''),
+            self.codec.encode(cursor, website_name, data.get('content', '')),
+            data.get('price', ''),
+            data.get('hash_value', ''),
+            self.codec.encode(cursor, website_name, json.dumps(extra, ensure_ascii=False)) if extra else None,
+            data.get('fetched_at')
+        ))
+        if cursor.rowcount <= 0:
+            return False
+        
+        data['row_id'] = cursor.lastrowid
+        if self.search_enabled:
+            cursor.execute(self.INSERT_SEARCH_SQL, (data['row_id'], data.get('title') or '', data.get('content') or ''))
+        return True
     
-    def get_recent_data(self, hours: int = 24) -> List[Dict]:
-        """최근 데이터 조회"""
+    def _insert_results(self, cursor: sqlite3.Cursor, rows: List[Dict[str, Any]]) -> List[bool]:
+        """여러 행 삽입 (행별 신규 여부 반환)"""
+        return [self._insert_result(cursor, data) for data in rows]
+    
+    def _insert_changes(self, cursor: sqlite3.Cursor, payload: Dict[str, Any]) -> bool:
+        """변경 필드를 change_log에 기록하고 최신 스냅샷 갱신"""
+        data = payload['data']
+        for change in payload['changes']:
+            cursor.execute(self.INSERT_CHANGE_SQL, (
+                data['website_name'],
+                data['url'],
+                change['field'],
+                change['change_type'],
+                change['old_value'],
+                change['new_value']
+            ))
+        cursor.execute(self.UPSERT_SNAPSHOT_SQL, (
+            data['website_name'],
+            data['url'],
+            json.dumps(payload['fields'], ensure_ascii=False),
+            data.get('hash_value', '')
+        ))
+        return bool(payload['changes'])
+    
+    def enqueue_insert(self, data: Dict[str, Any]) -> Future:
+        """쓰기 대기열에 추가 (Future 결과: 신규 행 여부)"""
+        # 최근에 본 지문이면 DB까지 가지 않고 바로 거부
+        if self.recent_fingerprints.contains(data['website_name'], data.get('hash_value', '')):
+            future: Future = Future()
+            future.set_result(False)
+            return future
+        
+        return self._enqueue('result', data)
+    
+    def enqueue_insert_many(self, rows: List[Dict[str, Any]]) -> Future:
+        """여러 행을 한 트랜잭션으로 저장하도록 대기열에 추가 (Future 결과: 행별 신규 여부)"""
+        return self._enqueue('results', rows)
+    
+    def enqueue_changes(self, data: Dict[str, Any], fields: Dict[str, str], changes: List[Dict[str, Any]]) -> Future:
+        """필드 변경 기록을 쓰기 대기열에 추가 (Future 결과: 변경 여부)"""
+        return self._enqueue('changes', {'data': data, 'fields': fields, 'changes': changes})
+    
+    def enqueue_archive(self, website_name: str, url: str, body: bytes, compress_level: int = 6) -> Future:
+        """원본 응답 보관을 쓰기 대기열에 추가 (같은 본문은 한 번만 저장)"""
+        body_hash = hashlib.blake2b(body, digest_size=16).hexdigest()
+        compressed = None
+        if not self.recent_archive_hashes.contains(website_name, body_hash):
+            compressed = zlib.compress(body, compress_level)
+        return self._enqueue('archive', {
+            'website_name': website_name, 'url': url, 'body_hash': body_hash, 'body': compressed, 'size': len(body)
+        })
+    
+    def enqueue_validator(self, url: str, etag: str, last_modified: str) -> Future:
+        """HTTP 검증자 갱신을 쓰기 대기열에 추가 (둘 다 비어 있으면 삭제)"""
+        return self._enqueue('validator', {'url': url, 'etag': etag, 'last_modified': last_modified})
+    
+    def _upsert_validator(self, cursor: sqlite3.Cursor, payload: Dict[str, Any]) -> bool:
+        """http_validators 한 행 갱신"""
+        if not payload['etag'] and not payload['last_modified']:
+            cursor.execute('DELETE FROM http_validators WHERE url = ?', (payload['url'],))
+        else:
+            cursor.execute('''
+                INSERT INTO http_validators (url, etag, last_modified, updated_at)
+                VALUES (?, ?, ?, CURRENT_TIMESTAMP)
+                ON CONFLICT(url) DO UPDATE SET
+                    etag = excluded.etag, last_modified = excluded.last_modified, updated_at = excluded.updated_at
+            ''', (payload['url'], payload['etag'], payload['last_modified']))
+        return True
+    
+    def _insert_archive(self, cursor: sqlite3.Cursor, payload: Dict[str, Any]) -> bool:
+        """raw_fetches에 수집 기록 추가 (본문은 처음 보는 해시일 때만 raw_bodies에 저장)"""
+        if payload['body'] is not None:
+            cursor.execute('INSERT OR IGNORE INTO raw_bodies (body_hash, body, size) VALUES (?, ?, ?)',
+                           (payload['body_hash'], payload['body'], payload['size']))
+        cursor.execute('INSERT INTO raw_fetches (website_name, url, body_hash) VALUES (?, ?, ?)',
+                       (payload['website_name'], payload['url'], payload['body_hash']))
+        return True
+    
+    def iter_archive(self, website_names: Optional[List[str]] = None, since: Optional[datetime] = None,
+                     until: Optional[datetime] = None, chunk_size: int = 100) -> Iterator[Dict[str, Any]]:
+        """보관된 원본 응답을 오래된 순서로 반환 (같은 URL의 같은 본문은 처음 수집한 것만)"""
+        conditions, params = self._time_range_condition(since, until, column='f.fetched_at')
+        if website_names:
+            conditions.append(f"f.website_name IN ({', '.join('?' * len(website_names))})")
+            params.extend(website_names)
+        where = (' WHERE ' + ' AND '.join(conditions)) if conditions else ''
+        
+        # 읽기 전용 연결을 따로 열어 쓰기 스레드를 막지 않음 (WAL)
+        conn = sqlite3.connect(self.db_path, timeout=30)
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
+            cursor = conn.execute(f'''
+                SELECT f.website_name, f.url, MIN(f.fetched_at), b.body
+                FROM raw_fetches f JOIN raw_bodies b ON b.body_hash = f.body_hash{where}
+                GROUP BY f.website_name, f.url, f.body_hash
+                ORDER BY MIN(f.id)
+            ''', params)
+            while True:
+                rows = cursor.fetchmany(chunk_size)
+                if not rows:
+                    break
+                for website_name, url, fetched_at, body in rows:
+                    yield {'website_name': website_name, 'url': url, 'fetched_at': fetched_at, 'body': zlib.decompress(body)}
+        finally:
+            conn.close()
+    
+    def _enqueue(self, op: str, payload: Any) -> Future:
+        future: Future = Future()
+        self._ensure_writer()
+        self._write_queue.put((op, payload, future))
+        return future
+    
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """대기 중인 쓰기 요청을 모두 저장할 때까지 대기"""
+        if self._writer_thread is None:
+            return True
+        done = threading.Event()
+        self._write_queue.put(('flush', None, done))
+        return done.wait(timeout)
+    
+    def close(self):
+        """대기열을 비우고 연결 종료"""
+        self.flush()
+        if self._writer_thread is not None:
+            self._write_queue.put(None)
+            self._writer_thread.join()
+            self._writer_thread = None
+        with self._lock:
+            self.conn.close()
+    
+    def _ensure_writer(self):
+        """쓰기 스레드 시작 (최초 1회)"""
+        with self._writer_lock:
+            if self._writer_thread is None:
+                self._writer_thread = threading.Thread(target=self._writer_loop, name='db-writer', daemon=True)
+                self._writer_thread.start()
+    
+    def _writer_loop(self):
+        """쓰기 대기열을 묶음 단위로 저장"""
+        while True:
+            item = self._write_queue.get()
+            if item is None:
+                return
             
-            cursor.execute('''
-                SELECT * FROM scraping_results 
-                WHERE scraped_at > datetime('now', '-{} hours')
-                ORDER BY scraped_at DESC
-            '''.format(hours))
+            batch = []
+            waiters = []
+            deadline = time.monotonic() + self.flush_interval
+            while item is not None:
+                if item[0] == 'flush':
+                    # flush 요청: 지금까지 모인 행을 바로 저장
+                    waiters.append(item[2])
+                    break
+                batch.append(item)
+                if len(batch) >= self.batch_size:
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._write_queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
             
-            columns = [description[0] for description in cursor.description]
-            results = [dict(zip(columns, row)) for row in cursor.fetchall()]
+            self._write_batch(batch)
+            for waiter in waiters:
+                waiter.set()
+            if item is None:
+                return
+    
+    def _write_batch(self, batch: List[Any]):
+        """묶음을 하나의 트랜잭션으로 저장 후 각 Future에 결과 전달"""
+        if not batch:
+            return
+        
+        handlers = {
+            'result': self._insert_result, 'results': self._insert_results, 'changes': self._insert_changes,
+            'archive': self._insert_archive, 'validator': self._upsert_validator
+        }
+        METRICS.observe('scraper_db_batch_size', len(batch), buckets=MetricsRegistry.SIZE_BUCKETS)
+        try:
+            with METRICS.timer('scraper_db_batch_seconds'), self._lock, self.conn:
+                cursor = self.conn.cursor()
+                results = [handlers[op](cursor, payload) for op, payload, _ in batch]
+        except Exception as e:
+            METRICS.inc('scraper_db_errors_total')
+            logging.error(f"데이터베이스 묶음 저장 오류: {e}")
+            self._reload_codec()
+            for _, _, future in batch:
+                future.set_exception(e)
+            return
+        
+        for (op, payload, future), result in zip(batch, results):
+            if op in ('result', 'results'):
+                for data in (payload if op == 'results' else [payload]):
+                    self.recent_fingerprints.add(data['website_name'], data.get('hash_value', ''))
+            elif op == 'archive':
+                self.recent_archive_hashes.add(payload['website_name'], payload['body_hash'])
+            future.set_result(result)
+    
+    def _reload_codec(self):
+        """롤백된 트랜잭션에서 만든 압축 사전을 버리고 저장된 사전 다시 읽기"""
+        try:
+            with self._lock:
+                self.codec.load(self.conn)
+        except sqlite3.Error as e:
+            logging.error(f"압축 사전 다시 읽기 실패: {e}")
+    
+    def compact(self, retention: Dict[str, Dict[str, Any]], default_retention: Optional[Dict[str, Any]] = None,
+                batch_rows: int = 500, vacuum_pages: int = 256, max_seconds: float = 30.0,
+                archive_max_age_days: float = 0) -> Dict[str, int]:
+        """보존 정책 적용, 미압축 행 압축, 점진적 VACUUM (작은 트랜잭션 단위)
+
+        retention: 웹사이트 이름별 {'max_age_days', 'max_rows'} (0 또는 누락은 무제한)
+        default_retention: retention에 없는 웹사이트(설정에서 빠진 사이트 포함)에 적용할 정책
+        archive_max_age_days: 원본 응답 보관 기간 (0은 무제한, 참조가 없어진 본문도 함께 삭제)
+        각 단계가 batch_rows 행(VACUUM은 vacuum_pages 페이지)만 처리하고 잠금을 놓기 때문에
+        그 사이 쓰기 스레드와 다른 프로세스의 쓰기가 끼어들 수 있습니다.
+        max_seconds가 지나면 멈추고 남은 작업은 다음 실행에서 이어서 처리합니다.
+        """
+        deadline = time.monotonic() + max_seconds
+        batch_rows = max(1, int(batch_rows))
+        stats = {'deleted_results': 0, 'deleted_changes': 0, 'deleted_archive': 0, 'compressed': 0, 'vacuumed_pages': 0}
+        
+        with self._lock:
+            site_names = [row[0] for row in self.conn.execute('SELECT DISTINCT website_name FROM scraping_results')]
+        for website_name in sorted(set(site_names) | set(retention)):
+            policy = retention.get(website_name, default_retention or {})
+            max_age_days = policy.get('max_age_days') or 0
+            max_rows = policy.get('max_rows') or 0
+            if max_age_days:
+                cutoff = self.to_db_timestamp(datetime.now() - timedelta(days=max_age_days))
+                stats['deleted_results'] += self._delete_in_batches(
+                    'scraping_results',
+                    f'SELECT id FROM scraping_results WHERE website_name = ? AND scraped_at < ? LIMIT {batch_rows}',
+                    (website_name, cutoff), deadline
+                )
+                stats['deleted_changes'] += self._delete_in_batches(
+                    'change_log',
+                    f'SELECT id FROM change_log WHERE website_name = ? AND changed_at < ? LIMIT {batch_rows}',
+                    (website_name, cutoff), deadline
+                )
+            if max_rows:
+                stats['deleted_results'] += self._delete_in_batches(
+                    'scraping_results',
+                    f'''SELECT id FROM scraping_results WHERE website_name = ?
+                        ORDER BY scraped_at DESC, id DESC LIMIT {batch_rows} OFFSET ?''',
+                    (website_name, int(max_rows)), deadline
+                )
+        
+        if archive_max_age_days:
+            cutoff = self.to_db_timestamp(datetime.now() - timedelta(days=archive_max_age_days))
+            self._delete_in_batches(
+                'raw_fetches', f'SELECT id FROM raw_fetches WHERE fetched_at < ? LIMIT {batch_rows}', (cutoff,), deadline
+            )
+            stats['deleted_archive'] = self._delete_in_batches(
+                'raw_bodies',
+                f'''SELECT id FROM raw_bodies b
+                    WHERE NOT EXISTS (SELECT 1 FROM raw_fetches f WHERE f.body_hash = b.body_hash) LIMIT {batch_rows}''',
+                (), deadline
+            )
+            # 삭제된 본문을 저장된 것으로 착각하지 않도록
+            self.recent_archive_hashes.clear()
+        
+        stats['compressed'] = self._compress_existing(batch_rows, deadline)
+        stats['vacuumed_pages'] = self.incremental_vacuum(vacuum_pages, deadline)
+        if time.monotonic() >= deadline:
+            logging.info(f"데이터 정리 시간 초과 ({max_seconds}초): 남은 작업은 다음 실행에서 계속합니다")
+        return stats
+    
+    def _delete_in_batches(self, table: str, select_sql: str, params: tuple, deadline: float) -> int:
+        """select_sql이 고른 행을 삭제 (없을 때까지 반복, 한 번에 한 묶음씩 커밋)"""
+        deleted = 0
+        while time.monotonic() < deadline:
+            with self._lock, self.conn:
+                if table == 'scraping_results' and self.search_enabled:
+                    self._delete_search_entries(select_sql, params)
+                count = self.conn.execute(f'DELETE FROM {table} WHERE id IN ({select_sql})', params).rowcount
+            deleted += count
+            if count <= 0:
+                break
+            time.sleep(self.COMPACTION_PAUSE)
+        return deleted
+    
+    def _delete_search_entries(self, select_sql: str, params: tuple):
+        """삭제할 scraping_results 행을 검색 색인에서 제거"""
+        rows = self.conn.execute(
+            f'SELECT id, title, content FROM scraping_results WHERE id IN ({select_sql})', params
+        ).fetchall()
+        self.conn.executemany(self.DELETE_SEARCH_SQL, [
+            (row_id, title or '', self.codec.decode(content, self.conn) or '') for row_id, title, content in rows
+        ])
+    
+    def _compress_existing(self, batch_rows: int, deadline: float) -> int:
+        """압축 기능 이전에 저장된 큰 텍스트 값을 압축"""
+        if not self.codec.enabled:
+            return 0
+        compressed = 0
+        while time.monotonic() < deadline:
+            with self._lock, self.conn:
+                rows = self.conn.execute('''
+                    SELECT id, website_name, content, extra FROM scraping_results
+                    WHERE id > ? AND ((typeof(content) = 'text' AND length(content) >= ?)
+                                      OR (typeof(extra) = 'text' AND length(extra) >= ?))
+                    ORDER BY id LIMIT ?
+                ''', (self._compressed_through, self.codec.min_bytes, self.codec.min_bytes, batch_rows)).fetchall()
+                cursor = self.conn.cursor()
+                for row_id, website_name, content, extra in rows:
+                    new_content = self.codec.encode(cursor, website_name, content)
+                    new_extra = self.codec.encode(cursor, website_name, extra)
+                    if new_content is not content or new_extra is not extra:
+                        cursor.execute('UPDATE scraping_results SET content = ?, extra = ? WHERE id = ?',
+                                       (new_content, new_extra, row_id))
+                        compressed += 1
+            if not rows:
+                break
+            # 압축해도 줄지 않는 값은 다시 보지 않도록 진행 위치 기억
+            self._compressed_through = rows[-1][0]
+            time.sleep(self.COMPACTION_PAUSE)
+        return compressed
+    
+    def incremental_vacuum(self, pages: int, deadline: float) -> int:
+        """빈 페이지를 pages개씩 파일에서 반환 (auto_vacuum=INCREMENTAL인 DB만)"""
+        with self._lock:
+            mode = self.conn.execute('PRAGMA auto_vacuum').fetchone()[0]
+        if mode != 2:
+            logging.info("점진적 VACUUM을 쓰려면 한 번 'compact --full-vacuum'으로 DB를 변환하세요")
+            return 0
+        
+        freed = 0
+        while time.monotonic() < deadline:
+            with self._lock:
+                free_pages = self.conn.execute('PRAGMA freelist_count').fetchone()[0]
+                if not free_pages:
+                    break
+                self.conn.execute(f'PRAGMA incremental_vacuum({int(pages)})').fetchall()
+            freed += min(free_pages, pages)
+            time.sleep(self.COMPACTION_PAUSE)
+        return freed
+    
+    def vacuum(self):
+        """전체 VACUUM (점진적 VACUUM 모드로 변환, 실행 중에는 다른 쓰기가 대기)"""
+        self.flush()
+        with self._lock:
+            self.conn.execute('PRAGMA auto_vacuum = INCREMENTAL')
+            self.conn.execute('VACUUM')
+    
+    @staticmethod
+    def to_db_timestamp(value: datetime) -> str:
+        """datetime을 scraped_at 형식(UTC 'YYYY-MM-DD HH:MM:SS')으로 변환"""
+        return value.astimezone(timezone.utc).strftime('%Y-%m-%d %H:%M:%S')
+    
+    def iter_results(self, since: Optional[datetime] = None, until: Optional[datetime] = None,
+                     website_names: Optional[List[str]] = None, columns: Optional[List[str]] = None,
+                     field_filters: Optional[Dict[str, Any]] = None, newest_first: bool = True,
+                     chunk_size: int = 1000) -> Iterator[Dict[str, Any]]:
+        """조건에 맞는 스크래핑 결과를 chunk_size 단위로 읽어 한 행씩 반환
+
+        since/until: 수집 시간 범위 (naive datetime은 로컬 시간으로 간주)
+        website_names: 웹사이트 이름 목록
+        columns: 조회할 컬럼 (기본: 전체)
+        field_filters: 컬럼별 일치 조건 (예: {'price': '1000'})
+        """
+        columns = list(columns or self.RESULT_COLUMNS)
+        unknown = [c for c in list(columns) + list(field_filters or {}) if c not in self.RESULT_COLUMNS]
+        if unknown:
+            raise ValueError(f"알 수 없는 컬럼: {', '.join(unknown)}")
+        compressed_filters = [c for c in field_filters or {} if c in self.COMPRESSED_COLUMNS]
+        if compressed_filters:
+            raise ValueError(f"압축 저장 컬럼은 조건으로 쓸 수 없습니다: {', '.join(compressed_filters)}")
+        
+        conditions, params = self._time_range_condition(since, until)
+        if website_names:
+            conditions.append(f"website_name IN ({', '.join('?' * len(website_names))})")
+            params.extend(website_names)
+        for column, value in (field_filters or {}).items():
+            conditions.append(f'{column} = ?')
+            params.append(value)
+        
+        sql = f"SELECT {', '.join(columns)} FROM scraping_results"
+        if conditions:
+            sql += ' WHERE ' + ' AND '.join(conditions)
+        sql += f" ORDER BY scraped_at {'DESC' if newest_first else 'ASC'}"
+        
+        # 읽기 전용 연결을 따로 열어 쓰기 스레드를 막지 않음 (WAL)
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        try:
+            cursor = conn.execute(sql, params)
+            compressed = [i for i, column in enumerate(columns) if column in self.COMPRESSED_COLUMNS]
+            while True:
+                rows = cursor.fetchmany(chunk_size)
+                if not rows:
+                    break
+                for row in rows:
+                    if compressed:
+                        row = list(row)
+                        for i in compressed:
+                            row[i] = self.codec.decode(row[i], conn)
+                    yield dict(zip(columns, row))
+        finally:
+            conn.close()
+    
+    def _time_range_condition(self, since: Optional[datetime], until: Optional[datetime], column: str = 'scraped_at'):
+        conditions = []
+        params: List[Any] = []
+        if since is not None:
+            conditions.append(f'{column} > ?')
+            params.append(self.to_db_timestamp(since))
+        if until is not None:
+            conditions.append(f'{column} <= ?')
+            params.append(self.to_db_timestamp(until))
+        return conditions, params
+    
+    def summarize_by_site(self, since: Optional[datetime] = None, until: Optional[datetime] = None) -> List[Dict[str, Any]]:
+        """웹사이트별 수집 건수와 최초/최종 수집 시간 (SQL 집계)"""
+        conditions, params = self._time_range_condition(since, until)
+        where = (' WHERE ' + ' AND '.join(conditions)) if conditions else ''
+        with self._lock:
+            rows = self.conn.execute(f'''
+                SELECT website_name, COUNT(*), MIN(scraped_at), MAX(scraped_at)
+                FROM scraping_results{where}
+                GROUP BY website_name
+                ORDER BY COUNT(*) DESC, website_name
+            ''', params).fetchall()
+        return [{'website_name': r[0], 'count': r[1], 'first_scraped_at': r[2], 'last_scraped_at': r[3]} for r in rows]
+    
+    def summarize_by_hour(self, since: Optional[datetime] = None, until: Optional[datetime] = None) -> List[Dict[str, Any]]:
+        """시간대별(UTC) 수집 건수 (SQL 집계)"""
+        conditions, params = self._time_range_condition(since, until)
+        where = (' WHERE ' + ' AND '.join(conditions)) if conditions else ''
+        with self._lock:
+            rows = self.conn.execute(f'''
+                SELECT CAST(strftime('%H', scraped_at) AS INTEGER) AS hour, COUNT(*)
+                FROM scraping_results{where}
+                GROUP BY hour
+                ORDER BY hour
+            ''', params).fetchall()
+        return [{'hour': r[0], 'count': r[1]} for r in rows]
+    
+    def search(self, query: str, website_names: Optional[List[str]] = None, since: Optional[datetime] = None,
+               until: Optional[datetime] = None, limit: int = 20, offset: int = 0) -> Dict[str, Any]:
+        """제목/본문 전문 검색 (bm25 순위, 제목 가중치 높음)
+
+        query: FTS5 검색식 (예: '갤럭시 할인', '갤럭시 OR 아이폰', '"정확한 문구"', '삼성*')
+        website_names/since/until: iter_results와 같은 필터
+        limit/offset: 페이지 크기와 시작 위치
+        반환: {'total': 전체 일치 건수, 'results': [결과 행 + rank, snippet]}
+        """
+        if not self.search_enabled:
+            raise RuntimeError("전문 검색 인덱스가 없습니다 (FTS5를 지원하는 SQLite 필요)")
+        
+        conditions, params = self._time_range_condition(since, until)
+        conditions.insert(0, 'results_fts MATCH ?')
+        params.insert(0, query)
+        if website_names:
+            conditions.append(f"website_name IN ({', '.join('?' * len(website_names))})")
+            params.extend(website_names)
+        from_where = 'FROM results_fts JOIN scraping_results r ON r.id = results_fts.rowid WHERE ' + ' AND '.join(conditions)
+        
+        # 읽기 전용 연결을 따로 열어 쓰기 스레드를 막지 않음 (WAL)
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        try:
+            total = conn.execute(f'SELECT COUNT(*) {from_where}', params).fetchone()[0]
+            rows = conn.execute(f'''
+                SELECT r.id, r.website_name, r.url, r.title, r.content, r.price, r.scraped_at,
+                       bm25(results_fts, {self.SEARCH_TITLE_WEIGHT}, 1.0) AS rank
+                {from_where}
+                ORDER BY rank LIMIT ? OFFSET ?
+            ''', params + [max(1, int(limit)), max(0, int(offset))]).fetchall()
             
+            results = []
+            for row_id, website_name, url, title, content, price, scraped_at, rank in rows:
+                content = self.codec.decode(content, conn)
+                results.append({
+                    'id': row_id, 'website_name': website_name, 'url': url, 'title': title, 'content': content,
+                    'price': price, 'scraped_at': scraped_at, 'rank': rank, 'snippet': make_snippet(content, query)
+                })
+        except sqlite3.OperationalError as e:
+            raise ValueError(f"검색식 오류: {query} ({e})")
+        finally:
             conn.close()
-            return results
+        return {'total': total, 'results': results}
+    
+    def match_rows(self, query: str, row_ids: List[int]) -> List[int]:
+        """row_ids 중 검색식과 일치하는 행 번호 (키워드 알림용, 색인으로 확인)"""
+        if not self.search_enabled or not row_ids:
+            return []
+        matched = []
+        try:
+            with self._lock:
+                for start in range(0, len(row_ids), 500):
+                    chunk = row_ids[start:start + 500]
+                    matched.extend(row[0] for row in self.conn.execute(
+                        f"SELECT rowid FROM results_fts WHERE results_fts MATCH ? AND rowid IN ({', '.join('?' * len(chunk))})",
+                        [query, *chunk]
+                    ))
+        except sqlite3.OperationalError as e:
+            raise ValueError(f"검색식 오류: {query} ({e})")
+        return matched
+    
+    def get_recent_data(self, hours: int = 24) -> List[Dict]:
+        """최근 데이터 조회"""
+        try:
+            return list(self.iter_results(since=datetime.now() - timedelta(hours=hours)))
             
         except Exception as e:
             logging.error(f"데이터베이스 조회 오류: {e}")
             return []
 
-class NotificationManager:
-    """알림 관리 클래스"""
-    
-    def __init__(self, config: Dict[str, Any]):
-        self.config = config
-        self.email_config = config.get('email', {})
-        self.webhook_config = config.get('webhook', {})
+class ChangeDetector:
+    """필드 단위 변경 감지 클래스
+
+    사이트별 마지막 스냅샷을 메모리에 두고 비교하며, 변경된 필드만 change_log에 기록합니다.
+    """
+
+    def __init__(self, db_manager: DatabaseManager):
+        self.db_manager = db_manager
+        self._lock = threading.Lock()
+        self.snapshots = db_manager.load_latest_snapshots()
+
+    @staticmethod
+    def extract_fields(data: Dict[str, Any]) -> Dict[str, str]:
+        """비교 대상 필드 (메타 필드 제외, 공백 정규화, 빈 값 제외)"""
+        fields = {}
+        for name, value in data.items():
+            if name in RECORD_META_FIELDS:
+                continue
+            normalized = ' '.join(str(value or '').split())
+            if normalized:
+                fields[name] = normalized
+        return fields
+
+    def detect(self, data: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """마지막 스냅샷과 비교해 변경된 필드 목록 반환 (스냅샷은 즉시 갱신)"""
+        fields = self.extract_fields(data)
+        website_name = data['website_name']
+
+        with self._lock:
+            previous = self.snapshots.get(website_name)
+            if previous and previous.get('hash_value') == data.get('hash_value'):
+                return []
+
+            old_fields = previous['fields'] if previous else {}
+            changes = []
+            for name in sorted(set(old_fields) | set(fields)):
+                old_value = old_fields.get(name)
+                new_value = fields.get(name)
+                if old_value == new_value:
+                    continue
+                if old_value is None:
+                    change_type = 'added'
+                elif new_value is None:
+                    change_type = 'removed'
+                else:
+                    change_type = 'modified'
+                changes.append({'field': name, 'change_type': change_type, 'old_value': old_value, 'new_value': new_value})
+
+            self.snapshots[website_name] = {'url': data['url'], 'fields': fields, 'hash_value': data.get('hash_value')}
+
+        return changes
+
+    def reload(self, website_name: str):
+        """DB에 저장된 스냅샷으로 다시 맞춤 (워커 모드에서 다른 프로세스가 수집했을 수 있음)"""
+        snapshot = self.db_manager.load_latest_snapshots(website_name).get(website_name)
+        with self._lock:
+            if snapshot is None:
+                self.snapshots.pop(website_name, None)
+            else:
+                self.snapshots[website_name] = snapshot
+
+    def record(self, data: Dict[str, Any], changes: List[Dict[str, Any]]) -> Future:
+        """변경 기록 저장 요청 (쓰기 대기열)"""
+        return self.db_manager.enqueue_changes(data, self.snapshots[data['website_name']]['fields'], changes)
+
+class CsvReportSink:
+    """CSV 리포트 파일 쓰기"""
+
+    extension = 'csv'
+
+    def __init__(self, path: str, columns: List[str]):
+        self.path = path
+        self.file = open(path, 'w', encoding='utf-8-sig', newline='')
+        self.writer = csv.writer(self.file)
+        self.writer.writerow(columns)
+
+    def write_rows(self, rows: List[List[Any]]):
+        self.writer.writerows(rows)
+
+    def add_table(self, name: str, columns: List[str], rows: List[List[Any]]):
+        """통계 표는 같은 이름의 별도 CSV 파일로 저장"""
+        path = f"{os.path.splitext(self.path)[0]}_{name}.csv"
+        with open(path, 'w', encoding='utf-8-sig', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(columns)
+            writer.writerows(rows)
+
+    def close(self):
+        self.file.close()
+
+class XlsxReportSink:
+    """Excel 리포트 파일 쓰기 (openpyxl write-only 모드)"""
+
+    extension = 'xlsx'
+    max_rows = 1048575  # Excel 시트 최대 행 수 - 헤더
+
+    def __init__(self, path: str, columns: List[str]):
+        from openpyxl import Workbook
+
+        self.path = path
+        self.workbook = Workbook(write_only=True)
+        self.sheet = self.workbook.create_sheet('전체_데이터')
+        self.sheet.append(columns)
+
+    def write_rows(self, rows: List[List[Any]]):
+        for row in rows:
+            self.sheet.append(row)
+
+    def add_table(self, name: str, columns: List[str], rows: List[List[Any]]):
+        sheet = self.workbook.create_sheet(name)
+        sheet.append(columns)
+        for row in rows:
+            sheet.append(row)
+
+    def close(self):
+        self.workbook.save(self.path)
+
+class ParquetReportSink:
+    """Parquet 리포트 파일 쓰기 (pyarrow 필요)"""
+
+    extension = 'parquet'
+
+    def __init__(self, path: str, columns: List[str]):
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise RuntimeError("Parquet 내보내기에는 pyarrow 패키지가 필요합니다 (pip install pyarrow)")
+
+        self.pa = pa
+        self.pq = pq
+        self.path = path
+        self.columns = columns
+        self.schema = pa.schema([(c, pa.int64() if c == 'id' else pa.string()) for c in columns])
+        self.writer = pq.ParquetWriter(path, self.schema)
+
+    def write_rows(self, rows: List[List[Any]]):
+        arrays = [self.pa.array([row[i] for row in rows], type=field.type) for i, field in enumerate(self.schema)]
+        self.writer.write_table(self.pa.Table.from_arrays(arrays, schema=self.schema))
+
+    def add_table(self, name: str, columns: List[str], rows: List[List[Any]]):
+        """통계 표는 같은 이름의 별도 Parquet 파일로 저장"""
+        path = f"{os.path.splitext(self.path)[0]}_{name}.parquet"
+        table = self.pa.table({c: [row[i] for row in rows] for i, c in enumerate(columns)})
+        self.pq.write_table(table, path)
+
+    def close(self):
+        self.writer.close()
+
+def normalize_url(url: str) -> str:
+    """방문 여부 비교용 URL 정규화 (스킴/호스트 소문자, 기본 포트/프래그먼트 제거, 쿼리 정렬)"""
+    parsed = urlparse(url.strip())
+    scheme = parsed.scheme.lower()
+    netloc = parsed.netloc.lower()
+    if (scheme == 'http' and netloc.endswith(':80')) or (scheme == 'https' and netloc.endswith(':443')):
+        netloc = netloc.rsplit(':', 1)[0]
+    query = urlencode(sorted(parse_qsl(parsed.query, keep_blank_values=True)))
+    return urlunparse((scheme, netloc, parsed.path or '/', parsed.params, query, ''))
+
+class CrawlFrontier:
+    """크롤링 URL 프론티어 관리 클래스 (SQLite crawl_frontier 테이블)
+
+    한 주기 동안 같은 페이지를 두 번 가져오지 않으며, 대기 중인 URL이 남아 있으면
+    재시작 후 그 지점부터 이어서 크롤링합니다.
+    """
+
+    def __init__(self, db_manager: DatabaseManager):
+        self.db_manager = db_manager
+
+    def start(self, website_name: str, start_url: str) -> int:
+        """주기 시작: 대기 URL이 있으면 이어서 진행(대기 수 반환), 없으면 시작 URL로 새 주기"""
+        with self.db_manager._lock, self.db_manager.conn as conn:
+            pending = conn.execute(
+                "SELECT COUNT(*) FROM crawl_frontier WHERE website_name = ? AND status = 'pending'",
+                (website_name,)
+            ).fetchone()[0]
+            if pending:
+                return pending
+            conn.execute('DELETE FROM crawl_frontier WHERE website_name = ?', (website_name,))
+            conn.execute(
+                'INSERT INTO crawl_frontier (website_name, url, normalized_url, depth) VALUES (?, ?, ?, 0)',
+                (website_name, start_url, normalize_url(start_url))
+            )
+        return 0
+
+    def next_pending(self, website_name: str) -> Optional[tuple]:
+        """다음 방문할 URL (id, url, depth)"""
+        with self.db_manager._lock:
+            return self.db_manager.conn.execute(
+                "SELECT id, url, depth FROM crawl_frontier WHERE website_name = ? AND status = 'pending' ORDER BY id LIMIT 1",
+                (website_name,)
+            ).fetchone()
+
+    def add(self, website_name: str, urls: List[str], depth: int) -> int:
+        """새 URL 추가 (이미 본 정규화 URL은 무시, 추가된 수 반환)"""
+        if not urls:
+            return 0
+        with self.db_manager._lock, self.db_manager.conn as conn:
+            before = conn.total_changes
+            conn.executemany(
+                'INSERT OR IGNORE INTO crawl_frontier (website_name, url, normalized_url, depth) VALUES (?, ?, ?, ?)',
+                [(website_name, url, normalize_url(url), depth) for url in urls]
+            )
+            return conn.total_changes - before
+
+    def mark(self, entry_id: int, status: str):
+        """방문 결과 기록 (done / failed)"""
+        with self.db_manager._lock, self.db_manager.conn as conn:
+            conn.execute(
+                'UPDATE crawl_frontier SET status = ?, fetched_at = CURRENT_TIMESTAMP WHERE id = ?',
+                (status, entry_id)
+            )
+
+    def finish(self, website_name: str):
+        """주기 종료: 남은 대기 URL 정리 (다음 주기는 시작 URL부터)"""
+        with self.db_manager._lock, self.db_manager.conn as conn:
+            conn.execute("DELETE FROM crawl_frontier WHERE website_name = ? AND status = 'pending'", (website_name,))
+
+class ReportExporter:
+    """리포트 내보내기 클래스
+
+    DB에서 청크 단위로 읽어 바로 파일에 쓰고, max_records_per_file마다 새 파일로 나눕니다.
+    웹사이트별/시간별 통계는 SQL로 집계합니다.
+    """
+
+    SINKS = {'xlsx': XlsxReportSink, 'csv': CsvReportSink, 'parquet': ParquetReportSink}
+
+    def __init__(self, db_manager: DatabaseManager, export_settings: Dict[str, Any]):
+        self.db_manager = db_manager
+        self.export_format = export_settings.get('format', 'xlsx')
+        self.max_records_per_file = max(1, export_settings.get('max_records_per_file', 10000))
+        self.chunk_size = max(1, export_settings.get('chunk_size', 1000))
+        self.output_dir = export_settings.get('output_dir', '.')
+
+    def export(self, since: Optional[datetime] = None, until: Optional[datetime] = None,
+               export_format: Optional[str] = None, website_names: Optional[List[str]] = None) -> Dict[str, Any]:
+        """리포트 파일 생성 (생성된 파일 목록과 통계 반환)"""
+        export_format = export_format or self.export_format
+        if export_format not in self.SINKS:
+            raise ValueError(f"지원하지 않는 내보내기 형식: {export_format} ({', '.join(self.SINKS)})")
+        sink_class = self.SINKS[export_format]
+        records_per_file = min(self.max_records_per_file, getattr(sink_class, 'max_rows', self.max_records_per_file))
+
+        columns = list(DatabaseManager.RESULT_COLUMNS)
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        os.makedirs(self.output_dir, exist_ok=True)
+
+        files: List[str] = []
+        sink = None
+        rows_in_file = 0
+        total = 0
+        pending: List[List[Any]] = []
+        site_stats: List[Dict[str, Any]] = []
+        hourly_stats: List[Dict[str, Any]] = []
+
+        try:
+            rows = self.db_manager.iter_results(since=since, until=until, website_names=website_names,
+                                                newest_first=False, chunk_size=self.chunk_size)
+            for record in rows:
+                # max_records_per_file 초과 시 새 파일
+                if sink is None or rows_in_file >= records_per_file:
+                    if sink is not None:
+                        sink.write_rows(pending)
+                        pending.clear()
+                        sink.close()
+                    suffix = f"_part{len(files) + 1}" if files else ""
+                    path = os.path.join(self.output_dir, f"scraping_report_{timestamp}{suffix}.{sink_class.extension}")
+                    sink = sink_class(path, columns)
+                    files.append(path)
+                    rows_in_file = 0
+
+                pending.append([record[c] for c in columns])
+                rows_in_file += 1
+                total += 1
+                if len(pending) >= self.chunk_size:
+                    sink.write_rows(pending)
+                    pending.clear()
+
+            if sink is not None:
+                if pending:
+                    sink.write_rows(pending)
+
+                # 통계는 마지막 파일에 추가
+                site_stats = self.db_manager.summarize_by_site(since, until)
+                hourly_stats = self.db_manager.summarize_by_hour(since, until)
+                sink.add_table('웹사이트별_통계', ['website_name', 'count', 'first_scraped_at', 'last_scraped_at'],
+                               [[s['website_name'], s['count'], s['first_scraped_at'], s['last_scraped_at']] for s in site_stats])
+                sink.add_table('시간별_통계', ['hour', 'count'], [[h['hour'], h['count']] for h in hourly_stats])
+        finally:
+            if sink is not None:
+                sink.close()
+
+        return {'files': files, 'total': total, 'site_stats': site_stats, 'hourly_stats': hourly_stats}
+
+class WebhookDispatcher:
+    """웹훅 전송 워커 클래스
+
+    이벤트를 모아 batch_size 개 또는 batch_interval 초마다 JSON 배열 하나로 전송합니다.
+    전송은 전용 세션(연결 재사용)으로 지수 백오프 재시도하며, 끝내 실패한 이벤트는
+    spool 파일에 기록했다가 다음 시작 시 다시 전송합니다.
+    """
+    
+    RETRYABLE_STATUS = {408, 429}
+    
+    def __init__(self, webhook_config: Dict[str, Any]):
+        self.url = webhook_config['url']
+        self.batch_size = webhook_config.get('batch_size', 50)
+        self.batch_interval = webhook_config.get('batch_interval', 2)
+        self.max_retries = webhook_config.get('max_retries', 3)
+        self.timeout = webhook_config.get('timeout', 10)
+        self.spool_path = webhook_config.get('spool_path', 'webhook_spool.jsonl')
+        self.delivered = 0
+        
+        self.session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=2)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        
+        self._spool_lock = threading.Lock()
+        self._queue: queue.Queue = queue.Queue(maxsize=webhook_config.get('queue_size', 10000))
+        METRICS.register_gauge('scraper_queue_depth', self._queue.qsize, queue='webhook')
+        for event in self.load_spool():
+            self.submit(event)
+        self._worker = threading.Thread(target=self._worker_loop, name='webhook', daemon=True)
+        self._worker.start()
+    
+    def submit(self, event: Dict[str, Any]):
+        """이벤트 추가 (대기열이 가득 차면 바로 spool 파일에 기록)"""
+        try:
+            self._queue.put_nowait(event)
+        except queue.Full:
+            self.spool([event])
+    
+    def _worker_loop(self):
+        """대기열에서 이벤트를 모아 묶음 전송"""
+        running = True
+        while running:
+            event = self._queue.get()
+            if event is None:
+                break
+            
+            batch = [event]
+            deadline = time.monotonic() + self.batch_interval
+            while len(batch) < self.batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    event = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if event is None:
+                    running = False
+                    break
+                batch.append(event)
+            
+            self.deliver(batch)
+    
+    def deliver(self, batch: List[Dict[str, Any]]) -> bool:
+        """묶음 하나 전송 (실패 시 재시도 후 spool 파일에 기록)"""
+        for attempt in range(self.max_retries):
+            try:
+                with METRICS.timer('scraper_notification_seconds', channel='webhook'):
+                    response = self.session.post(self.url, json=batch, timeout=self.timeout)
+                if 400 <= response.status_code < 500 and response.status_code not in self.RETRYABLE_STATUS:
+                    # 요청 자체가 잘못된 경우 재전송해도 실패하므로 버림
+                    logging.error(f"웹훅 전송 거부 ({response.status_code}): 이벤트 {len(batch)}건 폐기")
+                    return False
+                response.raise_for_status()
+                
+                self.delivered += len(batch)
+                METRICS.inc('scraper_notifications_total', len(batch), channel='webhook', result='sent')
+                logging.info(f"웹훅 전송 완료: {len(batch)}건")
+                return True
+                
+            except requests.RequestException as e:
+                logging.warning(f"웹훅 전송 실패 (시도 {attempt + 1}/{self.max_retries}): {e}")
+                if attempt < self.max_retries - 1:
+                    time.sleep(2 ** attempt)  # 지수 백오프
+        
+        METRICS.inc('scraper_notifications_total', len(batch), channel='webhook', result='spooled')
+        self.spool(batch)
+        return False
+    
+    def spool(self, events: List[Dict[str, Any]]):
+        """전송하지 못한 이벤트를 spool 파일에 추가"""
+        try:
+            with self._spool_lock, open(self.spool_path, 'a', encoding='utf-8') as f:
+                for event in events:
+                    f.write(json.dumps(event, ensure_ascii=False, default=str) + '\n')
+            logging.warning(f"웹훅 이벤트 {len(events)}건 보관: {self.spool_path}")
+        except Exception as e:
+            logging.error(f"웹훅 이벤트 보관 실패: {e}")
+    
+    def load_spool(self) -> List[Dict[str, Any]]:
+        """보관된 이벤트를 읽고 spool 파일 비우기"""
+        if not os.path.exists(self.spool_path):
+            return []
+        
+        events = []
+        try:
+            with self._spool_lock:
+                with open(self.spool_path, 'r', encoding='utf-8') as f:
+                    for line in f:
+                        if line.strip():
+                            events.append(json.loads(line))
+                os.remove(self.spool_path)
+            logging.info(f"보관된 웹훅 이벤트 {len(events)}건 재전송 예정")
+        except Exception as e:
+            logging.error(f"웹훅 보관 파일 로드 실패: {e}")
+        return events
+    
+    def close(self):
+        """남은 이벤트를 전송하고 워커 종료"""
+        self._queue.put(None)
+        self._worker.join()
+        
+        # 종료 신호 뒤에 남은 이벤트는 다음 실행에서 전송
+        remaining = []
+        while True:
+            try:
+                event = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if event is not None:
+                remaining.append(event)
+        if remaining:
+            self.spool(remaining)
+        self.session.close()
+
+class NotificationManager:
+    """알림 관리 클래스
+
+    변경 알림은 대기열에 넣고 백그라운드 워커가 전송합니다. digest_window(초) 동안 모인
+    알림은 한 통의 요약 이메일로 묶고, SMTP 연결은 유휴 시간 동안 재사용합니다.
+    notify는 DB 쓰기 스레드의 저장 콜백에서도 호출되므로 기다리지 않습니다. 배압은
+    스크래핑 스레드가 wait_for_capacity로 대기열이 queue_size 아래로 줄 때까지(최대 enqueue_timeout)
+    워커의 신호를 기다리는 방식으로 겁니다. 대기열은 queue_size의 두 배까지 받아, 기다린 뒤
+    다른 스레드와 경합해도 알림이 버려지지 않게 하고, 그마저 넘치면 버리고 개수를 기록합니다.
+    """
+    
+    def __init__(self, config: Dict[str, Any]):
+        self.config = config
+        self.email_config = config.get('email', {})
+        self.webhook_config = config.get('webhook', {})
+        self.digest_window = config.get('digest_window', 30)
+        self.max_digest_events = config.get('max_digest_events', 100)
+        self.enqueue_timeout = config.get('enqueue_timeout', 5)
+        self.smtp_idle_timeout = config.get('smtp_idle_timeout', 300)
+        self.dropped = 0
+        
+        self._smtp: Optional[smtplib.SMTP] = None
+        self._smtp_last_used = 0.0
+        self._smtp_lock = threading.RLock()
+        self.queue_size = max(1, config.get('queue_size', 1000))
+        self._queue: queue.Queue = queue.Queue(maxsize=self.queue_size * 2)
+        self._drained = threading.Condition()
+        METRICS.register_gauge('scraper_queue_depth', self._queue.qsize, queue='notifications')
+        self.webhook_dispatcher: Optional[WebhookDispatcher] = None
+        if self.webhook_config.get('enabled', False):
+            self.webhook_dispatcher = WebhookDispatcher(self.webhook_config)
+        self._worker: Optional[threading.Thread] = None
+        if self.email_config.get('enabled', False) or self.webhook_config.get('enabled', False):
+            self._worker = threading.Thread(target=self._worker_loop, name='notifier', daemon=True)
+            self._worker.start()
+    
+    def wait_for_capacity(self) -> bool:
+        """대기열이 queue_size 아래로 줄 때까지 최대 enqueue_timeout초 대기 (스크래핑 스레드의 배압, 성공 여부 반환)"""
+        if self._worker is None:
+            return True
+        with self._drained:
+            has_room = self._drained.wait_for(lambda: self._queue.qsize() < self.queue_size, timeout=self.enqueue_timeout)
+        if not has_room:
+            METRICS.inc('scraper_notifications_total', channel='queue', result='backpressure_timeout')
+        return has_room
+    
+    def _take(self, timeout: float) -> Optional[Dict[str, Any]]:
+        """대기열에서 알림 하나를 꺼내고 자리를 기다리는 스레드에 신호"""
+        event = self._queue.get(timeout=timeout)
+        with self._drained:
+            self._drained.notify_all()
+        return event
+    
+    def notify(self, data: Dict[str, Any]) -> bool:
+        """변경 알림을 대기열에 추가 (전송은 워커가 담당, 대기열이 가득 차면 기다리지 않고 버림)"""
+        if self._worker is None:
+            return True
+        
+        event = {key: data.get(key) for key in ('website_name', 'url', 'title', 'content', 'price', 'scraped_at', 'alert')}
+        event['changes'] = list(data.get('changes', []))
+        try:
+            self._queue.put_nowait(event)
+            return True
+        except queue.Full:
+            self.dropped += 1
+            METRICS.inc('scraper_notifications_total', channel='queue', result='dropped')
+            logging.warning(f"알림 대기열 초과로 알림 누락: {event['website_name']} (누적 {self.dropped}건)")
+            return False
+    
+    def _worker_loop(self):
+        """알림 워커: 첫 알림 이후 digest_window 동안 모은 알림을 한 번에 전송"""
+        running = True
+        while running:
+            try:
+                event = self._take(self.smtp_idle_timeout)
+            except queue.Empty:
+                self._close_smtp()  # 유휴 연결 정리
+                continue
+            if event is None:
+                break
+            
+            events = [event]
+            deadline = time.monotonic() + self.digest_window
+            while len(events) < self.max_digest_events:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    event = self._take(remaining)
+                except queue.Empty:
+                    break
+                if event is None:
+                    running = False
+                    break
+                events.append(event)
+            
+            try:
+                self.send_digest(events)
+            except Exception as e:
+                logging.error(f"알림 전송 실패: {e}")
+        
+        self._close_smtp()
+    
+    def send_digest(self, events: List[Dict[str, Any]]):
+        """모인 알림 전송 (이메일은 한 통으로 묶음)"""
+        if len(events) == 1:
+            subject = f"🔔 새로운 데이터 발견: {events[0]['website_name']}"
+        else:
+            sites = sorted({event['website_name'] for event in events})
+            subject = f"🔔 새로운 데이터 {len(events)}건 발견: {', '.join(sites[:3])}{' 외' if len(sites) > 3 else ''}"
+        
+        sections = "<hr>".join(self.format_event_html(event) for event in events)
+        html_body = f"""
+        <html>
+        <body>
+            <h2>웹 스크래핑 알림</h2>
+            {sections}
+            
+            <hr>
+            <p><small>Advanced Web Scraping Automation Tool</small></p>
+        </body>
+        </html>
+        """
+        self.send_email(subject, html_body)
+        
+        for event in events:
+            self.send_webhook({
+                'type': 'keyword_alert' if event.get('alert') else 'new_data',
+                'alert': event.get('alert'),
+                'website': event['website_name'],
+                'title': event.get('title') or '',
+                'url': event['url'],
+                'timestamp': event['scraped_at'],
+                'changes': event['changes']
+            })
+    
+    @staticmethod
+    def format_event_html(event: Dict[str, Any]) -> str:
+        """알림 한 건의 HTML 본문"""
+        change_rows = "".join(
+            f"<tr><td>{change['field']}</td><td>{change['change_type']}</td>"
+            f"<td>{(change['old_value'] or '')[:100]}</td><td>{(change['new_value'] or '')[:100]}</td></tr>"
+            for change in event['changes']
+        )
+        change_table = ""
+        if change_rows:
+            change_table = f"""<h3>변경된 필드</h3>
+            <table border="1" style="border-collapse: collapse;">
+                <tr><th>필드</th><th>변경 유형</th><th>이전 값</th><th>새 값</th></tr>
+                {change_rows}
+            </table>"""
+        
+        alert_line = f"<p><strong>키워드 알림:</strong> {event['alert']}</p>" if event.get('alert') else ""
+        return f"""
+            {alert_line}
+            <p><strong>웹사이트:</strong> {event['website_name']}</p>
+            <p><strong>URL:</strong> <a href="{event['url']}">{event['url']}</a></p>
+            <p><strong>제목:</strong> {event.get('title') or 'N/A'}</p>
+            <p><strong>내용:</strong> {(event.get('content') or 'N/A')[:200]}...</p>
+            <p><strong>가격:</strong> {event.get('price') or 'N/A'}</p>
+            <p><strong>수집 시간:</strong> {event['scraped_at']}</p>
+            
+            {change_table}
+        """
+    
+    def _get_smtp(self) -> smtplib.SMTP:
+        """재사용 가능한 SMTP 연결 반환 (끊긴 연결은 다시 로그인)"""
+        if self._smtp is not None:
+            try:
+                if self._smtp.noop()[0] == 250:
+                    return self._smtp
+            except smtplib.SMTPException:
+                pass
+            self._close_smtp()
+        
+        server = smtplib.SMTP(self.email_config['smtp_server'], self.email_config['smtp_port'], timeout=30)
+        server.starttls()
+        server.login(self.email_config['smtp_user'], self.email_config['smtp_password'])
+        self._smtp = server
+        return server
+    
+    def _close_smtp(self):
+        """SMTP 연결 종료"""
+        with self._smtp_lock:
+            if self._smtp is None:
+                return
+            try:
+                self._smtp.quit()
+            except Exception:
+                pass
+            self._smtp = None
     
     def send_email(self, subject: str, body: str) -> bool:
         """이메일 알림 전송"""
@@ -144,56 +2107,996 @@ class NotificationManager:
             return True
             
         try:
-            msg = MimeMultipart()
+            msg = MIMEMultipart()
             msg['From'] = self.email_config['smtp_user']
             msg['To'] = self.email_config['to_email']
             msg['Subject'] = subject
             
-            msg.attach(MimeText(body, 'html'))
+            msg.attach(MIMEText(body, 'html'))
             
-            server = smtplib.SMTP(self.email_config['smtp_server'], self.email_config['smtp_port'])
-            server.starttls()
-            server.login(self.email_config['smtp_user'], self.email_config['smtp_password'])
-            server.send_message(msg)
-            server.quit()
+            with METRICS.timer('scraper_notification_seconds', channel='email'), self._smtp_lock:
+                try:
+                    self._get_smtp().send_message(msg)
+                except smtplib.SMTPServerDisconnected:
+                    # 유휴 중 서버가 끊은 연결 → 한 번 재연결
+                    self._smtp = None
+                    self._get_smtp().send_message(msg)
             
+            METRICS.inc('scraper_notifications_total', channel='email', result='sent')
             logging.info(f"이메일 전송 완료: {subject}")
             return True
             
         except Exception as e:
+            METRICS.inc('scraper_notifications_total', channel='email', result='failed')
             logging.error(f"이메일 전송 실패: {e}")
             return False
     
-    def send_webhook(self, data: Dict[str, Any]) -> bool:
-        """웹훅 알림 전송"""
-        if not self.webhook_config.get('enabled', False):
-            return True
-            
+    def send_webhook(self, data: Dict[str, Any]) -> bool:
+        """웹훅 알림 전송 (WebhookDispatcher가 묶어서 전송)"""
+        if self.webhook_dispatcher is None:
+            return True
+        
+        self.webhook_dispatcher.submit(data)
+        return True
+    
+    def close(self):
+        """대기 중인 알림을 모두 전송하고 워커 종료"""
+        if self._worker is not None:
+            self._queue.put(None)
+            self._worker.join()
+            self._worker = None
+            
+            # 종료 신호 뒤에 들어온 알림은 바로 전송 (웹훅은 실패 시 spool 파일에 보관됨)
+            remaining = []
+            while True:
+                try:
+                    event = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if event is not None:
+                    remaining.append(event)
+            if remaining:
+                try:
+                    self.send_digest(remaining)
+                except Exception as e:
+                    logging.error(f"종료 중 알림 전송 실패: {e}")
+        if self.webhook_dispatcher is not None:
+            self.webhook_dispatcher.close()
+            self.webhook_dispatcher = None
+        self._close_smtp()
+
+class ValidatorCache:
+    """HTTP 조건부 요청(ETag/Last-Modified) 검증자 캐시 클래스
+
+    URL별 검증자를 공유 DB의 http_validators 테이블에 보관하여 재시작 후에도, 같은 DB를 쓰는
+    다른 워커 프로세스에서도 304 응답을 활용합니다. 갱신은 쓰기 대기열을 통해 묶어서 저장합니다.
+    """
+
+    def __init__(self, db_manager: DatabaseManager, legacy_path: Optional[str] = None):
+        self.db_manager = db_manager
+        if legacy_path:
+            self.import_legacy(legacy_path)
+
+    def import_legacy(self, legacy_path: str):
+        """이전 버전의 http_cache.json을 DB로 옮기고 파일 이름 변경"""
+        if not os.path.exists(legacy_path):
+            return
+        try:
+            with open(legacy_path, 'r', encoding='utf-8') as f:
+                validators = json.load(f)
+            with self.db_manager._lock, self.db_manager.conn as conn:
+                conn.executemany(
+                    'INSERT OR IGNORE INTO http_validators (url, etag, last_modified) VALUES (?, ?, ?)',
+                    [(url, entry.get('etag', ''), entry.get('last_modified', '')) for url, entry in validators.items()]
+                )
+            os.replace(legacy_path, f"{legacy_path}.migrated")
+            logging.info(f"검증자 캐시 {len(validators)}건을 DB로 이전: {legacy_path}")
+        except Exception as e:
+            logging.warning(f"검증자 캐시 이전 실패: {e}")
+
+    def conditional_headers(self, url: str) -> Dict[str, str]:
+        """조건부 요청 헤더 생성"""
+        with self.db_manager._lock:
+            row = self.db_manager.conn.execute(
+                'SELECT etag, last_modified FROM http_validators WHERE url = ?', (url,)
+            ).fetchone()
+        headers = {}
+        if row and row[0]:
+            headers['If-None-Match'] = row[0]
+        if row and row[1]:
+            headers['If-Modified-Since'] = row[1]
+        return headers
+
+    def update(self, url: str, response: requests.Response):
+        """응답의 검증자 저장 (검증자가 없는 응답이면 삭제)"""
+        self.db_manager.enqueue_validator(url, response.headers.get('ETag') or '', response.headers.get('Last-Modified') or '')
+
+class SeleniumDriverPool:
+    """Selenium 드라이버 풀 관리 클래스
+
+    드라이버를 재사용하다가 일정 페이지 수를 넘기거나 세션/연결 오류가 나면 교체합니다.
+    페이지 로딩 시간 초과나 요소 없음 같은 오류는 드라이버가 정상이므로 계속 재사용합니다.
+    """
+
+    # 세션이 끊긴 드라이버에서 나오는 WebDriverException 메시지
+    DEAD_SESSION_MESSAGES = ('invalid session id', 'session deleted', 'chrome not reachable', 'disconnected')
+
+    def __init__(self, driver_factory: Callable[[], Any], max_size: int = 2, max_pages_per_driver: int = 50):
+        self.driver_factory = driver_factory
+        self.max_pages_per_driver = max(1, max_pages_per_driver)
+        self._slots = threading.BoundedSemaphore(max(1, max_size))
+        self._lock = threading.Lock()
+        self._idle: List[Any] = []
+        self._page_counts: Dict[int, int] = {}
+
+    @contextmanager
+    def lease(self) -> Iterator[Any]:
+        """드라이버 대여 (with 블록 종료 시 반납)"""
+        self._slots.acquire()
+        driver = None
+        broken = False
+        try:
+            with self._lock:
+                if self._idle:
+                    driver = self._idle.pop()
+            if driver is None:
+                driver = self.driver_factory()
+                self._page_counts[id(driver)] = 0
+            yield driver
+        except Exception as e:
+            broken = driver is not None and self.is_broken(driver, e)
+            raise
+        finally:
+            if driver is not None:
+                self._release(driver, broken)
+            self._slots.release()
+
+    def is_broken(self, driver: Any, error: Exception) -> bool:
+        """드라이버를 교체해야 하는 오류인지 판단 (세션/연결 오류만 해당)"""
+        import urllib3
+        from selenium.common.exceptions import (
+            InvalidSessionIdException, NoSuchElementException, NoSuchWindowException, TimeoutException,
+            WebDriverException
+        )
+        
+        if isinstance(error, (TimeoutException, NoSuchElementException)):
+            return False
+        if isinstance(error, (InvalidSessionIdException, NoSuchWindowException, ConnectionError,
+                              urllib3.exceptions.HTTPError)):
+            return True
+        if isinstance(error, WebDriverException):
+            message = (error.msg or '').lower()
+            return (getattr(driver, 'session_id', None) is None
+                    or any(text in message for text in self.DEAD_SESSION_MESSAGES))
+        return False
+
+    def _release(self, driver: Any, broken: bool):
+        """드라이버 반납 또는 교체"""
+        with self._lock:
+            pages = self._page_counts.get(id(driver), 0) + 1
+            if not broken and pages < self.max_pages_per_driver:
+                self._page_counts[id(driver)] = pages
+                self._idle.append(driver)
+                return
+            self._page_counts.pop(id(driver), None)
+
+        logging.info(f"Selenium 드라이버 교체 ({'오류' if broken else f'{pages}페이지 처리'})")
+        self._quit(driver)
+
+    def _quit(self, driver: Any):
+        try:
+            driver.quit()
+        except Exception as e:
+            logging.warning(f"Chrome 드라이버 종료 실패: {e}")
+
+    def close(self):
+        """대기 중인 모든 드라이버 종료"""
+        with self._lock:
+            idle, self._idle = self._idle, []
+            self._page_counts.clear()
+        for driver in idle:
+            self._quit(driver)
+
+class HostRateLimiter:
+    """호스트별 요청 간격 제한 클래스
+
+    같은 호스트로 가는 요청만 최소 간격을 두고, 서로 다른 호스트는 즉시 요청합니다.
+    """
+
+    def __init__(self, default_interval: float = 1.0):
+        self.default_interval = default_interval
+        self._next_allowed: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def wait(self, url: str, interval: Optional[float] = None) -> float:
+        """해당 호스트의 다음 요청 시점까지 대기 (대기한 초 반환)"""
+        host = urlparse(url).netloc.lower()
+        if interval is None:
+            interval = self.default_interval
+
+        # 호출 순서대로 호스트별 요청 시점을 예약
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_allowed.get(host, 0.0))
+            self._next_allowed[host] = slot + max(0.0, interval)
+
+        delay = slot - now
+        if delay > 0:
+            time.sleep(delay)
+        return max(0.0, delay)
+
+class MetricsHandler(http.server.BaseHTTPRequestHandler):
+    """/metrics 요청에 Prometheus 텍스트 형식으로 응답"""
+
+    registry: MetricsRegistry = METRICS
+
+    def do_GET(self):
+        if self.path.split('?', 1)[0] != '/metrics':
+            self.send_error(404)
+            return
+        body = self.registry.render_prometheus().encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args):
+        pass  # 수집 요청마다 로그를 남기지 않음
+
+class MetricsExporter:
+    """지표 내보내기 클래스 (localhost HTTP 엔드포인트 + 주기적 JSON 스냅샷 파일)"""
+
+    def __init__(self, registry: MetricsRegistry, settings: Dict[str, Any]):
+        self.registry = registry
+        self.enabled = settings.get('enabled', False)
+        self.host = settings.get('host', '127.0.0.1')
+        self.port = settings.get('port', 9108)
+        self.snapshot_path = settings.get('snapshot_path', 'metrics.json')
+        self.snapshot_interval = settings.get('snapshot_interval', 60)
+        self.server: Optional[http.server.ThreadingHTTPServer] = None
+        self._stopped = threading.Event()
+        self._threads: List[threading.Thread] = []
+
+    def start(self):
+        """HTTP 서버와 스냅샷 스레드 시작"""
+        if not self.enabled:
+            return
+        
+        try:
+            handler = type('BoundMetricsHandler', (MetricsHandler,), {'registry': self.registry})
+            self.server = http.server.ThreadingHTTPServer((self.host, self.port), handler)
+            self.server.daemon_threads = True
+            self._threads.append(threading.Thread(target=self.server.serve_forever, name='metrics-http', daemon=True))
+            logging.info(f"지표 엔드포인트: http://{self.host}:{self.server.server_address[1]}/metrics")
+        except OSError as e:
+            logging.error(f"지표 서버 시작 실패: {e}")
+        
+        if self.snapshot_path:
+            self._threads.append(threading.Thread(target=self._snapshot_loop, name='metrics-snapshot', daemon=True))
+        for thread in self._threads:
+            thread.start()
+
+    def _snapshot_loop(self):
+        while not self._stopped.wait(self.snapshot_interval):
+            self.write_snapshot()
+
+    def write_snapshot(self) -> bool:
+        """JSON 스냅샷 저장 (임시 파일 교체 방식)"""
+        try:
+            tmp_path = f"{self.snapshot_path}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self.registry.snapshot(), f, ensure_ascii=False, indent=2)
+            os.replace(tmp_path, self.snapshot_path)
+            return True
+        except Exception as e:
+            logging.warning(f"지표 스냅샷 저장 실패: {e}")
+            return False
+
+    def close(self):
+        """서버 종료 및 마지막 스냅샷 저장"""
+        if not self.enabled:
+            return
+        self._stopped.set()
+        if self.server is not None:
+            self.server.shutdown()
+            self.server.server_close()
+            self.server = None
+        if self.snapshot_path:
+            self.write_snapshot()
+
+class ParsePool:
+    """HTML 파싱/추출 전용 프로세스 풀 클래스
+
+    다운로드는 I/O 스레드가 하고, 본문과 선택자 설정만 작업 프로세스로 넘겨 GIL 없이
+    여러 코어에서 파싱합니다. 처리 중인 본문 수는 max_in_flight로 제한되어 제출 측이
+    대기하므로(배압) 메모리가 일정하게 유지되고, chunk_size 개씩 묶어 보내 IPC 비용을 줄입니다.
+    작업 프로세스가 비정상 종료되면(메모리 부족 등) 처리 중이던 작업만 실패시키고 풀을 새로 만듭니다.
+    """
+    
+    CONFIG_KEYS = ('name', 'url', 'mode', 'item_selector', 'selectors', 'max_items')
+    
+    def __init__(self, max_workers: int, max_in_flight: int, chunk_size: int = 1, chunk_wait: float = 0.05):
+        self.max_workers = max_workers
+        self._executor_lock = threading.Lock()
+        self.executor = self.create_executor()
+        self.chunk_size = max(1, chunk_size)
+        self.chunk_wait = chunk_wait
+        self.max_in_flight = max(1, max_in_flight)
+        self._slots = threading.BoundedSemaphore(self.max_in_flight)
+        self._in_flight = 0
+        self._count_lock = threading.Lock()
+        self._queue: queue.Queue = queue.Queue()
+        self._dispatcher = threading.Thread(target=self._dispatch_loop, name='parse-dispatcher', daemon=True)
+        self._dispatcher.start()
+        METRICS.register_gauge('scraper_queue_depth', lambda: self._in_flight, queue='parse')
+    
+    @staticmethod
+    def process_context() -> multiprocessing.context.BaseContext:
+        """스레드와 안전하게 함께 쓸 수 있는 프로세스 시작 방식"""
+        start_method = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+        return multiprocessing.get_context(start_method)
+    
+    def create_executor(self) -> ProcessPoolExecutor:
+        """작업 프로세스 풀 생성"""
+        # DB 쓰기/알림/메트릭 스레드가 이미 실행 중이므로 fork 대신 forkserver(없으면 spawn)로 작업 프로세스 생성
+        return ProcessPoolExecutor(max_workers=self.max_workers, mp_context=self.process_context())
+    
+    def _rebuild(self, broken: ProcessPoolExecutor) -> ProcessPoolExecutor:
+        """깨진 프로세스 풀을 새 풀로 교체 (이미 교체되었으면 현재 풀 반환)"""
+        with self._executor_lock:
+            if self.executor is broken:
+                logging.warning("파싱 프로세스가 비정상 종료되어 프로세스 풀을 다시 만듭니다")
+                METRICS.inc('scraper_parse_pool_restarts_total')
+                self.executor = self.create_executor()
+                broken.shutdown(wait=False)
+            return self.executor
+    
+    def submit(self, markup: Any, website_config: Dict[str, Any], parser: str, parse_mode: str,
+               parse_selectors: Optional[Dict[str, str]]) -> Future:
+        """파싱 작업 제출 (처리 중인 본문이 max_in_flight개면 자리가 날 때까지 대기)"""
+        self._slots.acquire()
+        with self._count_lock:
+            self._in_flight += 1
+        future: Future = Future()
+        future.add_done_callback(self._release)
+        self._queue.put(((markup, website_config, parser, parse_mode, parse_selectors), future))
+        return future
+    
+    def _release(self, future: Future):
+        with self._count_lock:
+            self._in_flight -= 1
+        self._slots.release()
+    
+    def _dispatch_loop(self):
+        """대기 작업을 chunk_size개(또는 chunk_wait초 동안 모인 만큼)씩 프로세스에 전달"""
+        running = True
+        while running:
+            task = self._queue.get()
+            if task is None:
+                break
+            
+            batch = [task]
+            deadline = time.monotonic() + self.chunk_wait
+            while len(batch) < self.chunk_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    task = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if task is None:
+                    running = False
+                    break
+                batch.append(task)
+            
+            try:
+                executor, chunk_future = self._submit_chunk(batch)
+            except Exception as e:
+                for _, future in batch:
+                    future.set_exception(e)
+                continue
+            chunk_future.add_done_callback(lambda f, batch=batch, executor=executor: self._deliver(batch, f, executor))
+    
+    def _submit_chunk(self, batch: List[tuple]) -> Tuple[ProcessPoolExecutor, Future]:
+        """묶음을 프로세스 풀에 제출 (풀이 깨져 있으면 새로 만든 뒤 한 번 더 시도)"""
+        executor = self.executor
+        try:
+            return executor, executor.submit(parse_chunk, [args for args, _ in batch])
+        except BrokenProcessPool:
+            executor = self._rebuild(executor)
+            return executor, executor.submit(parse_chunk, [args for args, _ in batch])
+    
+    def _deliver(self, batch: List[tuple], chunk_future: Future, executor: ProcessPoolExecutor):
+        """묶음 결과를 각 작업의 Future에 전달 (풀이 깨졌으면 이 묶음만 실패시키고 풀 교체)"""
+        try:
+            results = chunk_future.result()
+        except Exception as e:
+            for _, future in batch:
+                future.set_exception(e)
+            if isinstance(e, BrokenProcessPool):
+                self._rebuild(executor)
+            return
+        for (_, future), result in zip(batch, results):
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+    
+    def close(self):
+        """남은 작업을 처리하고 프로세스 종료"""
+        self._queue.put(None)
+        self._dispatcher.join()
+        self.executor.shutdown(wait=True)
+
+class IntervalSchedule:
+    """N분 간격 스케줄 (에포크 기준으로 정렬된 시각에 실행)"""
+
+    def __init__(self, minutes: float):
+        if minutes <= 0:
+            raise ValueError(f"잘못된 실행 간격: {minutes}")
+        self.period = minutes * 60
+
+    def next_after(self, timestamp: float) -> float:
+        """timestamp 이후 첫 실행 시각"""
+        return (timestamp // self.period + 1) * self.period
+
+class CronSchedule:
+    """크론 표현식 스케줄 (분 시 일 월 요일, *, */N, a-b, a-b/N, 목록 지원)"""
+
+    FIELD_RANGES = ((0, 59), (0, 23), (1, 31), (1, 12), (0, 7))
+
+    def __init__(self, expression: str):
+        parts = expression.split()
+        if len(parts) != 5:
+            raise ValueError(f"크론 표현식은 5개 필드가 필요합니다: {expression}")
+        self.expression = expression
+        self.minutes, self.hours, self.days, self.months, weekdays = (
+            self._parse_field(part, low, high) for part, (low, high) in zip(parts, self.FIELD_RANGES)
+        )
+        self.weekdays = {day % 7 for day in weekdays}  # 7도 일요일
+        self.any_day = parts[2] == '*'
+        self.any_weekday = parts[4] == '*'
+
+    @staticmethod
+    def _parse_field(field: str, low: int, high: int) -> set:
+        """필드 하나를 허용 값 집합으로 변환"""
+        values = set()
+        for part in field.split(','):
+            step = 1
+            if '/' in part:
+                part, step_str = part.split('/', 1)
+                step = int(step_str)
+            if part == '*':
+                start, end = low, high
+            elif '-' in part:
+                start, end = (int(value) for value in part.split('-', 1))
+            else:
+                start = int(part)
+                end = high if step > 1 else start
+            if start < low or end > high or start > end or step <= 0:
+                raise ValueError(f"크론 필드 범위 오류: {field}")
+            values.update(range(start, end + 1, step))
+        return values
+
+    def _day_matches(self, moment: datetime) -> bool:
+        """일/요일 조건 (둘 다 지정되면 하나만 맞아도 실행)"""
+        day_ok = moment.day in self.days
+        weekday_ok = (moment.weekday() + 1) % 7 in self.weekdays
+        if self.any_day:
+            return weekday_ok
+        if self.any_weekday:
+            return day_ok
+        return day_ok or weekday_ok
+
+    def next_after(self, timestamp: float) -> float:
+        """timestamp 이후 첫 실행 시각 (로컬 시간 기준)"""
+        moment = datetime.fromtimestamp(timestamp).replace(second=0, microsecond=0) + timedelta(minutes=1)
+        limit = moment.year + 5
+        while moment.year <= limit:
+            if moment.month not in self.months:
+                moment = (moment.replace(day=1, hour=0, minute=0) + timedelta(days=32)).replace(day=1)
+            elif not self._day_matches(moment):
+                moment = moment.replace(hour=0, minute=0) + timedelta(days=1)
+            elif moment.hour not in self.hours:
+                moment = moment.replace(minute=0) + timedelta(hours=1)
+            elif moment.minute not in self.minutes:
+                moment += timedelta(minutes=1)
+            else:
+                return moment.timestamp()
+        raise ValueError(f"실행 시각이 없는 크론 표현식: {self.expression}")
+
+def parse_schedule(schedule_str: str):
+    """스케줄 문자열 해석 (*/N, HH:MM, hourly, daily, 크론 표현식)"""
+    schedule_str = schedule_str.strip()
+    if schedule_str.startswith('*/') and ' ' not in schedule_str:
+        # */30 (30분마다)
+        return IntervalSchedule(float(schedule_str[2:]))
+    if schedule_str == 'hourly':
+        return IntervalSchedule(60)
+    if schedule_str == 'daily':
+        return CronSchedule('0 9 * * *')
+    if re.fullmatch(r'\d{1,2}:\d{2}', schedule_str):
+        # 09:00 (매일 해당 시각)
+        hour, minute = schedule_str.split(':')
+        return CronSchedule(f'{int(minute)} {int(hour)} * * *')
+    return CronSchedule(schedule_str)
+
+class AdaptiveFrequency:
+    """사이트별 변경 빈도를 학습해 수집 간격을 조절하는 클래스
+
+    수집할 때마다 변경 여부를 관측해 감쇠 평균으로 변경률(λ)을 추정하고, 변경 한 번에
+    checks_per_change 번 확인하도록 간격을 min/max 범위 안에서 정합니다. 적응형 사이트들의
+    시간당 요청 수가 max_requests_per_hour를 넘으면 모든 간격을 같은 비율로 늘립니다.
+    학습 상태는 adaptive_state 테이블에 저장되어 재시작 후에도 유지됩니다.
+    """
+
+    def __init__(self, db_manager: DatabaseManager, settings: Dict[str, Any]):
+        self.db_manager = db_manager
+        self.min_interval = settings.get('min_interval_minutes', 5) * 60
+        self.max_interval = settings.get('max_interval_minutes', 720) * 60
+        self.max_requests_per_hour = settings.get('max_requests_per_hour', 0)
+        self.checks_per_change = settings.get('checks_per_change', 2)
+        self.half_life = settings.get('decay_hours', 24) * 3600
+        self.lookback = settings.get('lookback_hours', 168) * 3600
+        self._lock = threading.Lock()
+        self.state: Dict[str, Dict[str, Any]] = {}
+        self.base_intervals: Dict[str, float] = {}
+
+    def register(self, website_name: str, base_interval: float):
+        """사이트 등록 (저장된 상태가 없으면 수집 이력으로 초기 변경률 추정)"""
+        self.base_intervals[website_name] = base_interval
+        with self.db_manager._lock:
+            row = self.db_manager.conn.execute(
+                'SELECT interval_seconds, changes, observed_seconds, checks, last_checked FROM adaptive_state WHERE website_name = ?',
+                (website_name,)
+            ).fetchone()
+        
+        if row:
+            state = dict(zip(('interval', 'changes', 'observed', 'checks', 'last_checked'), row))
+        else:
+            changes, observed = self.estimate_from_history(website_name)
+            state = {'interval': base_interval, 'changes': changes, 'observed': observed, 'checks': 0, 'last_checked': None}
+            state['interval'] = self.target_interval(state, base_interval)
+        with self._lock:
+            self.state[website_name] = state
+        logging.info(f"적응형 주기 등록: {website_name} (간격 {self.interval(website_name) / 60:.1f}분)")
+
+    def reload(self):
+        """등록된 사이트의 학습 상태를 DB에서 다시 읽기 (다른 워커가 갱신했을 수 있음)"""
+        with self._lock:
+            names = list(self.state)
+        if not names:
+            return
+        with self.db_manager._lock:
+            rows = self.db_manager.conn.execute(f'''
+                SELECT website_name, interval_seconds, changes, observed_seconds, checks, last_checked
+                FROM adaptive_state WHERE website_name IN ({', '.join('?' * len(names))})
+            ''', names).fetchall()
+        with self._lock:
+            for website_name, *values in rows:
+                self.state[website_name] = dict(zip(('interval', 'changes', 'observed', 'checks', 'last_checked'), values))
+
+    def estimate_from_history(self, website_name: str) -> tuple:
+        """변경 이력(change_log/scraping_results)에서 (변경 횟수, 관측 초) 추정"""
+        since = DatabaseManager.to_db_timestamp(datetime.now() - timedelta(seconds=self.lookback))
+        with self.db_manager._lock:
+            row = self.db_manager.conn.execute('''
+                SELECT COUNT(DISTINCT changed_minute), MIN(changed_minute) FROM (
+                    SELECT strftime('%Y-%m-%d %H:%M', changed_at) AS changed_minute
+                    FROM change_log WHERE website_name = ? AND changed_at >= ?
+                    UNION ALL
+                    SELECT strftime('%Y-%m-%d %H:%M', scraped_at)
+                    FROM scraping_results WHERE website_name = ? AND scraped_at >= ?
+                )
+            ''', (website_name, since, website_name, since)).fetchone()
+        
+        count, first = row
+        if not count:
+            return 0.0, 0.0
+        first_at = datetime.strptime(first, '%Y-%m-%d %H:%M').replace(tzinfo=timezone.utc)
+        observed = max(60.0, (datetime.now(timezone.utc) - first_at).total_seconds())
+        return float(count), observed
+
+    def target_interval(self, state: Dict[str, Any], base_interval: float) -> float:
+        """추정 변경률로 목표 간격 계산 (이력이 없으면 기본 간격 쪽으로 수렴)"""
+        # 기본 간격마다 한 번 바뀐다는 약한 사전값
+        prior = 0.5
+        rate = (state['changes'] + prior) / (state['observed'] + prior * base_interval)
+        interval = 1.0 / (rate * self.checks_per_change)
+        return min(self.max_interval, max(self.min_interval, interval))
+
+    def observe(self, website_name: str, changed: bool, now: Optional[float] = None):
+        """수집 결과(변경 여부)를 반영하고 상태 저장"""
+        now = time.time() if now is None else now
+        with self._lock:
+            state = self.state.get(website_name)
+            if state is None:
+                return
+            elapsed = now - state['last_checked'] if state['last_checked'] else state['interval']
+            decay = 0.5 ** (elapsed / self.half_life)
+            state['changes'] = state['changes'] * decay + (1.0 if changed else 0.0)
+            state['observed'] = state['observed'] * decay + elapsed
+            state['checks'] += 1
+            state['last_checked'] = now
+            state['interval'] = self.target_interval(state, self.base_intervals[website_name])
+            values = (website_name, state['interval'], state['changes'], state['observed'], state['checks'], now)
+        
+        try:
+            with self.db_manager._lock, self.db_manager.conn as conn:
+                conn.execute('''
+                    INSERT OR REPLACE INTO adaptive_state
+                    (website_name, interval_seconds, changes, observed_seconds, checks, last_checked, updated_at)
+                    VALUES (?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+                ''', values)
+        except sqlite3.Error as e:
+            logging.error(f"적응형 상태 저장 실패 {website_name}: {e}")
+
+    def budget_scale(self) -> float:
+        """시간당 요청 예산을 넘지 않도록 하는 간격 배율 (1 이상)"""
+        if not self.max_requests_per_hour:
+            return 1.0
+        requests_per_hour = sum(3600.0 / state['interval'] for state in self.state.values())
+        return max(1.0, requests_per_hour / self.max_requests_per_hour)
+
+    def interval(self, website_name: str) -> float:
+        """현재 적용할 수집 간격(초)"""
+        with self._lock:
+            return min(self.max_interval, self.state[website_name]['interval'] * self.budget_scale())
+
+class AdaptiveSchedule:
+    """AdaptiveFrequency가 정한 간격으로 실행하는 스케줄"""
+
+    def __init__(self, adaptive: AdaptiveFrequency, website_name: str):
+        self.adaptive = adaptive
+        self.website_name = website_name
+
+    def next_after(self, timestamp: float) -> float:
+        """timestamp 이후 첫 실행 시각"""
+        return timestamp + self.adaptive.interval(self.website_name)
+
+class ScheduledJob:
+    """스케줄러에 등록된 작업"""
+
+    def __init__(self, name: str, schedule, func: Callable[[], Any], offset: float = 0.0):
+        self.name = name
+        self.schedule = schedule
+        self.func = func
+        self.offset = offset
+        self.running = False
+
+    def next_due(self, after: float) -> float:
+        """after 이후 다음 실행 시각 (작업별 지터 포함)"""
+        return self.schedule.next_after(after - self.offset) + self.offset
+
+class JobScheduler:
+    """우선순위 큐 기반 스케줄러
+
+    다음 실행 시각이 가장 빠른 작업까지 잠들었다가 깨어나 실행하며, 같은 작업이 아직
+    실행 중이면 그 회차는 건너뜁니다(중복 실행 방지).
+    """
+
+    def __init__(self, max_workers: int = 5):
+        self._heap: List[tuple] = []
+        self._counter = 0
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stopped = threading.Event()
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='scheduler')
+
+    @staticmethod
+    def jitter_offset(name: str, jitter: float) -> float:
+        """작업 이름에서 정해지는 고정 지터 (0 ~ jitter초)"""
+        if jitter <= 0:
+            return 0.0
+        digest = hashlib.blake2b(name.encode('utf-8'), digest_size=4).digest()
+        return int.from_bytes(digest, 'big') % int(jitter * 1000) / 1000
+
+    def add(self, job: ScheduledJob, now: Optional[float] = None) -> float:
+        """작업 등록 (첫 실행 시각 반환)"""
+        due = job.next_due(time.time() if now is None else now)
+        self._push(due, job)
+        return due
+
+    def _push(self, due: float, job: ScheduledJob):
+        with self._lock:
+            self._counter += 1
+            heapq.heappush(self._heap, (due, self._counter, job))
+        self._wakeup.set()
+
+    def run(self):
+        """중지될 때까지 작업 실행"""
+        while not self._stopped.is_set():
+            with self._lock:
+                due = self._heap[0][0] if self._heap else None
+            
+            delay = None if due is None else due - time.time()
+            if delay is None or delay > 0:
+                self._wakeup.clear()
+                self._wakeup.wait(delay)
+                continue
+            
+            with self._lock:
+                due, _, job = heapq.heappop(self._heap)
+            self._dispatch(job)
+            
+            # 실행이 밀렸으면 지난 회차는 건너뛰고 다음 시각으로
+            now = time.time()
+            next_due = job.next_due(due)
+            if next_due <= now:
+                next_due = job.next_due(now)
+            self._push(next_due, job)
+
+    def _dispatch(self, job: ScheduledJob):
+        """작업을 워커에 넘김 (이전 회차가 실행 중이면 건너뜀)"""
+        with self._lock:
+            if job.running:
+                logging.warning(f"이전 실행이 끝나지 않아 건너뜀: {job.name}")
+                return
+            job.running = True
+        self.executor.submit(self._run_job, job)
+
+    def _run_job(self, job: ScheduledJob):
+        try:
+            job.func()
+        except Exception as e:
+            logging.error(f"예약 작업 실패 {job.name}: {e}")
+        finally:
+            with self._lock:
+                job.running = False
+
+    def stop(self):
+        """스케줄러 중지 (실행 중인 작업은 끝날 때까지 대기)"""
+        self._stopped.set()
+        self._wakeup.set()
+        self.executor.shutdown(wait=True)
+
+class JobLeaseManager:
+    """임대(lease) 기반 작업 분배 클래스 (scrape_jobs 테이블)
+
+    같은 SQLite 파일을 쓰는 여러 프로세스/서버의 워커가 실행 시각이 된 작업을 원자적으로
+    가져갑니다(BEGIN IMMEDIATE). 실행 중에는 하트비트로 임대를 연장하고, 워커가 죽으면
+    임대가 만료된 뒤 다른 워커가 그 작업을 다시 가져갑니다. 시각은 에포크 초이므로
+    여러 서버에서 사용할 때는 시계가 동기화되어 있어야 합니다.
+    """
+
+    def __init__(self, db_manager: DatabaseManager, worker_id: Optional[str] = None, lease_seconds: float = 60):
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self.lease_seconds = lease_seconds
+        self.conn = db_manager.connect()
+        self.conn.isolation_level = None  # 트랜잭션을 직접 제어
+        self._lock = threading.Lock()
+        self.held: set = set()
+
+    @contextmanager
+    def transaction(self):
+        """쓰기 잠금을 잡은 트랜잭션"""
+        with self._lock:
+            self.conn.execute('BEGIN IMMEDIATE')
+            try:
+                yield self.conn
+            except Exception:
+                self.conn.execute('ROLLBACK')
+                raise
+            self.conn.execute('COMMIT')
+
+    def register(self, jobs: Dict[str, float]):
+        """작업 등록 (이미 있는 작업은 다른 워커가 정한 실행 시각 유지)"""
+        with self.transaction() as conn:
+            conn.executemany(
+                'INSERT OR IGNORE INTO scrape_jobs (job_name, next_due) VALUES (?, ?)',
+                list(jobs.items())
+            )
+
+    def claim(self, job_names: List[str], limit: int, now: Optional[float] = None) -> List[str]:
+        """실행 시각이 지났고 임대 중이 아닌(또는 만료된) 작업을 최대 limit개 가져옴"""
+        if limit <= 0 or not job_names:
+            return []
+        now = time.time() if now is None else now
+        placeholders = ', '.join('?' * len(job_names))
+        with self.transaction() as conn:
+            claimed = [row[0] for row in conn.execute(f'''
+                SELECT job_name FROM scrape_jobs
+                WHERE next_due <= ? AND (lease_owner IS NULL OR lease_expires < ?) AND job_name IN ({placeholders})
+                ORDER BY next_due LIMIT ?
+            ''', [now, now, *job_names, limit])]
+            conn.executemany('''
+                UPDATE scrape_jobs
+                SET lease_owner = ?, lease_expires = ?, heartbeat_at = ?, last_started = ?, runs = runs + 1
+                WHERE job_name = ?
+            ''', [(self.worker_id, now + self.lease_seconds, now, now, name) for name in claimed])
+        self.held.update(claimed)
+        return claimed
+
+    def heartbeat(self) -> int:
+        """가지고 있는 작업의 임대 연장 (연장된 작업 수 반환)"""
+        held = list(self.held)
+        if not held:
+            return 0
+        now = time.time()
+        placeholders = ', '.join('?' * len(held))
+        with self.transaction() as conn:
+            cursor = conn.execute(f'''
+                UPDATE scrape_jobs SET lease_expires = ?, heartbeat_at = ?
+                WHERE lease_owner = ? AND job_name IN ({placeholders})
+            ''', [now + self.lease_seconds, now, self.worker_id, *held])
+            return cursor.rowcount
+
+    def complete(self, job_name: str, next_due: float, status: str) -> bool:
+        """작업 완료 기록 및 임대 반납 (임대를 잃었으면 False)"""
+        self.held.discard(job_name)
+        with self.transaction() as conn:
+            cursor = conn.execute('''
+                UPDATE scrape_jobs
+                SET lease_owner = NULL, lease_expires = NULL, next_due = ?, last_finished = ?, last_status = ?
+                WHERE job_name = ? AND lease_owner = ?
+            ''', (next_due, time.time(), status, job_name, self.worker_id))
+            if cursor.rowcount == 0:
+                logging.warning(f"임대가 만료되어 다른 워커가 가져간 작업: {job_name}")
+                return False
+        return True
+
+    def next_due(self, job_names: List[str]) -> Optional[float]:
+        """임대 가능한 작업 중 가장 빠른 실행 시각"""
+        if not job_names:
+            return None
+        placeholders = ', '.join('?' * len(job_names))
+        with self._lock:
+            row = self.conn.execute(f'''
+                SELECT MIN(CASE WHEN lease_owner IS NULL THEN next_due ELSE MAX(next_due, lease_expires) END)
+                FROM scrape_jobs WHERE job_name IN ({placeholders})
+            ''', job_names).fetchone()
+        return row[0] if row else None
+
+    def release_all(self):
+        """종료 시 가진 임대를 모두 반납 (실행 시각은 그대로 두어 다른 워커가 바로 가져감)"""
+        held = list(self.held)
+        self.held.clear()
+        if held:
+            placeholders = ', '.join('?' * len(held))
+            with self.transaction() as conn:
+                conn.execute(f'''
+                    UPDATE scrape_jobs SET lease_owner = NULL, lease_expires = NULL
+                    WHERE lease_owner = ? AND job_name IN ({placeholders})
+                ''', [self.worker_id, *held])
+        self.conn.close()
+
+def check_search_query(query: str) -> Optional[str]:
+    """FTS5 검색식 문법 확인 (오류 메시지, 정상이거나 FTS5가 없으면 None)"""
+    conn = sqlite3.connect(':memory:')
+    try:
+        conn.execute("CREATE VIRTUAL TABLE q USING fts5(title, content)")
+    except sqlite3.OperationalError:
+        conn.close()
+        return None
+    try:
+        conn.execute('SELECT rowid FROM q WHERE q MATCH ?', (query,)).fetchall()
+        return None
+    except sqlite3.OperationalError as e:
+        return str(e)
+    finally:
+        conn.close()
+
+REQUIRED_GENERAL_SETTINGS = ('max_retries', 'timeout', 'user_agent')
+
+def validate_config(config: Dict[str, Any]) -> List[str]:
+    """설정 검증 (발견한 오류 메시지 목록 반환, 비어 있으면 정상)"""
+    errors = []
+    for section in ('websites', 'general_settings', 'notifications', 'export_settings'):
+        if section not in config:
+            errors.append(f"필수 항목 누락: {section}")
+    
+    general = config.get('general_settings', {})
+    for key in REQUIRED_GENERAL_SETTINGS:
+        if key not in general:
+            errors.append(f"general_settings.{key} 누락")
+    
+    schedules = [('general_settings.default_schedule', general.get('default_schedule', '*/30'))]
+    if general.get('storage', {}).get('compaction_schedule'):
+        schedules.append(('general_settings.storage.compaction_schedule', general['storage']['compaction_schedule']))
+    export_settings = config.get('export_settings', {})
+    if export_settings.get('export_schedule', 'daily') != 'daily':
+        schedules.append(('export_settings.export_schedule', export_settings['export_schedule']))
+    if export_settings.get('format', 'xlsx') not in ReportExporter.SINKS:
+        errors.append(f"export_settings.format 지원하지 않는 형식: {export_settings['format']}")
+    
+    seen_names = set()
+    for index, website_config in enumerate(config.get('websites', [])):
+        name = website_config.get('name')
+        label = name or f"websites[{index}]"
+        if not name:
+            errors.append(f"{label}: name 누락")
+        elif name in seen_names:
+            errors.append(f"{label}: 중복된 웹사이트 이름")
+        seen_names.add(name)
+        
+        if urlparse(website_config.get('url', '')).scheme not in ('http', 'https'):
+            errors.append(f"{label}: url이 http(s) 주소가 아닙니다 ({website_config.get('url')})")
+        
+        selectors = dict(website_config.get('selectors', {}))
+        if not selectors:
+            errors.append(f"{label}: selectors 누락")
+        if website_config.get('mode') == 'list':
+            if not website_config.get('item_selector'):
+                errors.append(f"{label}: list 모드에는 item_selector가 필요합니다")
+            else:
+                selectors['item_selector'] = website_config['item_selector']
+        for key in ('next_page_selector', 'follow_selector'):
+            if website_config.get('crawl', {}).get(key):
+                selectors[f"crawl.{key}"] = website_config['crawl'][key]
+        for field, selector in selectors.items():
+            if not selector:
+                continue
+            try:
+                compile_selector(selector)
+            except Exception as e:
+                errors.append(f"{label}: 선택자 오류 {field}={selector!r} ({str(e).splitlines()[0]})")
+        
+        if 'schedule' in website_config:
+            schedules.append((f"{label}.schedule", website_config['schedule']))
+    
+    for index, alert in enumerate(config.get('notifications', {}).get('keyword_alerts', [])):
+        label = f"keyword_alerts[{index}]"
+        if not alert.get('query'):
+            errors.append(f"{label}: query 누락")
+            continue
+        error = check_search_query(alert['query'])
+        if error:
+            errors.append(f"{label}: 검색식 오류 {alert['query']!r} ({error})")
+    
+    for label, schedule_str in schedules:
         try:
-            response = requests.post(
-                self.webhook_config['url'],
-                json=data,
-                timeout=10
-            )
-            response.raise_for_status()
-            
-            logging.info("웹훅 전송 완료")
-            return True
-            
-        except Exception as e:
-            logging.error(f"웹훅 전송 실패: {e}")
-            return False
+            parse_schedule(schedule_str)
+        except (ValueError, AttributeError) as e:
+            errors.append(f"{label}: 스케줄 오류 {schedule_str!r} ({e})")
+    return errors
 
 class AdvancedWebScraper:
     """고급 웹 스크래핑 메인 클래스"""
     
+    REPORT_JOB_NAME = '__report__'
+    COMPACTION_JOB_NAME = '__compaction__'
+    
     def __init__(self, config_path: str = "scraper_config.json"):
         self.setup_logging()
         self.load_config(config_path)
-        self.db_manager = DatabaseManager()
+        self.db_manager = DatabaseManager(
+            batch_size=self.config['general_settings'].get('db_batch_size', 100),
+            flush_interval=self.config['general_settings'].get('db_flush_interval', 0.5),
+            fingerprint_cache_size=self.config['general_settings'].get('fingerprint_cache_size', 256),
+            compression=self.config['general_settings'].get('storage', {})
+        )
+        self.change_detector = ChangeDetector(self.db_manager)
         self.notification_manager = NotificationManager(self.config.get('notifications', {}))
+        self.keyword_alerts = self.config.get('notifications', {}).get('keyword_alerts', [])
         self.session = requests.Session()
         self.setup_session()
+        self.rate_limiter = HostRateLimiter(self.config['general_settings']['delay_between_requests'])
+        self.driver_pool = SeleniumDriverPool(
+            self.get_selenium_driver,
+            max_size=self.config['general_settings'].get('selenium_pool_size', 2),
+            max_pages_per_driver=self.config['general_settings'].get('selenium_max_pages_per_driver', 50)
+        )
+        self.crawl_frontier = CrawlFrontier(self.db_manager)
+        self.parse_pool = self.create_parse_pool()
+        self.metrics_exporter = MetricsExporter(METRICS, self.config['general_settings'].get('metrics', {}))
+        self.metrics_exporter.start()
+        self.validator_cache = ValidatorCache(
+            self.db_manager,
+            legacy_path=os.path.join(os.path.dirname(os.path.abspath(self.db_manager.db_path)), 'http_cache.json')
+        )
+        
+    def close(self):
+        """사용 중인 리소스 정리"""
+        self.driver_pool.close()
+        self.session.close()
+        if self.parse_pool is not None:
+            self.parse_pool.close()
+        # 마지막 저장 콜백이 만드는 알림까지 전송되도록 DB를 먼저 닫음
+        self.db_manager.close()
+        self.notification_manager.close()
+        self.metrics_exporter.close()
         
     def setup_logging(self):
         """로깅 설정"""
@@ -222,7 +3125,8 @@ class AdvancedWebScraper:
             logging.error(f"설정 파일 로드 실패: {e}")
             self.config = self.create_default_config()
     
-    def create_default_config(self) -> Dict[str, Any]:
+    @staticmethod
+    def create_default_config() -> Dict[str, Any]:
         """기본 설정 생성"""
         return {
             "websites": [
@@ -244,7 +3148,65 @@ class AdvancedWebScraper:
                 "timeout": 10,
                 "max_retries": 3,
                 "delay_between_requests": 1,
-                "max_workers": 5
+                "max_workers": 5,
+                "conditional_get": True,
+                "selenium_pool_size": 2,
+                "selenium_max_pages_per_driver": 50,
+                "db_batch_size": 100,
+                "db_flush_interval": 0.5,
+                "fingerprint_cache_size": 256,
+                "store_full_results": True,
+                "parser": "html.parser",
+                "parse_mode": "full",
+                "default_schedule": "*/30",
+                "schedule_jitter": 60,
+                "parse_workers": 0,
+                "parse_chunk_size": 1,
+                "parse_chunk_wait": 0.05,
+                "max_in_flight_bodies": 10,
+                "max_download_bytes": 10485760,
+                "allowed_content_types": ["text/html", "application/xhtml+xml", "application/xml", "text/xml", "text/plain"],
+                "early_stop": True,
+                "worker": {
+                    "lease_seconds": 60,
+                    "poll_interval": 5
+                },
+                "adaptive": {
+                    "enabled": False,
+                    "min_interval_minutes": 5,
+                    "max_interval_minutes": 720,
+                    "max_requests_per_hour": 0,
+                    "checks_per_change": 2,
+                    "decay_hours": 24,
+                    "lookback_hours": 168
+                },
+                "metrics": {
+                    "enabled": False,
+                    "host": "127.0.0.1",
+                    "port": 9108,
+                    "snapshot_path": "metrics.json",
+                    "snapshot_interval": 60
+                },
+                "archive": {
+                    "enabled": False,
+                    "compress_level": 6,
+                    "max_age_days": 30
+                },
+                "storage": {
+                    "compress": True,
+                    "compress_min_bytes": 256,
+                    "compress_level": 6,
+                    "dictionary_size": 32768,
+                    "dictionary_samples": 20,
+                    "retention": {
+                        "max_age_days": 0,
+                        "max_rows": 0
+                    },
+                    "compaction_schedule": "*/60",
+                    "compaction_batch_rows": 500,
+                    "vacuum_pages": 256,
+                    "compaction_max_seconds": 30
+                }
             },
             "notifications": {
                 "email": {
@@ -257,18 +3219,37 @@ class AdvancedWebScraper:
                 },
                 "webhook": {
                     "enabled": False,
-                    "url": "https://hooks.example.com/webhook"
-                }
+                    "url": "https://hooks.example.com/webhook",
+                    "batch_size": 50,
+                    "batch_interval": 2,
+                    "max_retries": 3,
+                    "spool_path": "webhook_spool.jsonl"
+                },
+                "digest_window": 30,
+                "max_digest_events": 100,
+                "queue_size": 1000,
+                "enqueue_timeout": 5,
+                "smtp_idle_timeout": 300,
+                "keyword_alerts": []
             },
             "export_settings": {
                 "excel_export": True,
                 "export_schedule": "daily",
-                "max_records_per_file": 10000
+                "format": "xlsx",
+                "max_records_per_file": 10000,
+                "chunk_size": 1000,
+                "output_dir": "."
             }
         }
     
     def setup_session(self):
         """HTTP 세션 설정"""
+        # 워커 스레드들이 세션을 공유하므로 연결 풀 크기를 max_workers에 맞춤
+        pool_size = self.get_max_workers()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        
         headers = {
             'User-Agent': self.config['general_settings']['user_agent'],
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
@@ -279,8 +3260,31 @@ class AdvancedWebScraper:
         }
         self.session.headers.update(headers)
     
-    def get_selenium_driver(self) -> webdriver.Chrome:
+    def create_parse_pool(self) -> Optional[ParsePool]:
+        """general_settings.parse_workers가 1 이상이면 파싱 프로세스 풀 생성"""
+        general = self.config['general_settings']
+        parse_workers = general.get('parse_workers', 0)
+        if parse_workers <= 0:
+            return None
+        return ParsePool(
+            max_workers=parse_workers,
+            max_in_flight=general.get('max_in_flight_bodies', self.get_max_workers() * 2),
+            chunk_size=general.get('parse_chunk_size', 1),
+            chunk_wait=general.get('parse_chunk_wait', 0.05)
+        )
+    
+    def get_max_workers(self) -> int:
+        """동시 스크래핑 워커 수"""
+        try:
+            return max(1, int(self.config['general_settings'].get('max_workers', 1)))
+        except (TypeError, ValueError):
+            return 1
+    
+    def get_selenium_driver(self) -> 'webdriver.Chrome':
         """Selenium 드라이버 생성"""
+        from selenium import webdriver
+        from selenium.webdriver.chrome.options import Options
+        
         options = Options()
         options.add_argument('--headless')
         options.add_argument('--no-sandbox')
@@ -305,161 +3309,623 @@ class AdvancedWebScraper:
         url = website_config['url']
         logging.info(f"스크래핑 시작: {website_config['name']} - {url}")
         
+        data = None
         try:
-            if website_config.get('use_selenium', False):
-                return self.scrape_with_selenium(website_config)
+            if website_config.get('crawl'):
+                data = self.scrape_with_crawl(website_config)
+            elif website_config.get('use_selenium', False):
+                data = self.scrape_with_selenium(website_config)
             else:
-                return self.scrape_with_requests(website_config)
+                data = self.scrape_with_requests(website_config)
+            return data
                 
         except Exception as e:
             logging.error(f"스크래핑 실패 {website_config['name']}: {e}")
             return None
+        finally:
+            result = 'failed' if not data else ('unchanged' if data.get('status') == 'unchanged' else 'ok')
+            METRICS.inc('scraper_scrapes_total', site=website_config['name'], result=result)
     
-    def scrape_with_requests(self, website_config: Dict[str, Any]) -> Optional[Dict[str, Any]]:
-        """requests를 사용한 스크래핑"""
-        url = website_config['url']
+    def wait_for_host(self, website_config: Dict[str, Any], url: Optional[str] = None):
+        """호스트별 요청 간격 대기 (웹사이트별 request_interval 우선)"""
+        self.rate_limiter.wait(url or website_config['url'], website_config.get('request_interval'))
+    
+    def fetch_page(self, website_config: Dict[str, Any], url: str, use_conditional: bool = False,
+                   early_stop: bool = True) -> Optional[tuple]:
+        """페이지 스트리밍 다운로드 (재시도/지수 백오프 포함)
+
+        반환: (응답, 본문 바이트), 304 응답이면 None
+        """
         max_retries = self.config['general_settings']['max_retries']
+        site = website_config['name']
         
         for attempt in range(max_retries):
+            if attempt:
+                METRICS.inc('scraper_retries_total', site=site)
             try:
-                response = self.session.get(
-                    url, 
-                    timeout=self.config['general_settings']['timeout']
-                )
-                response.raise_for_status()
+                headers = self.validator_cache.conditional_headers(url) if use_conditional else {}
                 
-                soup = BeautifulSoup(response.content, 'html.parser')
-                return self.extract_data(soup, website_config)
+                with METRICS.timer('scraper_stage_seconds', stage='rate_limit_wait', site=site):
+                    self.wait_for_host(website_config, url)
+                with METRICS.timer('scraper_stage_seconds', stage='download', site=site):
+                    response = self.session.get(
+                        url, 
+                        headers=headers,
+                        timeout=self.config['general_settings']['timeout'],
+                        stream=True
+                    )
+                    try:
+                        # 연결(DNS 포함)부터 응답 헤더 수신까지
+                        METRICS.observe('scraper_stage_seconds', response.elapsed.total_seconds(), stage='response_headers', site=site)
+                        METRICS.inc('scraper_http_responses_total', site=site, status=response.status_code)
+                        
+                        if response.status_code == 304:
+                            return None
+                        
+                        response.raise_for_status()
+                        body = self.read_body(response, website_config, early_stop)
+                    finally:
+                        response.close()
+                return response, body
                 
             except requests.RequestException as e:
+                if getattr(e, 'response', None) is None:
+                    METRICS.inc('scraper_http_responses_total', site=site, status='error')
                 logging.warning(f"요청 실패 (시도 {attempt + 1}/{max_retries}): {e}")
                 if attempt < max_retries - 1:
                     time.sleep(2 ** attempt)  # 지수 백오프
                 else:
                     raise
     
-    def scrape_with_selenium(self, website_config: Dict[str, Any]) -> Optional[Dict[str, Any]]:
-        """Selenium을 사용한 스크래핑"""
-        driver = None
+    def read_body(self, response: requests.Response, website_config: Dict[str, Any], early_stop: bool = True) -> bytes:
+        """응답 본문을 조각 단위로 읽기 (Content-Type/크기 제한 확인, 선택자가 모두 나오면 조기 종료)"""
+        general = self.config['general_settings']
+        site = website_config['name']
+        max_bytes = website_config.get('max_bytes', general.get('max_download_bytes', DEFAULT_MAX_DOWNLOAD_BYTES))
+        allowed_types = website_config.get('allowed_content_types', general.get('allowed_content_types', DEFAULT_CONTENT_TYPES))
+        
+        # 본문을 읽기 전에 헤더로 먼저 거부
+        content_type = response.headers.get('Content-Type', '').split(';', 1)[0].strip().lower()
+        if content_type and allowed_types and content_type not in allowed_types:
+            raise DownloadRejected(f"허용되지 않는 Content-Type: {content_type}")
+        content_length = response.headers.get('Content-Length', '')
+        if max_bytes and content_length.isdigit() and int(content_length) > max_bytes:
+            raise DownloadRejected(f"크기 제한 초과: {content_length}바이트 (제한 {max_bytes}바이트)")
+        
+        # 조기 종료 판단은 lxml 기준이므로 다른 파서로 파싱할 때는 본문 전체를 받음
+        # (html.parser는 잘린 문서에서 닫히지 않은 태그의 텍스트를 다르게 추출함)
+        parser = website_config.get('parser', general.get('parser', DEFAULT_PARSER))
+        detector = None
+        if (early_stop and parser == 'lxml' and website_config.get('mode') != 'list'
+                and website_config.get('early_stop', general.get('early_stop', True))):
+            detector = EarlyStopDetector.for_selectors(website_config.get('selectors', {}))
+        
+        chunks = []
+        size = 0
         try:
-            driver = self.get_selenium_driver()
-            driver.get(website_config['url'])
+            for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                size += len(chunk)
+                if max_bytes and size > max_bytes:
+                    raise DownloadRejected(f"크기 제한 초과: {max_bytes}바이트 이상")
+                chunks.append(chunk)
+                if detector is not None and detector.feed(chunk):
+                    METRICS.inc('scraper_early_stops_total', site=site)
+                    break
+        finally:
+            METRICS.inc('scraper_bytes_downloaded_total', size, site=site)
+        return b''.join(chunks)
+    
+    def scrape_with_requests(self, website_config: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """requests를 사용한 스크래핑"""
+        url = website_config['url']
+        use_conditional = self.config['general_settings'].get('conditional_get', True)
+        
+        # 보관할 본문은 나중에 다른 선택자로 다시 추출할 수 있도록 끝까지 받음
+        archiving = self.archive_enabled(website_config)
+        fetched = self.fetch_page(website_config, url, use_conditional, early_stop=not archiving)
+        
+        # 304: 페이지 변경 없음 → 파싱/추출 생략
+        if fetched is None:
+            logging.info(f"변경 없음 (304): {website_config['name']}")
+            return self.make_unchanged_result(website_config)
+        
+        response, body = fetched
+        if archiving:
+            self.archive_response(website_config, url, body)
+        data = self.parse_and_extract(body, website_config)
+        if use_conditional:
+            self.validator_cache.update(url, response)
+        return data
+    
+    def scrape_with_crawl(self, website_config: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """크롤링 모드: 다음 페이지/링크를 따라가며 페이지별 결과를 바로 저장
+
+        방문할 URL은 crawl_frontier 테이블에 저장되므로 중단 후 재시작하면 이어서 진행합니다.
+        """
+        crawl = website_config['crawl']
+        name = website_config['name']
+        max_depth = crawl.get('max_depth', 1)
+        max_pages = crawl.get('max_pages', 50)
+        
+        archiving = self.archive_enabled(website_config)
+        resumed = self.crawl_frontier.start(name, website_config['url'])
+        if resumed:
+            logging.info(f"크롤링 이어서 진행: {name} (대기 {resumed}페이지)")
+        
+        futures = []
+        pages = 0
+        failed = 0
+        total_items = 0
+        while pages < max_pages:
+            entry = self.crawl_frontier.next_pending(name)
+            if entry is None:
+                break
+            entry_id, page_url, depth = entry
+            page_config = dict(website_config, url=page_url)
             
-            # 페이지 로드 대기
-            WebDriverWait(driver, 10).until(
-                EC.presence_of_element_located((By.TAG_NAME, "body"))
-            )
+            try:
+                # 링크를 찾아야 하므로 조기 종료 없이 전체 본문을 받음
+                _, body = self.fetch_page(page_config, page_url, early_stop=False)
+            except (requests.RequestException, DownloadRejected) as e:
+                logging.error(f"크롤링 페이지 실패 {name} - {page_url}: {e}")
+                self.crawl_frontier.mark(entry_id, 'failed')
+                failed += 1
+                continue
             
-            # 추가 대기 시간 (JavaScript 로딩)
-            time.sleep(3)
+            if archiving:
+                self.archive_response(page_config, page_url, body)
+            soup = self.parse_html(body, page_config)
+            page = self.extract_data(soup, page_config)
+            page = dict(page, items=self.page_records(page, website_config, page_url))
             
-            html = driver.page_source
-            soup = BeautifulSoup(html, 'html.parser')
-            return self.extract_data(soup, website_config)
+            # 링크 수집: 다음 페이지는 같은 깊이, 상세 링크는 깊이 + 1
+            if crawl.get('next_page_selector'):
+                self.crawl_frontier.add(name, self.select_links(soup, crawl['next_page_selector'], page_url, crawl), depth)
+            if crawl.get('follow_selector') and depth < max_depth:
+                self.crawl_frontier.add(name, self.select_links(soup, crawl['follow_selector'], page_url, crawl), depth + 1)
+            
+            futures.append(self.process_scraped_items(page))
+            total_items += len(page['items'])
+            self.crawl_frontier.mark(entry_id, 'done')
+            pages += 1
+        
+        if pages >= max_pages or self.crawl_frontier.next_pending(name) is None:
+            # 페이지 예산 소진 또는 대기 URL 없음 → 이번 주기 종료
+            self.crawl_frontier.finish(name)
+        
+        new_count = 0
+        for future in futures:
+            try:
+                results = future.result()
+            except Exception:
+                continue  # 저장 실패는 on_items_stored에서 기록
+            if results:
+                new_count += sum(1 for is_new in results if is_new)
+        
+        logging.info(f"크롤링 완료: {name} ({pages}페이지, 항목 {total_items}건, 신규 {new_count}건, 실패 {failed}페이지)")
+        return {
+            'website_name': name,
+            'url': website_config['url'],
+            'scraped_at': datetime.now().isoformat(),
+            'status': 'crawled',
+            'pages': pages,
+            'item_count': total_items,
+            'is_new': new_count > 0
+        }
+    
+    @staticmethod
+    def page_records(page: Dict[str, Any], website_config: Dict[str, Any], page_url: str) -> List[Dict[str, Any]]:
+        """추출 결과를 저장할 레코드 목록으로 변환
+
+        목록 모드는 항목들, 크롤링 모드의 단일 모드 페이지는 URL까지 포함한 지문의 항목 하나,
+        그 외에는 페이지 자체를 레코드로 취급합니다.
+        """
+        if 'items' in page:
+            return page['items']
+        if website_config.get('crawl'):
+            fields = {k: v for k, v in page.items() if k not in RECORD_META_FIELDS}
+            page = dict(page, hash_value=compute_fingerprint(website_config['name'], dict(fields, page_url=page_url)))
+        return [dict(page)]
+    
+    def archive_enabled(self, website_config: Dict[str, Any]) -> bool:
+        """원본 응답 보관 여부 (웹사이트별 archive 설정 우선)"""
+        return website_config.get('archive', self.config['general_settings'].get('archive', {}).get('enabled', False))
+    
+    def archive_response(self, website_config: Dict[str, Any], url: str, body: bytes):
+        """원본 응답을 보관 대기열에 추가 (본문 해시로 중복 제거)"""
+        archive_settings = self.config['general_settings'].get('archive', {})
+        self.db_manager.enqueue_archive(website_config['name'], url, body, archive_settings.get('compress_level', 6))
+    
+    def reextract_archive(self, website_names: Optional[List[str]] = None, since: Optional[datetime] = None,
+                          until: Optional[datetime] = None, workers: Optional[int] = None,
+                          dry_run: bool = False) -> Dict[str, int]:
+        """보관된 원본 응답을 현재 선택자로 다시 추출해 저장 (네트워크 사용 없음)
+
+        선택자를 고친 뒤 실행하면 이미 저장된 것과 지문이 다른 결과만 원래 수집 시각으로
+        추가됩니다. 변경 기록과 알림은 만들지 않습니다. 같은 URL의 같은 본문은 한 번만 파싱합니다.
+        workers: 파싱 프로세스 수 (기본: CPU 수, parse_workers 설정 시 기존 풀 사용)
+        dry_run: 저장하지 않고 추출 건수만 집계
+        """
+        sites = {
+            website_config['name']: website_config for website_config in self.config['websites']
+            if not website_names or website_config['name'] in website_names
+        }
+        stats = {'pages': 0, 'records': 0, 'new': 0, 'failed': 0}
+        if not sites:
+            return stats
+        
+        general = self.config['general_settings']
+        workers = workers or os.cpu_count() or 1
+        pool = self.parse_pool
+        own_pool = pool is None and workers > 1
+        if own_pool:
+            pool = ParsePool(max_workers=workers, max_in_flight=workers * 4, chunk_size=4)
+        
+        stats_lock = threading.Lock()
+        insert_futures: List[Future] = []
+        
+        def store(fetch: Dict[str, Any], page: Dict[str, Any]):
+            records = self.page_records(page, sites[fetch['website_name']], fetch['url'])
+            for record in records:
+                record['fetched_at'] = fetch['fetched_at']
+            with stats_lock:
+                stats['pages'] += 1
+                stats['records'] += len(records)
+                if records and not dry_run:
+                    insert_futures.append(self.db_manager.enqueue_insert_many(records))
+        
+        def on_parsed(fetch: Dict[str, Any], future: Future):
+            try:
+                store(fetch, future.result())
+            except Exception as e:
+                logging.error(f"재추출 실패 {fetch['website_name']} - {fetch['url']} ({fetch['fetched_at']}): {e}")
+                with stats_lock:
+                    stats['failed'] += 1
+        
+        logging.info(f"보관 응답 재추출 시작: {', '.join(sites)} (프로세스 {workers if pool else 1}개)")
+        started = time.time()
+        pending: List[Future] = []
+        try:
+            for fetch in self.db_manager.iter_archive(list(sites), since, until):
+                page_config = dict(sites[fetch['website_name']], url=fetch['url'])
+                body = fetch.pop('body')
+                if pool is None:
+                    future: Future = Future()
+                    try:
+                        future.set_result(self.parse_and_extract(body, page_config))
+                    except Exception as e:
+                        future.set_exception(e)
+                else:
+                    # 본문은 작업 대기열에만 두고 콜백에는 메타데이터만 넘김 (메모리 유지)
+                    future = pool.submit(
+                        body,
+                        {key: page_config[key] for key in ParsePool.CONFIG_KEYS if key in page_config},
+                        page_config.get('parser', general.get('parser', DEFAULT_PARSER)),
+                        page_config.get('parse_mode', general.get('parse_mode', 'full')),
+                        self.get_parse_selectors(page_config)
+                    )
+                future.add_done_callback(lambda f, fetch=fetch: on_parsed(fetch, f))
+                pending.append(future)
+                if len(pending) >= 1000:
+                    pending = [f for f in pending if not f.done()]
+            for future in pending:
+                try:
+                    future.result()
+                except Exception:
+                    pass  # on_parsed에서 기록
+        finally:
+            if own_pool:
+                pool.close()
+        
+        for future in insert_futures:
+            try:
+                stats['new'] += sum(1 for is_new in future.result() if is_new)
+            except Exception as e:
+                logging.error(f"재추출 결과 저장 실패: {e}")
+        
+        logging.info(
+            f"보관 응답 재추출 완료: {stats['pages']}페이지, 레코드 {stats['records']}건, "
+            f"신규 {stats['new']}건, 실패 {stats['failed']}페이지 ({time.time() - started:.1f}초)"
+        )
+        return stats
+    
+    @staticmethod
+    def select_links(soup: BeautifulSoup, selector: str, page_url: str, crawl: Dict[str, Any]) -> List[str]:
+        """선택자와 일치하는 링크를 절대 URL로 변환 (기본: 같은 호스트만)"""
+        host = urlparse(page_url).netloc.lower()
+        links = []
+        for element in compile_selector(selector).select(soup):
+            href = element.get('href')
+            if not href:
+                continue
+            url = urljoin(page_url, href)
+            parsed = urlparse(url)
+            if parsed.scheme not in ('http', 'https'):
+                continue
+            if crawl.get('same_host_only', True) and parsed.netloc.lower() != host:
+                continue
+            links.append(url)
+        return links
+    
+    def scrape_with_selenium(self, website_config: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Selenium을 사용한 스크래핑"""
+        from selenium.common.exceptions import TimeoutException, WebDriverException
+        
+        site = website_config['name']
+        try:
+            with self.driver_pool.lease() as driver:
+                with METRICS.timer('scraper_stage_seconds', stage='rate_limit_wait', site=site):
+                    self.wait_for_host(website_config)
+                with METRICS.timer('scraper_stage_seconds', stage='selenium', site=site):
+                    driver.get(website_config['url'])
+                    
+                    # 설정된 선택자가 나타날 때까지 대기 (JavaScript 로딩)
+                    self.wait_for_selectors(driver, website_config)
+                    
+                    html = driver.page_source
+                METRICS.inc('scraper_bytes_downloaded_total', len(html.encode('utf-8')), site=site)
+            if self.archive_enabled(website_config):
+                self.archive_response(website_config, website_config['url'], html.encode('utf-8'))
+            
+            return self.parse_and_extract(html, website_config)
             
         except (TimeoutException, WebDriverException) as e:
+            METRICS.inc('scraper_selenium_errors_total', site=site)
             logging.error(f"Selenium 스크래핑 실패: {e}")
             return None
-        finally:
-            if driver:
-                driver.quit()
     
-    def extract_data(self, soup: BeautifulSoup, website_config: Dict[str, Any]) -> Dict[str, Any]:
-        """HTML에서 데이터 추출"""
-        selectors = website_config['selectors']
-        data = {
+    def wait_for_selectors(self, driver: 'webdriver.Chrome', website_config: Dict[str, Any]) -> bool:
+        """설정된 모든 선택자가 나타날 때까지 대기 (시간 초과 시 현재 페이지 사용)"""
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support.ui import WebDriverWait
+        from selenium.common.exceptions import TimeoutException
+        
+        selectors = [s for s in website_config.get('selectors', {}).values() if s]
+        timeout = website_config.get('wait_timeout', self.config['general_settings']['timeout'])
+        
+        def is_ready(d):
+            if not selectors:
+                return bool(d.find_elements(By.TAG_NAME, "body"))
+            return all(d.find_elements(By.CSS_SELECTOR, selector) for selector in selectors)
+        
+        try:
+            WebDriverWait(driver, timeout, poll_frequency=0.2).until(is_ready)
+            return True
+        except TimeoutException:
+            logging.warning(f"선택자 대기 시간 초과 ({timeout}초): {website_config['name']}")
+            return False
+    
+    def make_unchanged_result(self, website_config: Dict[str, Any]) -> Dict[str, Any]:
+        """변경 없음 결과 생성"""
+        return {
             'website_name': website_config['name'],
             'url': website_config['url'],
-            'scraped_at': datetime.now().isoformat()
+            'scraped_at': datetime.now().isoformat(),
+            'status': 'unchanged'
         }
+    
+    def parse_html(self, markup: Any, website_config: Dict[str, Any]) -> BeautifulSoup:
+        """웹사이트 설정(parser, parse_mode)에 맞춰 HTML 파싱"""
+        general = self.config['general_settings']
+        with METRICS.timer('scraper_stage_seconds', stage='parse', site=website_config['name']):
+            return parse_html(
+                markup,
+                parser=website_config.get('parser', general.get('parser', DEFAULT_PARSER)),
+                parse_mode=website_config.get('parse_mode', general.get('parse_mode', 'full')),
+                selectors=self.get_parse_selectors(website_config)
+            )
+    
+    @staticmethod
+    def get_parse_selectors(website_config: Dict[str, Any]) -> Dict[str, str]:
+        """부분 파싱 기준 선택자 (목록 모드는 항목 컨테이너 선택자)"""
+        if website_config.get('mode') == 'list':
+            selectors = {'item': website_config['item_selector']}
+        else:
+            selectors = dict(website_config.get('selectors', {}))
         
-        for field, selector in selectors.items():
-            try:
-                element = soup.select_one(selector)
-                if element:
-                    data[field] = element.get_text(strip=True)
-                else:
-                    data[field] = ""
-            except Exception as e:
-                logging.warning(f"요소 추출 실패 {field}: {e}")
-                data[field] = ""
+        # 크롤링 링크 선택자도 파싱 대상에 포함
+        crawl = website_config.get('crawl') or {}
+        for key in ('next_page_selector', 'follow_selector'):
+            if crawl.get(key):
+                selectors[key] = crawl[key]
+        return selectors
+    
+    def extract_data(self, soup: BeautifulSoup, website_config: Dict[str, Any]) -> Dict[str, Any]:
+        """HTML에서 데이터 추출 (목록 모드는 항목별 레코드를 'items'에 담아 반환)"""
+        with METRICS.timer('scraper_stage_seconds', stage='extract', site=website_config['name']):
+            return extract_record(soup, website_config)
+    
+    def parse_and_extract(self, markup: Any, website_config: Dict[str, Any]) -> Dict[str, Any]:
+        """파싱 + 추출 (parse_workers 설정 시 프로세스 풀에서 실행)"""
+        if self.parse_pool is None:
+            soup = self.parse_html(markup, website_config)
+            return self.extract_data(soup, website_config)
+        
+        general = self.config['general_settings']
+        config = {key: website_config[key] for key in ParsePool.CONFIG_KEYS if key in website_config}
+        with METRICS.timer('scraper_stage_seconds', stage='parse_extract', site=website_config['name']):
+            future = self.parse_pool.submit(
+                markup,
+                config,
+                website_config.get('parser', general.get('parser', DEFAULT_PARSER)),
+                website_config.get('parse_mode', general.get('parse_mode', 'full')),
+                self.get_parse_selectors(website_config)
+            )
+            return future.result()
+    
+    def process_scraped_data(self, data: Dict[str, Any]) -> Future:
+        """스크래핑된 데이터 처리 (쓰기 대기열에 저장, Future 결과: 신규 여부)"""
+        if not data or data.get('status') in ('unchanged', 'crawled'):
+            # 데이터 없음, 304 응답 (변경 없음) 또는 페이지별로 이미 저장된 크롤링 결과
+            future: Future = Future()
+            future.set_result(False)
+            return future
         
-        # 데이터 해시 생성 (중복 검사용)
-        content_hash = str(hash(f"{data.get('title', '')}{data.get('content', '')}{data.get('price', '')}"))
-        data['hash_value'] = content_hash
+        data['is_new'] = False
         
-        return data
+        if 'items' in data:
+            return self.process_scraped_items(data)
+        
+        # 알림 대기열이 가득 차 있으면 여기서(스크래핑 스레드) 기다림 (DB 쓰기 스레드는 막지 않음)
+        self.notification_manager.wait_for_capacity()
+        
+        # 마지막 스냅샷과 필드 단위 비교
+        changes = self.change_detector.detect(data)
+        if not changes:
+            future = Future()
+            future.set_result(False)
+            return future
+        data['changes'] = changes
+        
+        # 데이터베이스 저장 (묶음 트랜잭션): 변경 필드는 항상, 전체 행은 설정에 따라
+        future = self.change_detector.record(data, changes)
+        future.add_done_callback(lambda f: self.on_data_stored(data, f))
+        if self.config['general_settings'].get('store_full_results', True):
+            insert_future = self.db_manager.enqueue_insert(data)
+            if self.keyword_alerts:
+                insert_future.add_done_callback(lambda f: self.on_row_inserted(data, f))
+        return future
     
-    def process_scraped_data(self, data: Dict[str, Any]) -> bool:
-        """스크래핑된 데이터 처리"""
-        if not data:
-            return False
-            
-        # 데이터베이스 저장
-        is_new = self.db_manager.insert_data(data)
+    def process_scraped_items(self, data: Dict[str, Any]) -> Future:
+        """목록 모드 결과 처리: 모든 항목을 하나의 트랜잭션으로 저장"""
+        self.notification_manager.wait_for_capacity()
+        # 최근에 본 항목은 DB까지 보내지 않음
+        items = [
+            item for item in data['items']
+            if not self.db_manager.recent_fingerprints.contains(item['website_name'], item['hash_value'])
+        ]
+        data['new_items'] = []
+        if not items:
+            future: Future = Future()
+            future.set_result(False)
+            return future
+        
+        future = self.db_manager.enqueue_insert_many(items)
+        future.add_done_callback(lambda f: self.on_items_stored(data, items, f))
+        return future
+    
+    def on_items_stored(self, data: Dict[str, Any], items: List[Dict[str, Any]], future: Future):
+        """목록 저장 완료 콜백: 새 항목마다 알림 전송"""
+        try:
+            results = future.result()
+        except Exception as e:
+            logging.error(f"목록 저장 실패 {data['website_name']}: {e}")
+            return
         
+        data['new_items'] = [item for item, is_new in zip(items, results) if is_new]
+        data['is_new'] = bool(data['new_items'])
+        if data['new_items']:
+            logging.info(f"새 항목 발견: {data['website_name']} ({len(data['new_items'])}/{len(data['items'])}건)")
+            for item in data['new_items']:
+                self.send_change_notification(item)
+            self.check_keyword_alerts(data['new_items'])
+    
+    def on_data_stored(self, data: Dict[str, Any], future: Future):
+        """저장 완료 콜백: 실제 변경이 있으면 알림 전송"""
+        try:
+            is_new = future.result()
+        except Exception as e:
+            logging.error(f"데이터 저장 실패 {data['website_name']}: {e}")
+            return
+        
+        data['is_new'] = is_new
         if is_new:
-            logging.info(f"새로운 데이터 발견: {data['website_name']}")
+            changed_fields = ', '.join(change['field'] for change in data['changes'])
+            logging.info(f"데이터 변경 발견: {data['website_name']} ({changed_fields})")
             
             # 알림 전송
             self.send_change_notification(data)
+    
+    def on_row_inserted(self, data: Dict[str, Any], future: Future):
+        """전체 행 저장 완료 콜백: 새 행이면 키워드 알림 확인"""
+        try:
+            if future.result():
+                self.check_keyword_alerts([data])
+        except Exception as e:
+            logging.error(f"키워드 알림 확인 실패 {data['website_name']}: {e}")
+    
+    def check_keyword_alerts(self, rows: List[Dict[str, Any]]):
+        """새로 저장된 행 중 키워드 알림 검색식과 일치하는 행 알림 (전문 검색 색인 사용)
+
+        notifications.keyword_alerts: [{"name": ..., "query": FTS5 검색식, "websites": [...]}]
+        """
+        if not self.keyword_alerts:
+            return
+        rows_by_id = {row['row_id']: row for row in rows if row.get('row_id')}
+        for alert in self.keyword_alerts:
+            name = alert.get('name') or alert['query']
+            websites = alert.get('websites')
+            row_ids = [row_id for row_id, row in rows_by_id.items() if not websites or row['website_name'] in websites]
+            try:
+                matched = self.db_manager.match_rows(alert['query'], row_ids)
+            except ValueError as e:
+                logging.error(f"키워드 알림 오류 {name}: {e}")
+                continue
             
-        return is_new
+            for row_id in matched:
+                row = rows_by_id[row_id]
+                logging.info(f"키워드 알림: {name} - {row['website_name']} {row.get('title') or ''}")
+                METRICS.inc('scraper_keyword_alerts_total', alert=name)
+                self.notification_manager.notify(dict(row, alert=name))
     
     def send_change_notification(self, data: Dict[str, Any]):
-        """변경 알림 전송"""
-        subject = f"🔔 새로운 데이터 발견: {data['website_name']}"
-        
-        html_body = f"""
-        <html>
-        <body>
-            <h2>웹 스크래핑 알림</h2>
-            <p><strong>웹사이트:</strong> {data['website_name']}</p>
-            <p><strong>URL:</strong> <a href="{data['url']}">{data['url']}</a></p>
-            <p><strong>제목:</strong> {data.get('title', 'N/A')}</p>
-            <p><strong>내용:</strong> {data.get('content', 'N/A')[:200]}...</p>
-            <p><strong>가격:</strong> {data.get('price', 'N/A')}</p>
-            <p><strong>수집 시간:</strong> {data['scraped_at']}</p>
-            
-            <hr>
-            <p><small>Advanced Web Scraping Automation Tool</small></p>
-        </body>
-        </html>
-        """
-        
-        # 이메일 전송
-        self.notification_manager.send_email(subject, html_body)
-        
-        # 웹훅 전송
-        webhook_data = {
-            'type': 'new_data',
-            'website': data['website_name'],
-            'title': data.get('title', ''),
-            'url': data['url'],
-            'timestamp': data['scraped_at']
-        }
-        self.notification_manager.send_webhook(webhook_data)
+        """변경 알림 전송 (알림 워커 대기열에 추가)"""
+        self.notification_manager.notify(data)
+    
+    def scrape_and_process(self, website_config: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """웹사이트 하나를 스크래핑하고 저장/알림까지 처리 (워커 스레드용)"""
+        # 요청 간 지연은 HostRateLimiter가 호스트별로 처리
+        data = self.scrape_website(website_config)
+        if data:
+            self.process_scraped_data(data)
+        return data
     
-    def run_single_scrape(self):
-        """단일 스크래핑 실행"""
+    def run_single_scrape(self) -> Dict[str, Any]:
+        """단일 스크래핑 실행 (general_settings.max_workers 만큼 병렬 처리)"""
         logging.info("스크래핑 작업 시작")
+        started = time.time()
         
+        websites = [w for w in self.config['websites'] if w.get('enabled', True)]
         results = []
-        for website_config in self.config['websites']:
-            if website_config.get('enabled', True):
-                data = self.scrape_website(website_config)
-                if data:
-                    self.process_scraped_data(data)
-                    results.append(data)
+        failures = []
+        
+        if websites:
+            max_workers = min(self.get_max_workers(), len(websites))
+            with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='scraper') as executor:
+                futures = {executor.submit(self.scrape_and_process, w): w for w in websites}
+                for future in as_completed(futures):
+                    website_config = futures[future]
+                    try:
+                        data = future.result()
+                    except Exception as e:
+                        logging.error(f"스크래핑 처리 실패 {website_config['name']}: {e}")
+                        failures.append({'website_name': website_config['name'], 'url': website_config['url'], 'error': str(e)})
+                        continue
                     
-                # 요청 간 지연
-                time.sleep(self.config['general_settings']['delay_between_requests'])
+                    if data:
+                        results.append(data)
+                    else:
+                        failures.append({'website_name': website_config['name'], 'url': website_config['url'], 'error': '데이터 없음'})
         
-        logging.info(f"스크래핑 작업 완료: {len(results)}개 웹사이트 처리")
+        # 쓰기 대기열을 비워 신규 여부(is_new) 확정
+        self.db_manager.flush()
+        
+        elapsed = time.time() - started
+        new_count = len([d for d in results if d.get('is_new')])
+        unchanged_count = len([d for d in results if d.get('status') == 'unchanged'])
+        logging.info(f"스크래핑 작업 완료: {len(results)}개 웹사이트 처리, 신규 {new_count}건, 변경 없음 {unchanged_count}건, 실패 {len(failures)}건 ({elapsed:.1f}초)")
         
         # 일일 리포트 생성 확인
         if self.config['export_settings']['excel_export']:
             self.maybe_generate_daily_report()
+        
+        return {
+            'results': results,
+            'failures': failures,
+            'new_count': new_count,
+            'unchanged_count': unchanged_count,
+            'elapsed': elapsed
+        }
     
     def maybe_generate_daily_report(self):
         """일일 리포트 생성 여부 확인"""
@@ -469,41 +3935,19 @@ class AdvancedWebScraper:
         if now.hour == 0 and now.minute < 5:
             self.generate_excel_report()
     
-    def generate_excel_report(self):
-        """Excel 리포트 생성"""
+    def generate_excel_report(self, export_format: Optional[str] = None, website_names: Optional[List[str]] = None):
+        """리포트 생성 (export_settings.format: xlsx/csv/parquet)"""
         try:
-            # 최근 24시간 데이터 조회
-            recent_data = self.db_manager.get_recent_data(24)
+            # 최근 24시간 데이터를 청크 단위로 내보내기
+            exporter = ReportExporter(self.db_manager, self.config['export_settings'])
+            report = exporter.export(since=datetime.now() - timedelta(hours=24), export_format=export_format,
+                                     website_names=website_names)
             
-            if not recent_data:
+            if not report['files']:
                 logging.info("생성할 리포트 데이터가 없습니다.")
                 return
             
-            # DataFrame 생성
-            df = pd.DataFrame(recent_data)
-            
-            # 파일명 생성
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"scraping_report_{timestamp}.xlsx"
-            
-            # Excel 파일 저장
-            with pd.ExcelWriter(filename, engine='openpyxl') as writer:
-                # 전체 데이터
-                df.to_excel(writer, sheet_name='전체_데이터', index=False)
-                
-                # 웹사이트별 통계
-                website_stats = df.groupby('website_name').agg({
-                    'id': 'count',
-                    'scraped_at': ['min', 'max']
-                }).round(2)
-                website_stats.to_excel(writer, sheet_name='웹사이트별_통계')
-                
-                # 시간별 통계
-                df['hour'] = pd.to_datetime(df['scraped_at']).dt.hour
-                hourly_stats = df.groupby('hour')['id'].count()
-                hourly_stats.to_excel(writer, sheet_name='시간별_통계')
-            
-            logging.info(f"Excel 리포트 생성 완료: {filename}")
+            logging.info(f"리포트 생성 완료: {', '.join(report['files'])} ({report['total']}건)")
             
             # 이메일로 리포트 전송
             subject = f"📊 일일 스크래핑 리포트 - {datetime.now().strftime('%Y-%m-%d')}"
@@ -512,21 +3956,21 @@ class AdvancedWebScraper:
             <body>
                 <h2>일일 스크래핑 리포트</h2>
                 <p><strong>보고서 생성 시간:</strong> {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>
-                <p><strong>수집된 데이터:</strong> {len(recent_data)}건</p>
-                <p><strong>모니터링 웹사이트:</strong> {len(df['website_name'].unique())}개</p>
+                <p><strong>수집된 데이터:</strong> {report['total']}건</p>
+                <p><strong>모니터링 웹사이트:</strong> {len(report['site_stats'])}개</p>
                 
                 <h3>웹사이트별 수집 현황</h3>
                 <table border="1" style="border-collapse: collapse;">
                     <tr><th>웹사이트</th><th>수집 건수</th></tr>
             """
             
-            for website, count in df['website_name'].value_counts().items():
-                body += f"<tr><td>{website}</td><td>{count}</td></tr>"
+            for site in report['site_stats']:
+                body += f"<tr><td>{site['website_name']}</td><td>{site['count']}</td></tr>"
             
-            body += """
+            body += f"""
                 </table>
                 <br>
-                <p>상세한 데이터는 첨부된 Excel 파일을 확인해주세요.</p>
+                <p>상세한 데이터는 리포트 파일({len(report['files'])}개)을 확인해주세요.</p>
             </body>
             </html>
             """
@@ -534,45 +3978,201 @@ class AdvancedWebScraper:
             self.notification_manager.send_email(subject, body)
             
         except Exception as e:
-            logging.error(f"Excel 리포트 생성 실패: {e}")
+            logging.error(f"리포트 생성 실패: {e}")
     
     def setup_scheduler(self):
-        """스케줄러 설정"""
-        # 기본적으로 30분마다 실행
-        schedule.every(30).minutes.do(self.run_single_scrape)
+        """스케줄러 설정 (사이트별 작업 하나씩, schedule이 없으면 default_schedule 사용)"""
+        self.scheduler = JobScheduler(max_workers=self.get_max_workers())
+        for job in self.build_scheduled_jobs():
+            due = self.scheduler.add(job)
+            logging.info(f"스케줄 등록: {job.name} (다음 실행 {datetime.fromtimestamp(due):%Y-%m-%d %H:%M:%S})")
+        
+        logging.info("스케줄러 설정 완료")
+    
+    def build_scheduled_jobs(self) -> List[ScheduledJob]:
+        """설정에서 예약 작업 목록 생성 (사이트별 작업 + 리포트 작업)"""
+        jobs = []
+        general = self.config['general_settings']
+        default_schedule = general.get('default_schedule', '*/30')
+        jitter = general.get('schedule_jitter', 60)
+        adaptive_settings = general.get('adaptive', {})
+        self.adaptive = AdaptiveFrequency(self.db_manager, adaptive_settings)
         
-        # 설정에 따른 개별 스케줄
         for website_config in self.config['websites']:
-            if website_config.get('enabled', True) and 'schedule' in website_config:
-                schedule_str = website_config['schedule']
-                
-                # 스케줄 형식에 따른 처리
-                if schedule_str.startswith('*/'):
-                    # */30 (30분마다)
-                    interval = int(schedule_str[2:])
-                    schedule.every(interval).minutes.do(
-                        lambda w=website_config: self.scrape_single_website(w)
-                    )
-                elif schedule_str == 'daily':
-                    schedule.every().day.at("09:00").do(
-                        lambda w=website_config: self.scrape_single_website(w)
-                    )
-                elif schedule_str == 'hourly':
-                    schedule.every().hour.do(
-                        lambda w=website_config: self.scrape_single_website(w)
-                    )
+            if not website_config.get('enabled', True):
+                continue
+            
+            schedule_str = website_config.get('schedule', default_schedule)
+            try:
+                job_schedule = parse_schedule(schedule_str)
+            except ValueError as e:
+                logging.error(f"스케줄 설정 오류 {website_config['name']}: {e}")
+                continue
+            
+            # 적응형 주기: 간격 스케줄만 대상 (크론/시각 지정은 고정)
+            if website_config.get('adaptive', adaptive_settings.get('enabled', False)):
+                if isinstance(job_schedule, IntervalSchedule):
+                    self.adaptive.register(website_config['name'], job_schedule.period)
+                    job_schedule = AdaptiveSchedule(self.adaptive, website_config['name'])
+                else:
+                    logging.warning(f"적응형 주기는 간격 스케줄에만 적용됩니다: {website_config['name']} ({schedule_str})")
+            
+            jobs.append(ScheduledJob(
+                website_config['name'],
+                job_schedule,
+                lambda w=website_config: self.scrape_single_website(w),
+                offset=JobScheduler.jitter_offset(website_config['name'], jitter)
+            ))
         
         # 일일 리포트 생성 (매일 자정)
-        if self.config['export_settings']['excel_export']:
-            schedule.every().day.at("00:00").do(self.generate_excel_report)
+        export_settings = self.config['export_settings']
+        if export_settings['excel_export']:
+            export_schedule = export_settings.get('export_schedule', 'daily')
+            report_schedule = CronSchedule('0 0 * * *') if export_schedule == 'daily' else parse_schedule(export_schedule)
+            jobs.append(ScheduledJob(self.REPORT_JOB_NAME, report_schedule, self.generate_excel_report))
         
-        logging.info("스케줄러 설정 완료")
+        # 보존 기간 정리 + 점진적 VACUUM
+        compaction_schedule = general.get('storage', {}).get('compaction_schedule', '*/60')
+        if compaction_schedule:
+            jobs.append(ScheduledJob(
+                self.COMPACTION_JOB_NAME,
+                parse_schedule(compaction_schedule),
+                self.compact_storage,
+                offset=JobScheduler.jitter_offset(self.COMPACTION_JOB_NAME, jitter)
+            ))
+        
+        return jobs
+    
+    def compact_storage(self, full_vacuum: bool = False, website_names: Optional[List[str]] = None) -> Dict[str, int]:
+        """보존 정책에 따라 오래된 데이터 삭제 후 DB 파일 정리
+
+        웹사이트 설정의 retention이 general_settings.storage.retention보다 우선합니다.
+        full_vacuum: 전체 VACUUM 실행 (기존 DB를 점진적 VACUUM 모드로 변환, 실행 중 쓰기 대기)
+        website_names: 지정하면 해당 웹사이트에만 보존 정책 적용
+        """
+        storage = self.config['general_settings'].get('storage', {})
+        default_retention = storage.get('retention', {})
+        retention = {
+            website_config['name']: {**default_retention, **website_config.get('retention', {})}
+            for website_config in self.config['websites']
+            if not website_names or website_config['name'] in website_names
+        }
+        
+        stats = self.db_manager.compact(
+            retention,
+            None if website_names else default_retention,
+            batch_rows=storage.get('compaction_batch_rows', 500),
+            vacuum_pages=storage.get('vacuum_pages', 256),
+            max_seconds=storage.get('compaction_max_seconds', 30),
+            archive_max_age_days=self.config['general_settings'].get('archive', {}).get('max_age_days', 0)
+        )
+        logging.info(
+            f"데이터 정리 완료: 결과 {stats['deleted_results']}건/변경 기록 {stats['deleted_changes']}건/"
+            f"보관 본문 {stats['deleted_archive']}건 삭제, "
+            f"{stats['compressed']}건 압축, {stats['vacuumed_pages']}페이지 반환"
+        )
+        
+        if full_vacuum:
+            logging.info("전체 VACUUM 시작 (완료될 때까지 쓰기가 대기합니다)")
+            self.db_manager.vacuum()
+            logging.info("전체 VACUUM 완료")
+        return stats
+    
+    def run_worker(self, stop_after: Optional[float] = None):
+        """워커 모드 실행: scrape_jobs 테이블에서 실행할 작업을 임대받아 처리
+
+        같은 DB를 쓰는 워커를 여러 개(다른 프로세스/서버) 띄우면 작업이 중복 없이 나뉩니다.
+        stop_after: 지정한 초가 지나면 종료 (테스트용)
+        """
+        worker_settings = self.config['general_settings'].get('worker', {})
+        lease_seconds = worker_settings.get('lease_seconds', 60)
+        poll_interval = worker_settings.get('poll_interval', 5)
+        max_workers = self.get_max_workers()
+        
+        jobs = {job.name: job for job in self.build_scheduled_jobs()}
+        job_names = list(jobs)
+        leases = JobLeaseManager(self.db_manager, lease_seconds=lease_seconds)
+        now = time.time()
+        leases.register({name: job.next_due(now) for name, job in jobs.items()})
+        logging.info(f"🕷️ 워커 시작: {leases.worker_id} (작업 {len(jobs)}개, 동시 {max_workers}개)")
+        
+        stopped = threading.Event()
+        running: Dict[str, Future] = {}
+        
+        def heartbeat_loop():
+            while not stopped.wait(lease_seconds / 3):
+                try:
+                    leases.heartbeat()
+                except sqlite3.Error as e:
+                    logging.warning(f"임대 연장 실패: {e}")
+        
+        def run_job(name: str):
+            status = 'ok'
+            try:
+                # 이전 회차는 다른 워커가 실행했을 수 있으므로 비교 기준을 DB에서 다시 읽음
+                self.change_detector.reload(name)
+                self.adaptive.reload()
+                jobs[name].func()
+                # 임대 반납 전에 결과를 커밋 (워커가 죽어도 완료로 기록된 작업의 데이터는 보존)
+                self.db_manager.flush()
+            except Exception as e:
+                status = 'failed'
+                logging.error(f"작업 실패 {name}: {e}")
+            finally:
+                leases.complete(name, jobs[name].next_due(time.time()), status)
+        
+        heartbeat_thread = threading.Thread(target=heartbeat_loop, name='lease-heartbeat', daemon=True)
+        heartbeat_thread.start()
+        deadline = None if stop_after is None else time.time() + stop_after
+        executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='worker')
+        try:
+            while deadline is None or time.time() < deadline:
+                for name in [name for name, future in running.items() if future.done()]:
+                    del running[name]
+                
+                for name in leases.claim(job_names, max_workers - len(running)):
+                    logging.info(f"작업 임대: {name}")
+                    running[name] = executor.submit(run_job, name)
+                
+                # 다음 실행 시각까지 대기 (다른 워커의 변경을 반영하도록 poll_interval마다 확인)
+                wait = poll_interval
+                due = leases.next_due(job_names)
+                if due is not None:
+                    wait = min(poll_interval, max(0.1, due - time.time()))
+                if deadline is not None:
+                    wait = min(wait, max(0.0, deadline - time.time()))
+                time.sleep(wait)
+        except KeyboardInterrupt:
+            logging.info("사용자에 의해 종료됨")
+        finally:
+            executor.shutdown(wait=True)
+            stopped.set()
+            heartbeat_thread.join()
+            leases.release_all()
+            logging.info(f"워커 종료: {leases.worker_id}")
     
     def scrape_single_website(self, website_config: Dict[str, Any]):
-        """단일 웹사이트 스크래핑 (스케줄러용)"""
+        """단일 웹사이트 스크래핑 (스케줄러용, 적응형 사이트는 변경 여부를 학습)"""
         data = self.scrape_website(website_config)
-        if data:
-            self.process_scraped_data(data)
+        if not data:
+            return
+        
+        future = self.process_scraped_data(data)
+        if website_config['name'] in self.adaptive.state:
+            self.adaptive.observe(website_config['name'], self.has_changed(data, future))
+    
+    @staticmethod
+    def has_changed(data: Dict[str, Any], future: Future) -> bool:
+        """처리 결과에서 변경 여부 확인 (저장 완료까지 대기)"""
+        if data.get('status') == 'crawled':
+            return data['is_new']
+        try:
+            result = future.result()
+        except Exception:
+            return False
+        if isinstance(result, list):
+            return any(result)
+        return bool(result)
     
     def run_scheduler(self):
         """스케줄러 실행"""
@@ -581,35 +4181,180 @@ class AdvancedWebScraper:
         logging.info("종료하려면 Ctrl+C를 누르세요")
         
         try:
-            while True:
-                schedule.run_pending()
-                time.sleep(60)  # 1분마다 스케줄 확인
+            self.scheduler.run()
         except KeyboardInterrupt:
             logging.info("사용자에 의해 종료됨")
         except Exception as e:
             logging.error(f"스케줄러 오류: {e}")
+        finally:
+            self.scheduler.stop()
+
+def filter_websites(config: Dict[str, Any], site_names: Optional[List[str]]) -> List[str]:
+    """--site로 지정한 웹사이트만 남기기 (설정에 없는 이름 목록 반환)"""
+    if not site_names:
+        return []
+    known = {w.get('name') for w in config.get('websites', [])}
+    config['websites'] = [w for w in config.get('websites', []) if w.get('name') in site_names]
+    return [name for name in site_names if name not in known]
+
+def build_arg_parser() -> argparse.ArgumentParser:
+    """명령행 인자 정의"""
+    parser = argparse.ArgumentParser(
+        description="Advanced Web Scraping Automation Tool (명령 없이 실행하면 대화형 메뉴)"
+    )
+    parser.add_argument('--config', default='scraper_config.json', help="설정 파일 경로 (기본: scraper_config.json)")
+    parser.add_argument('--site', action='append', metavar='NAME', help="지정한 웹사이트만 대상 (여러 번 지정 가능)")
+    commands = parser.add_subparsers(dest='command', metavar='COMMAND')
+    commands.add_parser('run-once', help="한 번만 스크래핑 (실패가 있으면 종료 코드 1)")
+    commands.add_parser('scheduler', help="자동화 모드 (예약 실행)")
+    commands.add_parser('worker', help="워커 모드 (여러 프로세스/서버가 같은 DB로 작업 분담)")
+    report = commands.add_parser('report', help="리포트 생성 (최근 24시간)")
+    report.add_argument('--format', choices=sorted(ReportExporter.SINKS), help="내보내기 형식 (기본: export_settings.format)")
+    search = commands.add_parser('search', help="수집 데이터 전문 검색 (제목/본문)")
+    search.add_argument('query', help="검색식 (예: '갤럭시 할인', '갤럭시 OR 아이폰', '\"정확한 문구\"', '삼성*')")
+    search.add_argument('--limit', type=int, default=20, help="페이지당 결과 수 (기본: 20)")
+    search.add_argument('--page', type=int, default=1, help="페이지 번호 (기본: 1)")
+    search.add_argument('--since-hours', type=float, help="최근 N시간 이내 수집 데이터만")
+    search.add_argument('--json', action='store_true', help="JSON으로 출력")
+    reextract = commands.add_parser('reextract', help="보관된 원본 응답을 현재 선택자로 다시 추출 (네트워크 사용 없음)")
+    reextract.add_argument('--since-hours', type=float, help="최근 N시간 이내 보관 응답만")
+    reextract.add_argument('--workers', type=int, help="파싱 프로세스 수 (기본: CPU 수)")
+    reextract.add_argument('--dry-run', action='store_true', help="저장하지 않고 건수만 확인")
+    compact = commands.add_parser('compact', help="보존 기간이 지난 데이터 삭제와 DB 파일 정리")
+    compact.add_argument('--full-vacuum', action='store_true', help="전체 VACUUM (기존 DB를 점진적 VACUUM 모드로 변환)")
+    commands.add_parser('bench', add_help=False, help="오프라인 벤치마크 실행 (나머지 인자는 benchmark.py로 전달)")
+    commands.add_parser('check-config', help="설정 파일 검증 (오류가 있으면 종료 코드 1)")
+    return parser
+
+def check_config(config_path: str, site_names: Optional[List[str]] = None) -> int:
+    """설정 파일 검증 결과 출력 (스크래퍼를 생성하지 않음)"""
+    try:
+        with open(config_path, 'r', encoding='utf-8') as f:
+            config = json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"❌ 설정 파일을 읽을 수 없습니다: {config_path} ({e})")
+        return 1
+    
+    errors = [f"알 수 없는 웹사이트: {name}" for name in filter_websites(config, site_names)]
+    errors.extend(validate_config(config))
+    if errors:
+        print(f"❌ 설정 오류 {len(errors)}개: {config_path}")
+        for error in errors:
+            print(f"  - {error}")
+        return 1
+    
+    print(f"✅ 설정 확인 완료: {config_path}")
+    print(f"- 모니터링 웹사이트: {len(config['websites'])}개")
+    print(f"- 활성화된 웹사이트: {len([w for w in config['websites'] if w.get('enabled', True)])}개")
+    print(f"- 이메일 알림: {'ON' if config['notifications']['email']['enabled'] else 'OFF'}")
+    print(f"- 웹훅 알림: {'ON' if config['notifications']['webhook']['enabled'] else 'OFF'}")
+    print(f"- Excel 내보내기: {'ON' if config['export_settings']['excel_export'] else 'OFF'}")
+    return 0
+
+def run_search(args: argparse.Namespace) -> int:
+    """검색 명령 실행 (스크래퍼 없이 DB만 열어서 조회)"""
+    since = datetime.now() - timedelta(hours=args.since_hours) if args.since_hours else None
+    offset = (max(1, args.page) - 1) * args.limit
+    db_manager = DatabaseManager()
+    try:
+        found = db_manager.search(args.query, website_names=args.site, since=since, limit=args.limit, offset=offset)
+    except (ValueError, RuntimeError) as e:
+        print(f"❌ {e}")
+        return 1
+    finally:
+        db_manager.close()
+    
+    if args.json:
+        print(json.dumps(found, ensure_ascii=False, indent=2))
+        return 0
+    
+    print(f"🔎 '{args.query}' 검색 결과 {found['total']}건 (페이지 {max(1, args.page)})")
+    for number, row in enumerate(found['results'], start=offset + 1):
+        print(f"{number}. [{row['website_name']}] {row['title'] or '(제목 없음)'} ({row['scraped_at']})")
+        print(f"   {row['url']}")
+        if row['snippet']:
+            print(f"   {row['snippet']}")
+    return 0
+
+def run_command(args: argparse.Namespace) -> int:
+    """명령 실행 (종료 코드 반환)"""
+    if args.command == 'check-config':
+        return check_config(args.config, args.site)
+    if args.command == 'search':
+        return run_search(args)
+    if args.command == 'bench':
+        import benchmark
+        return benchmark.main(args.extra_args)
+    
+    scraper = None
+    try:
+        scraper = AdvancedWebScraper(args.config)
+        unknown = filter_websites(scraper.config, args.site)
+        if unknown:
+            print(f"❌ 알 수 없는 웹사이트: {', '.join(unknown)}")
+            return 2
+        
+        if args.command == 'run-once':
+            summary = scraper.run_single_scrape()
+            print(f"✅ 스크래핑 완료! (성공 {len(summary['results'])}개, 신규 {summary['new_count']}건, 실패 {len(summary['failures'])}개)")
+            return 1 if summary['failures'] else 0
+        if args.command == 'scheduler':
+            scraper.run_scheduler()
+        elif args.command == 'worker':
+            scraper.run_worker()
+        elif args.command == 'report':
+            scraper.generate_excel_report(args.format, website_names=args.site)
+        elif args.command == 'reextract':
+            since = datetime.now() - timedelta(hours=args.since_hours) if args.since_hours else None
+            stats = scraper.reextract_archive(args.site, since=since, workers=args.workers, dry_run=args.dry_run)
+            print(f"✅ 재추출 완료! ({stats['pages']}페이지, 레코드 {stats['records']}건, 신규 {stats['new']}건, 실패 {stats['failed']}페이지)")
+            return 1 if stats['failed'] else 0
+        elif args.command == 'compact':
+            scraper.compact_storage(full_vacuum=args.full_vacuum, website_names=args.site)
+        return 0
+    
+    except Exception as e:
+        logging.error(f"실행 중 오류 발생: {e}")
+        print(f"❌ 오류 발생: {e}")
+        return 1
+    finally:
+        if scraper:
+            scraper.close()
 
-def main():
-    """메인 함수"""
+def main(argv: Optional[List[str]] = None) -> int:
+    """메인 함수 (명령이 주어지면 비대화형으로 실행)"""
+    parser = build_arg_parser()
+    args, args.extra_args = parser.parse_known_args(argv)
+    if args.extra_args and args.command != 'bench':
+        parser.error(f"알 수 없는 인자: {' '.join(args.extra_args)}")
+    if args.command:
+        return run_command(args)
+    
     print("🕷️ Advanced Web Scraping Automation Tool v1.0.0")
     print("=" * 50)
     print()
     
+    scraper = None
     try:
-        scraper = AdvancedWebScraper()
+        scraper = AdvancedWebScraper(args.config)
+        unknown = filter_websites(scraper.config, args.site)
+        if unknown:
+            print(f"❌ 알 수 없는 웹사이트: {', '.join(unknown)}")
+            return 2
         
         print("실행 모드를 선택하세요:")
         print("1. 단일 실행 (한 번만 스크래핑)")
         print("2. 자동화 모드 (24시간 자동 실행)")
         print("3. 설정 확인")
         print("4. Excel 리포트 생성")
+        print("5. 워커 모드 (여러 프로세스/서버가 같은 DB로 작업 분담)")
         
-        choice = input("\n선택 (1-4): ").strip()
+        choice = input("\n선택 (1-5): ").strip()
         
         if choice == "1":
             print("\n단일 스크래핑을 시작합니다...")
-            scraper.run_single_scrape()
-            print("✅ 스크래핑 완료!")
+            summary = scraper.run_single_scrape()
+            print(f"✅ 스크래핑 완료! (성공 {len(summary['results'])}개, 신규 {summary['new_count']}건, 실패 {len(summary['failures'])}개)")
             
         elif choice == "2":
             print("\n24시간 자동화 모드를 시작합니다...")
@@ -622,18 +4367,30 @@ def main():
             print(f"- 이메일 알림: {'ON' if scraper.config['notifications']['email']['enabled'] else 'OFF'}")
             print(f"- 웹훅 알림: {'ON' if scraper.config['notifications']['webhook']['enabled'] else 'OFF'}")
             print(f"- Excel 내보내기: {'ON' if scraper.config['export_settings']['excel_export'] else 'OFF'}")
+            for error in validate_config(scraper.config):
+                print(f"⚠️ {error}")
             
         elif choice == "4":
             print("\nExcel 리포트를 생성합니다...")
             scraper.generate_excel_report()
             print("✅ 리포트 생성 완료!")
             
+        elif choice == "5":
+            print("\n워커 모드를 시작합니다...")
+            scraper.run_worker()
+            
         else:
             print("❌ 잘못된 선택입니다.")
+            return 2
+        return 0
     
     except Exception as e:
         logging.error(f"실행 중 오류 발생: {e}")
         print(f"❌ 오류 발생: {e}")
+        return 1
+    finally:
+        if scraper:
+            scraper.close()
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    sys.exit(main())
\ No newline at end of file
@@ -0,0 +1,387 @@
+#!/usr/bin/env python3
+"""
+Advanced Web Scraping Automation Tool - 벤치마크
+로컬 HTTP 서버의 합성 사이트로 run_single_scrape와 스케줄러 처리량을 측정합니다.
+
+사용 예:
+    python benchmark.py --sites 50 --rounds 3
+    python benchmark.py --sites 50 --baseline bench_baseline.json
+"""
+
+import argparse
+import hashlib
+import http.server
+import json
+import logging
+import os
+import platform
+import sqlite3
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime
+from typing import Dict, List, Optional, Any
+from urllib.parse import urlparse, parse_qs
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import advanced_scraping_automation as scraper_module
+from advanced_scraping_automation import METRICS, AdvancedWebScraper
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+class SyntheticSiteHandler(http.server.BaseHTTPRequestHandler):
+    """합성 페이지 응답 (/site/<번호>?size=&latency=&validator=&items=&volatile=)"""
+
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        parsed = urlparse(self.path)
+        params = {key: values[0] for key, values in parse_qs(parsed.query).items()}
+        size = int(params.get('size', 2000))
+        latency = float(params.get('latency', 0))
+        validator = params.get('validator', 'none')
+        items = int(params.get('items', 0))
+        # volatile 사이트는 2초마다 내용이 바뀜
+        version = int(time.time() / 2) if params.get('volatile') == '1' else 0
+
+        body = self.render_page(parsed.path, size, items, version)
+        etag = '"' + hashlib.md5(body).hexdigest() + '"'
+        last_modified = 'Mon, 01 Jan 2024 00:00:00 GMT'
+
+        if latency:
+            time.sleep(latency)
+
+        if validator == 'etag' and self.headers.get('If-None-Match') == etag:
+            self.send_response(304)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+        if validator == 'last-modified' and version == 0 and self.headers.get('If-Modified-Since') == last_modified:
+            self.send_response(304)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        if validator == 'etag':
+            self.send_header('ETag', etag)
+        elif validator == 'last-modified' and version == 0:
+            self.send_header('Last-Modified', last_modified)
+        self.end_headers()
+        self.wfile.write(body)
+
+    @staticmethod
+    def render_page(path: str, size: int, items: int, version: int) -> bytes:
+        """지정한 크기/항목 수의 HTML 생성"""
+        parts = ['<html><head><title>bench</title></head><body>']
+        if items:
+            for i in range(items):
+                parts.append(
+                    f'<div class="item"><h2 class="name">{path} 상품 {i}</h2>'
+                    f'<span class="price">{(i + 1) * 100 + version}</span></div>'
+                )
+        else:
+            parts.append(f'<h1 class="title">{path} 제목 v{version}</h1>')
+            parts.append(f'<div class="content">{path} 본문</div><span class="price">{1000 + version}</span>')
+        html = ''.join(parts)
+        padding = max(0, size - len(html.encode('utf-8')) - len('</body></html>'))
+        filler = '<p class="filler">' + 'x' * 80 + '</p>'
+        html += filler * (padding // len(filler)) + '</body></html>'
+        return html.encode('utf-8')
+
+    def log_message(self, format: str, *args):
+        pass
+
+
+def start_fixture_server() -> http.server.ThreadingHTTPServer:
+    """로컬 합성 사이트 서버 시작 (임의 포트)"""
+    server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), SyntheticSiteHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name='bench-fixture', daemon=True).start()
+    return server
+
+
+def build_sites(port: int, count: int) -> List[Dict[str, Any]]:
+    """크기/지연/검증자/목록 밀도가 다른 사이트 설정 생성 (번호 기준으로 결정적)"""
+    sizes = (2_000, 20_000, 100_000, 300_000)
+    latencies = (0.0, 0.02, 0.05, 0.2)
+    validators = ('etag', 'last-modified', 'none')
+    densities = (0, 0, 20, 100)
+
+    sites = []
+    for i in range(count):
+        items = densities[i % len(densities)]
+        params = {
+            'size': sizes[(i // 2) % len(sizes)],
+            'latency': latencies[(i // 3) % len(latencies)],
+            'validator': validators[i % len(validators)],
+            'items': items,
+            'volatile': 1 if i % 5 == 0 else 0,
+        }
+        query = '&'.join(f'{key}={value}' for key, value in params.items())
+        site = {
+            'name': f'bench_{i:04d}',
+            'url': f'http://127.0.0.1:{port}/site/{i}?{query}',
+            'type': 'benchmark',
+            'enabled': True,
+            'use_selenium': False,
+        }
+        if items:
+            site.update({
+                'mode': 'list',
+                'item_selector': 'div.item',
+                'selectors': {'title': '.name', 'price': '.price'},
+            })
+        else:
+            site['selectors'] = {'title': '.title', 'content': '.content', 'price': '.price'}
+        sites.append(site)
+    return sites
+
+
+def build_config(sites: List[Dict[str, Any]], workers: int, parse_workers: int = 0) -> Dict[str, Any]:
+    """벤치마크용 설정 (모든 사이트가 같은 호스트이므로 요청 간격 없음, 알림 끔)"""
+    config = AdvancedWebScraper.create_default_config()
+    config['websites'] = sites
+    config['general_settings'].update({
+        'delay_between_requests': 0,
+        'max_workers': workers,
+        'parse_workers': parse_workers,
+        'max_retries': 1,
+        'schedule_jitter': 0,
+    })
+    config['export_settings']['excel_export'] = False
+    return config
+
+
+def peak_rss_mb() -> Optional[float]:
+    """프로세스 최대 RSS (MB, 측정 불가 시 None)"""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux는 KB, macOS는 바이트 단위
+    return round(peak / (1024 * 1024 if sys.platform == 'darwin' else 1024), 1)
+
+
+def count_rows(db_path: str) -> int:
+    """결과/변경 로그 총 행 수"""
+    conn = sqlite3.connect(db_path)
+    try:
+        return sum(conn.execute(f'SELECT COUNT(*) FROM {table}').fetchone()[0] for table in ('scraping_results', 'change_log'))
+    finally:
+        conn.close()
+
+
+def histogram_quantile(quantile: float, bounds: List[str], counts: List[float]) -> Optional[float]:
+    """버킷 개수로 분위수 추정 (버킷 내부는 선형 보간)"""
+    total = sum(counts)
+    if not total:
+        return None
+    rank = quantile * total
+    cumulative = 0.0
+    lower = 0.0
+    for bound, count in zip(bounds, counts):
+        upper = float('inf') if bound == '+Inf' else float(bound)
+        if cumulative + count >= rank and count:
+            if upper == float('inf'):
+                return lower
+            return lower + (upper - lower) * (rank - cumulative) / count
+        cumulative += count
+        lower = upper
+    return lower
+
+
+def stage_latencies(before: Dict[str, Any], after: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+    """두 스냅샷 사이 단계별 p50/p99 (사이트 합산, 밀리초)"""
+    def collect(snapshot):
+        stages: Dict[str, Dict[str, float]] = {}
+        for histogram in snapshot['histograms']:
+            if histogram['name'] == 'scraper_stage_seconds':
+                stage = histogram['labels']['stage']
+            elif histogram['name'] == 'scraper_db_batch_seconds':
+                stage = 'db_write'
+            else:
+                continue
+            buckets = stages.setdefault(stage, {})
+            for bound, count in histogram['buckets'].items():
+                buckets[bound] = buckets.get(bound, 0.0) + count
+        return stages
+
+    start, end = collect(before), collect(after)
+    latencies = {}
+    for stage, buckets in end.items():
+        bounds = list(buckets)
+        counts = [buckets[bound] - start.get(stage, {}).get(bound, 0.0) for bound in bounds]
+        p50 = histogram_quantile(0.5, bounds, counts)
+        p99 = histogram_quantile(0.99, bounds, counts)
+        latencies[stage] = {
+            'count': int(sum(counts)),
+            'p50_ms': None if p50 is None else round(p50 * 1000, 2),
+            'p99_ms': None if p99 is None else round(p99 * 1000, 2),
+        }
+    return latencies
+
+
+def counter_total(snapshot: Dict[str, Any], name: str, **labels) -> float:
+    """라벨 조건에 맞는 카운터 합계"""
+    return sum(
+        counter['value'] for counter in snapshot['counters']
+        if counter['name'] == name and all(counter['labels'].get(k) == str(v) for k, v in labels.items())
+    )
+
+
+def measure(label: str, scraper: AdvancedWebScraper, run) -> Dict[str, Any]:
+    """run() 실행 전후 지표 차이로 한 구간의 결과 계산"""
+    before = METRICS.snapshot()
+    rows_before = count_rows(scraper.db_manager.db_path)
+    started = time.perf_counter()
+    run()
+    scraper.db_manager.flush()
+    elapsed = time.perf_counter() - started
+    after = METRICS.snapshot()
+    rows_written = count_rows(scraper.db_manager.db_path) - rows_before
+
+    def delta(name, **labels):
+        return counter_total(after, name, **labels) - counter_total(before, name, **labels)
+
+    pages = delta('scraper_http_responses_total', status=200) + delta('scraper_http_responses_total', status=304)
+    result = {
+        'phase': label,
+        'elapsed_sec': round(elapsed, 3),
+        'pages': int(pages),
+        'pages_per_sec': round(pages / elapsed, 2) if elapsed else None,
+        'responses_200': int(delta('scraper_http_responses_total', status=200)),
+        'responses_304': int(delta('scraper_http_responses_total', status=304)),
+        'errors': int(delta('scraper_http_responses_total', status='error')),
+        'bytes_downloaded': int(delta('scraper_bytes_downloaded_total')),
+        'rows_written': rows_written,
+        'sqlite_rows_per_sec': round(rows_written / elapsed, 2) if elapsed else None,
+        'stages': stage_latencies(before, after),
+        'peak_rss_mb': peak_rss_mb(),
+    }
+    print(f"[{label}] {result['pages']}페이지 / {result['elapsed_sec']}초 = {result['pages_per_sec']} pages/s, "
+          f"304 {result['responses_304']}건, DB {result['rows_written']}행")
+    return result
+
+
+def run_scheduler_phase(scraper: AdvancedWebScraper, seconds: float, interval: float):
+    """압축된 간격(interval초)의 사이트 스케줄로 실제 run_scheduler를 seconds초 동안 구동"""
+    general = scraper.config['general_settings']
+    for website_config in scraper.config['websites']:
+        website_config['schedule'] = f'*/{interval / 60}'
+    general['schedule_jitter'] = interval
+    # 측정 구간에 보존 정리 작업이 끼어들지 않도록 제외
+    general.setdefault('storage', {})['compaction_schedule'] = ''
+    scraper.scheduler = None
+
+    def stop_scheduler():
+        # run_scheduler가 스케줄러를 만들기 전이면 잠시 대기
+        while scraper.scheduler is None:
+            time.sleep(0.01)
+        scraper.scheduler.stop()
+
+    timer = threading.Timer(seconds, stop_scheduler)
+    timer.daemon = True
+    timer.start()
+    scraper.run_scheduler()
+    timer.join()
+
+
+def compare_with_baseline(results: Dict[str, Any], baseline_path: str, tolerance: float) -> List[str]:
+    """기준 결과와 비교해 tolerance 비율 이상 나빠진 항목 목록 반환"""
+    with open(baseline_path, 'r', encoding='utf-8') as f:
+        baseline = json.load(f)
+
+    regressions = []
+    baseline_phases = {phase['phase']: phase for phase in baseline.get('phases', [])}
+    for phase in results['phases']:
+        old = baseline_phases.get(phase['phase'])
+        if not old:
+            continue
+        if old.get('pages_per_sec') and phase['pages_per_sec'] is not None:
+            if phase['pages_per_sec'] < old['pages_per_sec'] * (1 - tolerance):
+                regressions.append(f"{phase['phase']} pages/s {old['pages_per_sec']} → {phase['pages_per_sec']}")
+        for stage, latency in phase['stages'].items():
+            old_p99 = old.get('stages', {}).get(stage, {}).get('p99_ms')
+            if old_p99 and latency['p99_ms'] is not None and latency['p99_ms'] > old_p99 * (1 + tolerance):
+                regressions.append(f"{phase['phase']} {stage} p99 {old_p99}ms → {latency['p99_ms']}ms")
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """벤치마크 실행"""
+    parser = argparse.ArgumentParser(description='웹 스크래핑 자동화 도구 벤치마크')
+    parser.add_argument('--sites', type=int, default=40, help='합성 사이트 수')
+    parser.add_argument('--rounds', type=int, default=2, help='run_single_scrape 반복 횟수 (2회차부터 304 응답 포함)')
+    parser.add_argument('--workers', type=int, default=8, help='general_settings.max_workers')
+    parser.add_argument('--parse-workers', type=int, default=0, help='general_settings.parse_workers (0이면 스레드에서 파싱)')
+    parser.add_argument('--scheduler-seconds', type=float, default=10, help='스케줄러 구간 길이 (0이면 생략)')
+    parser.add_argument('--scheduler-interval', type=float, default=2, help='스케줄러 구간의 사이트별 실행 간격(초)')
+    parser.add_argument('--output', default='bench_results.json', help='결과 JSON 파일')
+    parser.add_argument('--baseline', help='비교할 이전 결과 JSON 파일')
+    parser.add_argument('--tolerance', type=float, default=0.2, help='회귀로 판단할 악화 비율')
+    args = parser.parse_args(argv)
+
+    output_path = os.path.abspath(args.output)
+    baseline_path = os.path.abspath(args.baseline) if args.baseline else None
+
+    # 벤치마크 출력만 보이도록 경고 이상만 기록 (스크래퍼의 로그 파일 설정보다 먼저)
+    logging.basicConfig(level=logging.WARNING)
+
+    server = start_fixture_server()
+    sites = build_sites(server.server_address[1], args.sites)
+    results: Dict[str, Any] = {
+        'timestamp': datetime.now().isoformat(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'parser': scraper_module.DEFAULT_PARSER,
+        'params': {key: value for key, value in vars(args).items() if key not in ('output', 'baseline')},
+        'phases': [],
+    }
+
+    original_cwd = os.getcwd()
+    with tempfile.TemporaryDirectory(prefix='scraper-bench-') as workdir:
+        # DB/캐시/로그 파일은 임시 디렉터리에 생성
+        os.chdir(workdir)
+        scraper = None
+        try:
+            with open('bench_config.json', 'w', encoding='utf-8') as f:
+                json.dump(build_config(sites, args.workers, args.parse_workers), f, ensure_ascii=False)
+            scraper = AdvancedWebScraper('bench_config.json')
+
+            for round_number in range(1, args.rounds + 1):
+                results['phases'].append(measure(f'run_single_scrape_{round_number}', scraper, scraper.run_single_scrape))
+            if args.scheduler_seconds > 0:
+                results['phases'].append(measure(
+                    'scheduler', scraper,
+                    lambda: run_scheduler_phase(scraper, args.scheduler_seconds, args.scheduler_interval)
+                ))
+        finally:
+            if scraper:
+                scraper.close()
+            os.chdir(original_cwd)
+            server.shutdown()
+
+    exit_code = 0
+    if baseline_path:
+        regressions = compare_with_baseline(results, baseline_path, args.tolerance)
+        results['regressions'] = regressions
+        for regression in regressions:
+            print(f"⚠️ 성능 저하: {regression}")
+        exit_code = 1 if regressions else 0
+
+    with open(output_path, 'w', encoding='utf-8') as f:
+        json.dump(results, f, ensure_ascii=False, indent=2)
+    print(f"결과 저장: {output_path}")
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())